@@ -3,9 +3,9 @@
 ResilienceOS Backup (offline-first)
 ==================================
 Creates a restorable backup on an external drive:
-1) Live mirror (rsync) of the working tree (excluding common caches)
-2) Timestamped mirror + snapshot tarball
-3) Optional git bundle (full repo history) if .git exists
+1) Live mirror (rsync) of the working tree (excluding common caches; incremental between full sweeps)
+2) Timestamped mirror (hardlinked from the live mirror) + snapshot tarball
+3) Optional git bundle if .git exists (full history once, then incremental bundles)
 
 Default destination: /Volumes/KiwixVault/ResilienceOS_BACKUPS
 """
@@ -13,15 +13,37 @@ Default destination: /Volumes/KiwixVault/ResilienceOS_BACKUPS
 from __future__ import annotations
 
 import argparse
+import fnmatch
 import hashlib
 import json
+import mmap
 import os
+import re
 import shutil
+import stat
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX
+    fcntl = None
+
+try:
+    import blake3  # optional: multi-threaded, SIMD integrity hash (pip install blake3)
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson  # optional: C encoder for the manifest (chunk tables make it large)
+except ImportError:
+    orjson = None
 
 
 def repo_root() -> Path:
@@ -32,25 +54,203 @@ def now_stamp() -> str:
     return datetime.now().strftime("%Y-%m-%d_%H%M%S")
 
 
-def run(cmd: List[str], cwd: Optional[Path] = None, timeout: Optional[int] = None) -> Dict[str, object]:
+# Per-stream cap on captured subprocess output; the tail is kept (rsync/git put summaries last).
+OUTPUT_CAP_BYTES = 64 * 1024
+
+
+class _TailReader(threading.Thread):
+    """
+    Drain a pipe to EOF with raw os.read calls, keeping only the last `cap` bytes.
+    Decoding happens once, at the end, on the bounded remainder.
+    """
+
+    def __init__(self, stream: Any, cap: int = OUTPUT_CAP_BYTES) -> None:
+        super().__init__(daemon=True)
+        self.stream = stream
+        self.cap = cap
+        self.buf = bytearray()
+        self.dropped = 0
+        self.start()
+
+    def run(self) -> None:
+        fd = self.stream.fileno()
+        while True:
+            try:
+                data = os.read(fd, 65536)
+            except OSError:
+                break
+            if not data:
+                break
+            self.buf += data
+            excess = len(self.buf) - self.cap
+            if excess > 0:
+                del self.buf[:excess]
+                self.dropped += excess
+
+    def text(self) -> str:
+        return self.buf.decode("utf-8", "replace").strip()
+
+
+def _send_input(stream: Any, data: bytes) -> None:
     try:
-        proc = subprocess.run(
+        stream.write(data)
+    except OSError:
+        pass
+    finally:
+        try:
+            stream.close()
+        except OSError:
+            pass
+
+
+def run(
+    cmd: List[str],
+    cwd: Optional[Path] = None,
+    timeout: Optional[int] = None,
+    input_text: Optional[str] = None,
+    quiet: bool = False,
+) -> Dict[str, object]:
+    """
+    Run `cmd` and capture (the tail of) its output. `quiet` discards stdout entirely, for
+    commands whose progress output is never consulted.
+    """
+    try:
+        proc = subprocess.Popen(
             cmd,
             cwd=str(cwd) if cwd else None,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
+            stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL if quiet else subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+    except Exception as exc:
+        return {"ok": False, "code": -1, "cmd": cmd, "error": str(exc)}
+    out = _TailReader(proc.stdout) if proc.stdout else None
+    err = _TailReader(proc.stderr)
+    if input_text is not None:
+        threading.Thread(target=_send_input, args=(proc.stdin, input_text.encode("utf-8")), daemon=True).start()
+    try:
+        code = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired as exc:
+        proc.kill()
+        proc.wait()
+        return {"ok": False, "code": -1, "cmd": cmd, "error": str(exc)}
+    for reader in (out, err):
+        if reader:
+            reader.join()
+    res: Dict[str, object] = {
+        "ok": code == 0,
+        "code": int(code),
+        "cmd": cmd,
+        "stdout": out.text() if out else "",
+        "stderr": err.text(),
+    }
+    for key, reader in (("stdout", out), ("stderr", err)):
+        if reader and reader.dropped:
+            res[f"{key}_truncated_bytes"] = reader.dropped
+    return res
+
+
+def bypass_page_cache(fd: int) -> None:
+    """
+    macOS: ask for uncached IO on `fd` (F_NOCACHE). Artifacts are read or written once;
+    keeping them cached only evicts the interactive working set. No-op elsewhere.
+    """
+    if fcntl is not None and hasattr(fcntl, "F_NOCACHE"):
+        try:
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+        except OSError:
+            pass
+
+
+def drop_page_cache(fd: int, offset: int = 0, length: int = 0) -> None:
+    """
+    Linux: drop the (clean) cached pages of `fd` (or just a range) once we are done with it.
+    No-op elsewhere.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def run_to_file(
+    cmd: List[str],
+    out_file: Path,
+    cwd: Optional[Path] = None,
+    timeout: Optional[int] = None,
+    chunk_bytes: int = 1024 * 1024,
+    algo: str = "sha256",
+    warn_codes: Tuple[int, ...] = (),
+) -> Dict[str, object]:
+    """
+    Run `cmd` with stdout streamed into `out_file`, hashing the bytes on the way through.
+    Saves re-reading a freshly written artifact from the (slow) backup drive just to checksum it.
+    On success the result carries an "artifact" record like artifact_record() produces.
+    Exit codes in `warn_codes` keep the file and count as success with a "warning";
+    any other failure (or a broken stream) removes the partial file.
+    """
+    digest = ChunkedDigest(algo)
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(cwd) if cwd else None,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
-        return {
-            "ok": proc.returncode == 0,
-            "code": int(proc.returncode),
-            "cmd": cmd,
-            "stdout": (proc.stdout or "").strip(),
-            "stderr": (proc.stderr or "").strip(),
-        }
     except Exception as exc:
         return {"ok": False, "code": -1, "cmd": cmd, "error": str(exc)}
+    # Drain stderr separately so a chatty child cannot block on a full pipe.
+    err = _TailReader(proc.stderr)
+    error = ""
+    killer = threading.Timer(timeout, proc.kill) if timeout else None
+    if killer:
+        killer.start()
+    try:
+        with out_file.open("wb") as f:
+            bypass_page_cache(f.fileno())
+            while True:
+                chunk = proc.stdout.read(chunk_bytes)
+                if not chunk:
+                    break
+                f.write(chunk)
+                digest.update(chunk)
+            # Dirty pages cannot be dropped: flush them to the drive first (also makes the backup durable).
+            f.flush()
+            os.fsync(f.fileno())
+            drop_page_cache(f.fileno())
+        code = proc.wait()
+    except Exception as exc:
+        proc.kill()
+        proc.wait()
+        code, error = -1, str(exc)
+    finally:
+        if killer:
+            killer.cancel()
+    err.join(timeout=5)
+    ok = code == 0 or (code in warn_codes and not error)
+    res: Dict[str, object] = {
+        "ok": ok,
+        "code": int(code),
+        "cmd": cmd,
+        "stdout": "",
+        "stderr": err.text(),
+    }
+    if error:
+        res["error"] = error
+    if ok and code != 0:
+        lines = err.text().strip().splitlines()
+        res["warning"] = f"exit {code}" + (f": {lines[-1]}" if lines else "")
+    if ok:
+        res["artifact"] = digest.record(out_file)
+    else:
+        try:
+            out_file.unlink()
+        except OSError:
+            pass
+    return res
 
 
 EXCLUDES = [
@@ -92,70 +292,883 @@ def ensure_dest(dest: Path) -> None:
     dest.mkdir(parents=True, exist_ok=True)
 
 
-def rsync_mirror(src: Path, dest: Path, delete: bool) -> Dict[str, object]:
+def rsync_mirror(src: Path, dest: Path, delete: bool, files_from: Optional[List[str]] = None) -> Dict[str, object]:
+    """
+    Full-tree rsync, or (with `files_from`) only the listed paths relative to `src`.
+    """
     if shutil.which("rsync") is None:
         return {"ok": False, "error": "rsync_not_found"}
-    cmd = ["rsync", "-a", "--human-readable"]
+    cmd = ["rsync", "-a", "--human-readable", "--stats"]
     if delete:
         cmd.append("--delete")
     for pat in EXCLUDES:
         cmd.extend(["--exclude", pat])
+    if files_from is not None:
+        cmd.append("--files-from=-")
     cmd.extend([str(src) + "/", str(dest) + "/"])
-    return run(cmd, timeout=60 * 60)
+    stdin = "\n".join(files_from) + "\n" if files_from is not None else None
+    res = run(cmd, timeout=60 * 60, input_text=stdin)
+    if res.get("ok"):
+        stats = parse_rsync_stats(str(res.get("stdout") or ""))
+        res.update(stats)
+        # rsync 2.6.9 (macOS) and openrsync print no deleted-files line: with --delete,
+        # a missing count must read as "maybe changed", never as zero.
+        no_deletes = not delete or stats.get("deleted") == 0
+        res["unchanged"] = stats.get("transferred") == 0 and no_deletes
+    return res
+
+
+_RSYNC_STAT_RE = re.compile(r"^Number of (regular files transferred|files transferred|deleted files): ([\d,.]+)", re.M)
+
+
+def parse_rsync_stats(text: str) -> Dict[str, int]:
+    """
+    Pull the change counters out of `rsync --stats` (wording differs between rsync 2.x/3.x).
+    """
+    stats: Dict[str, int] = {}
+    for label, value in _RSYNC_STAT_RE.findall(text):
+        n = int(re.sub(r"[,.]", "", value))
+        if label == "deleted files":
+            stats["deleted"] = n
+        elif label == "regular files transferred" or "transferred" not in stats:
+            stats["transferred"] = n
+    return stats
+
+
+# Incremental live mirror state (kept next to _CURRENT_MIRROR, never inside it: rsync --delete would remove it).
+# A file watcher may append changed absolute paths to DIRTY_LOG, e.g.:
+#   fswatch -r <repo> >> <dest>/.dirty.log        (macOS)
+#   inotifywait -mrq -e close_write,moved_to,moved_from,delete --format '%w%f' <repo> >> <dest>/.dirty.log   (Linux)
+# An existing (even empty) log is trusted; without one, a local mtime/ctime catch-up scan finds the changes.
+DIRTY_LOG = ".dirty.log"
+SYNC_STATE = ".live_mirror_state.json"
+# Incremental runs prune deletions from the directories that changed (see prune_deleted);
+# a full `rsync --delete` sweep still runs at least this often as a backstop.
+FULL_SWEEP_EVERY_S = 24 * 60 * 60
+
+
+def _compile_excludes(patterns: List[str], dirs: bool) -> re.Pattern[str]:
+    """
+    One alternation for all patterns, so matching a path is a single regex call.
+    Patterns without "/" match the last component, patterns with "/" match the end of the path,
+    and a trailing "/" restricts the pattern to directories (rsync semantics).
+    """
+    parts = [
+        f"(?:.*/)?{fnmatch.translate(p.rstrip('/'))}"
+        for p in patterns
+        if dirs or not p.endswith("/")
+    ]
+    return re.compile("|".join(f"(?:{x})" for x in parts) or r"(?!)")
+
+
+_EXCLUDE_DIR_RE = _compile_excludes(EXCLUDES, dirs=True)
+_EXCLUDE_FILE_RE = _compile_excludes(EXCLUDES, dirs=False)
+
+
+def is_excluded(rel: str, is_dir: bool) -> bool:
+    """
+    Python-side equivalent of the rsync EXCLUDES for a path relative to the source root.
+    """
+    return (_EXCLUDE_DIR_RE if is_dir else _EXCLUDE_FILE_RE).match(rel) is not None
+
+
+def walk_files(src: Path, with_dirs: bool = False) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Yield (relative path, lstat) for every non-directory entry under `src` (plus directories
+    themselves with `with_dirs`), pruning excluded directories during the walk instead of
+    filtering afterwards.
+
+    This is the inner loop of every Python-side tree walk, so it stays lean: the entry type
+    comes from readdir's d_type (no extra stat), the regex match methods are bound once, and
+    the relative prefix is built once per directory.
+    """
+    dir_excluded = _EXCLUDE_DIR_RE.match
+    file_excluded = _EXCLUDE_FILE_RE.match
+    stack = [("", str(src))]
+    pop, push = stack.pop, stack.append
+    while stack:
+        rel_dir, abs_dir = pop()
+        prefix = rel_dir + "/" if rel_dir else ""
+        try:
+            it = os.scandir(abs_dir)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                rel = prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if dir_excluded(rel):
+                            continue
+                        push((rel, entry.path))
+                        if not with_dirs:
+                            continue
+                    elif file_excluded(rel):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                yield rel, st
+
+
+def changed_since(src: Path, since_ns: int) -> Tuple[List[str], List[str]]:
+    """
+    (files, directories) under `src` whose mtime or ctime (renames/moves bump ctime) is newer
+    than `since_ns`. A directory's mtime moves whenever an entry is added, removed or renamed,
+    so the directories are where deletions since `since_ns` can be found. "" is `src` itself.
+    """
+    files: List[str] = []
+    dirs: List[str] = []
+    try:
+        root = os.lstat(src)
+        if max(root.st_mtime_ns, root.st_ctime_ns) > since_ns:
+            dirs.append("")
+    except OSError:
+        pass
+    for rel, st in walk_files(src, with_dirs=True):
+        if max(st.st_mtime_ns, st.st_ctime_ns) > since_ns:
+            (dirs if stat.S_ISDIR(st.st_mode) else files).append(rel)
+    return files, dirs
+
+
+def prune_deleted(src: Path, dest: Path, dirs: Iterable[str]) -> Tuple[int, List[str]]:
+    """
+    Remove entries of the `dirs` (relative) from `dest` that no longer exist in `src`.
+    Returns (removed, errors). Hardlinked older mirrors keep their copies: only this
+    tree's links are removed.
+    """
+    removed = 0
+    errors: List[str] = []
+    for rel in sorted(set(dirs)):
+        src_dir = os.path.join(src, rel) if rel else str(src)
+        dest_dir = os.path.join(dest, rel) if rel else str(dest)
+        if not os.path.isdir(src_dir) or os.path.islink(src_dir):
+            continue  # gone itself: handled from its parent
+        try:
+            with os.scandir(dest_dir) as it:
+                names = [(e.name, e.is_dir(follow_symlinks=False)) for e in it]
+        except OSError:
+            continue
+        for name, is_dir in names:
+            if os.path.lexists(os.path.join(src_dir, name)):
+                continue
+            target = os.path.join(dest_dir, name)
+            try:
+                if is_dir:
+                    shutil.rmtree(target)
+                else:
+                    os.unlink(target)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                errors.append(f"{os.path.join(rel, name)}: {exc}")
+    return removed, errors
+
+
+MIRROR_INDEX = ".mirror_index.json"
+
+
+def _copy_entry(src_path: str, dest_path: str) -> None:
+    """
+    Copy one file (or symlink) into place via a temp file + rename, so a hardlinked older
+    mirror sharing the inode is never modified in place. Timestamps are preserved.
+    """
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    tmp = f"{dest_path}.~mirror.{os.getpid()}.{threading.get_ident()}"
+    if os.path.islink(src_path):
+        os.symlink(os.readlink(src_path), tmp)
+    else:
+        shutil.copyfile(src_path, tmp)  # sendfile/fcopyfile under the hood
+        shutil.copystat(src_path, tmp)
+    os.replace(tmp, dest_path)
+
+
+def fast_mirror(src: Path, dest: Path, index_path: Optional[Path] = None, delete: bool = True, workers: int = 4) -> Dict[str, object]:
+    """
+    Single-process mirror for trees dominated by small files: one walk of `src`, a size+mtime
+    quick check against `index_path` (falls back to stat-ing `dest`), copies on a thread pool.
+    With `delete`, files recorded in the index but gone from `src` are removed from `dest`.
+    Directories are created too (empty ones matter, e.g. inside .git) and indexed as [-1, 0].
+    """
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8")) if index_path else {}
+    except Exception:
+        index = {}
+    current: Dict[str, List[int]] = {}
+    todo: List[str] = []
+    errors: List[str] = []
+    for rel, st in walk_files(src, with_dirs=True):
+        if stat.S_ISDIR(st.st_mode):
+            current[rel] = [-1, 0]
+            if rel not in index:
+                try:
+                    os.makedirs(os.path.join(dest, rel), exist_ok=True)
+                except OSError as exc:
+                    errors.append(f"{rel}: {exc}")
+            continue
+        sig = [int(st.st_size), int(st.st_mtime_ns)]
+        current[rel] = sig
+        prev = index.get(rel)
+        if prev is None:
+            try:
+                dst = os.lstat(os.path.join(dest, rel))
+                prev = [int(dst.st_size), int(dst.st_mtime_ns)]
+            except OSError:
+                prev = None
+        if prev != sig:
+            todo.append(rel)
+
+    copied = 0
+    failed: set = set()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(_copy_entry, os.path.join(src, rel), os.path.join(dest, rel)): rel for rel in todo}
+        for fut in as_completed(futures):
+            rel = futures[fut]
+            try:
+                fut.result()
+                copied += 1
+            except Exception as exc:
+                errors.append(f"{rel}: {exc}")
+                failed.add(rel)
+                # Keep the last good copy: the old signature stays indexed (so the next
+                # run retries it), an unindexed file is simply not recorded.
+                if rel in index:
+                    current[rel] = index[rel]
+                else:
+                    current.pop(rel, None)
+
+    deleted = 0
+    if delete:
+        # deepest first, so directories are empty by the time they are removed
+        gone = set(index) - set(current) - failed
+        for rel in sorted(gone, key=lambda r: r.count("/"), reverse=True):
+            try:
+                if index[rel][0] == -1:
+                    os.rmdir(os.path.join(dest, rel))
+                else:
+                    os.unlink(os.path.join(dest, rel))
+                deleted += 1
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                errors.append(f"{rel}: {exc}")
+
+    if index_path:
+        try:
+            index_path.write_text(json.dumps(current), encoding="utf-8")
+        except OSError as exc:
+            errors.append(f"index: {exc}")
+    return {
+        "ok": not errors,
+        "engine": "python",
+        "files": sum(1 for sig in current.values() if sig[0] != -1),
+        "copied": copied,
+        "deleted": deleted,
+        "unchanged": not todo and not deleted,
+        "errors": errors[:20],
+    }
+
+
+def hardlink_tree(src: Path, dest: Path) -> Dict[str, object]:
+    """
+    Populate `dest` with hardlinks to every file in `src` (like `cp -al`, but portable to macOS).
+    Used for the timestamped mirror: it costs inode metadata only, not another full byte copy.
+    Safe because both mirror engines replace changed files (temp file + rename) rather than
+    rewriting them in place, so the next live-mirror update breaks the link instead of
+    altering this copy. Falls back to copying when linking is not possible (other volume, FAT).
+    """
+    linked = copied = 0
+    errors: List[str] = []
+    for dirpath, dirnames, filenames in os.walk(src):
+        rel_dir = os.path.relpath(dirpath, src)
+        out_dir = os.path.join(dest, rel_dir) if rel_dir != "." else str(dest)
+        os.makedirs(out_dir, exist_ok=True)
+        # symlinked directories show up in dirnames but are not descended into
+        names = filenames + [d for d in dirnames if os.path.islink(os.path.join(dirpath, d))]
+        for name in names:
+            sp, dp = os.path.join(dirpath, name), os.path.join(out_dir, name)
+            try:
+                if os.path.islink(sp):
+                    os.symlink(os.readlink(sp), dp)
+                    copied += 1
+                    continue
+                try:
+                    os.link(sp, dp)
+                    linked += 1
+                except OSError:
+                    shutil.copy2(sp, dp)
+                    copied += 1
+            except FileExistsError:
+                continue
+            except OSError as exc:
+                errors.append(f"{os.path.join(rel_dir, name)}: {exc}")
+    return {"ok": not errors, "engine": "hardlink", "source": str(src), "linked": linked, "copied": copied, "errors": errors[:20]}
+
+
+def mirror_tree(src: Path, dest: Path, delete: bool, engine: str = "rsync") -> Dict[str, object]:
+    if engine == "python" or shutil.which("rsync") is None:
+        return fast_mirror(src, dest, delete=delete)
+    return rsync_mirror(src, dest, delete)
+
+
+def read_dirty_log(log_path: Path, src: Path) -> Optional[Tuple[List[str], List[str]]]:
+    """
+    (files to copy, directories to prune) from what a watcher recorded, relative to `src`.
+    None when no watcher log exists. Every recorded path marks its parent directory, so
+    deleted and renamed-away paths are pruned from the mirror (see prune_deleted).
+    """
+    try:
+        lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except FileNotFoundError:
+        return None
+    root = str(src).rstrip("/") + "/"
+    seen: Dict[str, None] = {}
+    dirs: Dict[str, None] = {}
+    for line in lines:
+        p = line.strip().rstrip("/")
+        if not p.startswith(root):
+            continue
+        rel = p[len(root):]
+        if not rel:
+            continue
+        dirs[os.path.dirname(rel)] = None
+        if rel in seen or not os.path.isfile(p) or is_excluded(rel, False):
+            continue
+        seen[rel] = None
+    return list(seen), list(dirs)
+
+
+def live_mirror(src: Path, live_dir: Path, state_dir: Path, full: bool = False, engine: str = "rsync") -> Dict[str, object]:
+    """
+    Keep `_CURRENT_MIRROR` current while touching only what changed since the last run.
+    Falls back to a full `rsync --delete` sweep on first run, on `full`, or when the last sweep is stale.
+    The python engine (also used when rsync is missing) is incremental by itself via MIRROR_INDEX.
+    """
+    if engine == "python" or shutil.which("rsync") is None:
+        index_path = state_dir / MIRROR_INDEX
+        if full:
+            index_path.unlink(missing_ok=True)
+        return fast_mirror(src, live_dir, index_path=index_path, delete=True)
+
+    state_path = state_dir / SYNC_STATE
+    log_path = state_dir / DIRTY_LOG
+    started_ns = time.time_ns()
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except Exception:
+        state = {}
+    last_sync = int(state.get("last_sync_ns") or 0)
+    last_full = int(state.get("last_full_ns") or 0)
+    stale = (started_ns - last_full) > FULL_SWEEP_EVERY_S * 1_000_000_000
+    log_size = log_path.stat().st_size if log_path.exists() else -1
+
+    if full or not last_sync or stale:
+        res = rsync_mirror(src, live_dir, delete=True)
+        res["mode"] = "full"
+        if res.get("ok"):
+            state = {"last_sync_ns": started_ns, "last_full_ns": started_ns}
+    else:
+        dirty = read_dirty_log(log_path, src)
+        source = "watcher_log"
+        if dirty is None:
+            # 1s of slack covers coarse filesystem timestamps.
+            dirty = changed_since(src, last_sync - 1_000_000_000)
+            source = "mtime_scan"
+        paths, dirs = dirty
+        if paths:
+            res = rsync_mirror(src, live_dir, delete=False, files_from=sorted(paths))
+        else:
+            res = {"ok": True, "code": 0, "unchanged": True}
+        # rsync cannot delete via --files-from; deletions are pruned per changed directory.
+        deleted, prune_errors = prune_deleted(src, live_dir, dirs)
+        res["deleted"] = deleted
+        res["unchanged"] = bool(res.get("unchanged")) and not deleted
+        if prune_errors:
+            res["ok"] = False
+            res["prune_errors"] = prune_errors[:20]
+        # Only the local scan sees every deletion; a watcher may not report them (e.g. an
+        # inotify recipe without delete events), so "unchanged" is not proof then.
+        res.update({"mode": "incremental", "source": source, "files": len(paths), "complete": source == "mtime_scan"})
+        if res.get("ok"):
+            state = {"last_sync_ns": started_ns, "last_full_ns": last_full}
+
+    if res.get("ok"):
+        try:
+            state_path.write_text(json.dumps(state), encoding="utf-8")
+            # Only truncate if the watcher appended nothing meanwhile; otherwise re-read it next run.
+            if log_size > 0 and log_path.stat().st_size == log_size:
+                log_path.write_text("", encoding="utf-8")
+        except OSError:
+            pass
+    return res
+
+
+# Multi-core compressors, in order of preference. Plain `tar -z` (single-threaded gzip) is the fallback.
+# zstd first: better ratio on text-heavy trees at several times gzip's throughput (-T0 = all cores).
+# "args" are appended to the binary name; "{cpus}" expands to the core count.
+SNAPSHOT_COMPRESSORS: List[Dict[str, object]] = [
+    {"bin": "zstd", "args": ["-T0", "--long", "-3"], "suffix": ".tar.zst", "extract": "--zstd -xf"},
+    {"bin": "pigz", "args": ["-p", "{cpus}"], "suffix": ".tar.gz", "extract": "-xzf"},
+    {"bin": "pbzip2", "args": ["-p{cpus}"], "suffix": ".tar.bz2", "extract": "-xjf"},
+    {"bin": "pxz", "args": ["-T", "{cpus}"], "suffix": ".tar.xz", "extract": "-xJf"},
+]
+DEFAULT_COMPRESSOR: Dict[str, object] = {"bin": None, "args": [], "suffix": ".tar.gz", "extract": "-xzf"}
+
+
+def pick_compressor() -> Dict[str, object]:
+    for comp in SNAPSHOT_COMPRESSORS:
+        if shutil.which(str(comp["bin"])):
+            return comp
+    return DEFAULT_COMPRESSOR
+
+
+def compress_program(comp: Dict[str, object]) -> str:
+    cpus = str(os.cpu_count() or 1)
+    args = [str(a).replace("{cpus}", cpus) for a in list(comp["args"] or [])]
+    return " ".join([str(comp["bin"])] + args)
+
+
+_GNU_TAR: Optional[bool] = None
+
 
+def tar_is_gnu() -> bool:
+    """GNU tar exits 1 for "file changed as we read it" (archive complete); bsdtar's 1 is an error."""
+    global _GNU_TAR
+    if _GNU_TAR is None:
+        _GNU_TAR = "GNU tar" in str(run(["tar", "--version"]).get("stdout") or "")
+    return _GNU_TAR
 
-def make_tar_snapshot(src: Path, out_file: Path) -> Dict[str, object]:
+
+def make_tar_snapshot(src: Path, out_stem: Path, algo: str = "sha256") -> Dict[str, object]:
+    """
+    Write `<out_stem><suffix>`; the suffix depends on which compressor is available.
+    The result carries the final "path" (see extract_flag_for for the restore side).
+    """
     if shutil.which("tar") is None:
         return {"ok": False, "error": "tar_not_found"}
+    comp = pick_compressor()
+    out_file = out_stem.with_name(out_stem.name + str(comp["suffix"]))
     out_file.parent.mkdir(parents=True, exist_ok=True)
-    cmd = ["tar", "-czf", str(out_file)]
+    # tar runs the compressor itself and writes the archive to stdout ("-f -").
+    if comp["bin"]:
+        cmd = ["tar", "--use-compress-program", compress_program(comp), "-cf", "-"]
+    else:
+        cmd = ["tar", "-czf", "-"]
     for pat in EXCLUDES:
         cmd.extend(["--exclude", pat])
     cmd.extend(["-C", str(src.parent), src.name])
-    return run(cmd, timeout=60 * 60)
+    # A live tree changing under GNU tar is a warning, not a lost snapshot.
+    res = run_to_file(cmd, out_file, timeout=60 * 60, algo=algo, warn_codes=(1,) if tar_is_gnu() else ())
+    res["path"] = str(out_file)
+    res["compressor"] = comp["bin"] or "gzip"
+    return res
+
+
+def repack_repo(src: Path) -> Dict[str, object]:
+    """
+    Fully re-delta the object store (all cores) so bundles are built from optimally packed input.
+    Skipped while another git process holds the index lock.
+    """
+    if (src / ".git" / "index.lock").exists():
+        return {"ok": False, "skipped": True, "error": "index_locked"}
+    cmd = ["git", "repack", "-a", "-d", "-f", "--window=250", "--depth=250", "--threads=0"]
+    return run(cmd, cwd=src, timeout=60 * 60)
 
 
-def make_git_bundle(src: Path, out_file: Path) -> Dict[str, object]:
+# Last bundled HEAD, next to the stamp folders. Later runs bundle only what is new since then.
+BUNDLE_TIP = ".bundle_tip"
+
+
+def bundle_tip_is_head(src: Path, state_dir: Path) -> bool:
+    """True if the last bundled tip is the repo's current HEAD (nothing new to bundle)."""
+    try:
+        tip = (state_dir / BUNDLE_TIP).read_text(encoding="utf-8").strip()
+    except OSError:
+        return False
+    head = run(["git", "rev-parse", "HEAD"], cwd=src)
+    return bool(tip) and bool(head.get("ok")) and str(head.get("stdout") or "").strip() == tip
+
+
+def make_git_bundle(
+    src: Path,
+    out_dir: Path,
+    state_dir: Path,
+    stamp: str,
+    algo: str = "sha256",
+    full: bool = False,
+) -> Dict[str, object]:
+    """
+    First run (or `full`, or when the recorded tip is no longer in the repo): `repo.bundle` with
+    the whole history. Afterwards: `repo.incr-<stamp>.bundle` holding all refs minus what the
+    previous tip already covers, i.e. O(new commits) instead of O(history) per backup.
+    """
     if shutil.which("git") is None:
         return {"ok": False, "error": "git_not_found"}
     if not (src / ".git").exists():
         return {"ok": False, "error": "no_git_dir"}
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    cmd = ["git", "bundle", "create", str(out_file), "--all"]
-    return run(cmd, cwd=src, timeout=60 * 60)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tip_path = state_dir / BUNDLE_TIP
+    try:
+        prev = "" if full else tip_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        prev = ""
+    if prev and not run(["git", "cat-file", "-e", f"{prev}^{{commit}}"], cwd=src).get("ok"):
+        prev = ""  # history was rewritten (or another repo): start a new full chain
+
+    # Resolve the new tip before bundling: a commit landing mid-bundle must not be skipped next time.
+    head = run(["git", "rev-parse", "HEAD"], cwd=src)
+    if prev:
+        out_file = out_dir / f"repo.incr-{stamp}.bundle"
+        cmd = ["git", "bundle", "create", "-", "--all", "--not", prev]
+    else:
+        out_file = out_dir / "repo.bundle"
+        cmd = ["git", "bundle", "create", "-", "--all"]
+    res = run_to_file(cmd, out_file, cwd=src, timeout=60 * 60, algo=algo)
+    if prev and not res.get("ok") and "empty bundle" in str(res.get("stderr") or ""):
+        return {"ok": True, "unchanged": True, "base": prev}
+    res["path"] = str(out_file)
+    res["kind"] = "incremental" if prev else "full"
+    if prev:
+        res["base"] = prev
+    if res.get("ok") and head.get("ok"):
+        tip_path.write_text(str(head["stdout"]) + "\n", encoding="utf-8")
+    return res
 
 
 def git_identity(src: Path) -> Dict[str, object]:
     if shutil.which("git") is None or not (src / ".git").exists():
         return {"ok": False}
-    head = run(["git", "rev-parse", "HEAD"], cwd=src)
-    branch = run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=src)
-    status = run(["git", "status", "--porcelain=v1"], cwd=src)
-    return {"ok": True, "head": head, "branch": branch, "status": status}
+    # HEAD and branch from their own (tiny) command: run() keeps only the tail of stdout, and
+    # the status listing of a very dirty tree would push header lines out of it.
+    ident = run(["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"], cwd=src)
+    head, branch = (str(ident.get("stdout") or "").splitlines() + ["", ""])[:2] if ident.get("ok") else ("", "")
+    if branch == "HEAD":
+        branch = "(detached)"
+    status = run(["git", "--no-optional-locks", "-c", "status.showStash=false", "status", "--porcelain=v2"], cwd=src)
+    changes = str(status.get("stdout") or "").splitlines()
+    return {"ok": bool(status.get("ok")), "head": head, "branch": branch, "dirty": bool(changes), "status": status}
 
-def sha256_file(path: Path, chunk_bytes: int = 8 * 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
+def pick_hash_algo(fips: bool = False) -> str:
+    """
+    BLAKE3 when installed (integrity only, no FIPS need); SHA-256 otherwise or when `fips` is set.
+    """
+    return "blake3" if blake3 is not None and not fips else "sha256"
+
+
+def hash_available(algo: str) -> bool:
+    """False for blake3 without the optional module (e.g. verified on another Mac) or unknown names."""
+    if algo == "blake3":
+        return blake3 is not None
+    try:
+        hashlib.new(algo)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
+def new_hasher(algo: str) -> Any:
+    if algo == "blake3":
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.new(algo)
+
+
+def hash_file(path: Path, algo: str = "sha256") -> str:
+    if algo == "blake3":
+        return new_hasher(algo).update_mmap(str(path)).hexdigest()
+    return sha256_file(path)
+
+
+# Hashing is bound by drive/memory bandwidth, not ALU (OpenSSL already uses SHA-NI / ARMv8 crypto).
+# A 1 MiB page-aligned buffer matches typical readahead windows and stays cache-resident while
+# both the whole-file and the per-chunk hasher consume it; 8 MiB reads only churned L3.
+HASH_BUFFER_BYTES = 1024 * 1024
+
+
+def read_blocks(f: Any, block_bytes: int = HASH_BUFFER_BYTES) -> Iterator[memoryview]:
+    """
+    Yield successive blocks of `f` from one reused, page-aligned buffer (anonymous mmap),
+    after asking the kernel for aggressive sequential readahead. Each block is only valid
+    until the next one is yielded.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    buf = mmap.mmap(-1, block_bytes)
+    view = memoryview(buf)
+    try:
         while True:
-            chunk = f.read(chunk_bytes)
-            if not chunk:
+            n = f.readinto(view)
+            if not n:
                 break
-            h.update(chunk)
+            yield view[:n]
+    finally:
+        view.release()
+        buf.close()
+
+
+def sha256_file(path: Path, chunk_bytes: int = HASH_BUFFER_BYTES) -> str:
+    h = hashlib.sha256()
+    with path.open("rb", buffering=0) as f:
+        bypass_page_cache(f.fileno())
+        try:
+            for block in read_blocks(f, chunk_bytes):
+                h.update(block)
+                block.release()
+        finally:
+            drop_page_cache(f.fileno())
     return h.hexdigest()
 
 
-def artifact_record(path: Path) -> Dict[str, object]:
-    try:
+# Artifacts also get one digest per fixed-size chunk, so corruption can be localized and
+# verification fans out across cores (see verify_backup).
+CHUNK_BYTES = 8 * 1024 * 1024
+
+
+class ChunkedDigest:
+    """
+    Whole-stream digest plus per-chunk digests, fed in a single pass.
+    root_hash commits to the chunk table: H(concat(chunk digests)).
+    """
+
+    def __init__(self, algo: str = "sha256", chunk_size: int = CHUNK_BYTES) -> None:
+        self.algo = algo
+        self.chunk_size = chunk_size
+        self.size = 0
+        self.chunks: List[str] = []
+        self._whole = new_hasher(algo)
+        self._chunk = new_hasher(algo)
+        self._chunk_fill = 0
+
+    def update(self, data: Any) -> None:
+        view = memoryview(data)
+        self._whole.update(view)
+        self.size += len(view)
+        while len(view):
+            take = min(len(view), self.chunk_size - self._chunk_fill)
+            self._chunk.update(view[:take])
+            self._chunk_fill += take
+            view = view[take:]
+            if self._chunk_fill == self.chunk_size:
+                self._close_chunk()
+
+    def _close_chunk(self) -> None:
+        self.chunks.append(self._chunk.hexdigest())
+        self._chunk = new_hasher(self.algo)
+        self._chunk_fill = 0
+
+    def record(self, path: Path) -> Dict[str, object]:
+        if self._chunk_fill:
+            self._close_chunk()
         return {
             "path": str(path),
-            "bytes": int(path.stat().st_size),
-            "sha256": sha256_file(path),
+            "bytes": self.size,
+            "algorithm": self.algo,
+            self.algo: self._whole.hexdigest(),
+            "chunk_size": self.chunk_size,
+            "chunks": self.chunks,
+            "root_hash": chunk_root(self.chunks, self.algo),
         }
+
+
+def chunk_root(chunks: List[str], algo: str) -> str:
+    h = new_hasher(algo)
+    h.update(b"".join(bytes.fromhex(c) for c in chunks))
+    return h.hexdigest()
+
+
+def artifact_record(path: Path, algo: str = "sha256") -> Dict[str, object]:
+    try:
+        digest = ChunkedDigest(algo)
+        with path.open("rb", buffering=0) as f:
+            bypass_page_cache(f.fileno())
+            for block in read_blocks(f):
+                digest.update(block)
+                block.release()
+            drop_page_cache(f.fileno())
+        return digest.record(path)
     except Exception as exc:
         return {"path": str(path), "error": str(exc)}
 
 
-def write_restore_instructions(out_dir: Path, stamp: str) -> None:
+def chunk_digest(path: str, index: int, chunk_size: int, algo: str) -> str:
+    """
+    Digest of one chunk via pread, so parallel workers share the file without seeking.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        bypass_page_cache(fd)
+        data = os.pread(fd, chunk_size, index * chunk_size)
+        drop_page_cache(fd, index * chunk_size, chunk_size)
+    finally:
+        os.close(fd)
+    h = new_hasher(algo)
+    h.update(data)
+    return h.hexdigest()
+
+
+def verify_backup(backup_dir: Path) -> Dict[str, object]:
+    """
+    Re-hash every artifact listed in `backup_dir/MANIFEST.json`, chunk by chunk across cores.
+    Reports bad chunk indices so a partially corrupted artifact can be located (and repaired).
+    Artifacts without a chunk table (older manifests) are checked as a whole.
+    """
+    manifest = json.loads((backup_dir / "MANIFEST.json").read_text(encoding="utf-8"))
+    results: List[Dict[str, object]] = []
+    jobs: List[tuple] = []
+    for rec in manifest.get("artifacts") or []:
+        if not isinstance(rec, dict) or rec.get("error"):
+            continue
+        algo = str(rec.get("algorithm") or "sha256")
+        # The drive may be mounted elsewhere now: prefer the copy next to the manifest.
+        path = backup_dir / Path(str(rec["path"])).name
+        if not path.exists():
+            path = Path(str(rec["path"]))
+        res: Dict[str, object] = {"path": str(path), "algorithm": algo}
+        results.append(res)
+        if not hash_available(algo):
+            res.update({"ok": False, "error": f"{algo}_unavailable"})
+            continue
+        if not path.exists():
+            res.update({"ok": False, "error": "missing"})
+            continue
+        # An unreadable artifact (I/O error, permissions) fails on its own, not the whole run.
+        try:
+            if path.stat().st_size != rec.get("bytes"):
+                res["size_mismatch"] = True
+            chunks = rec.get("chunks")
+            if isinstance(chunks, list):
+                for i, expected in enumerate(chunks):
+                    jobs.append((res, i, expected, (str(path), i, int(rec["chunk_size"]), algo)))
+            else:
+                res["ok"] = hash_file(path, algo) == rec.get(algo) and not res.get("size_mismatch")
+        except OSError as exc:
+            res.update({"ok": False, "error": str(exc)})
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            futures = {pool.submit(chunk_digest, *args): (res, i, expected) for res, i, expected, args in jobs}
+            for fut in as_completed(futures):
+                res, i, expected = futures[fut]
+                try:
+                    digest = fut.result()
+                except OSError as exc:
+                    res.update({"ok": False, "error": str(exc)})
+                    continue
+                if digest != expected:
+                    res.setdefault("bad_chunks", []).append(i)
+        for res, _, _, _ in jobs:
+            if "ok" not in res:
+                bad = sorted(res.get("bad_chunks") or [])
+                res["bad_chunks"] = bad
+                res["ok"] = not bad and not res.get("size_mismatch")
+
+    return {"ok": all(r.get("ok") for r in results), "backup_dir": str(backup_dir), "artifacts": results}
+
+
+def extract_flag_for(snapshot_name: str) -> str:
+    for comp in SNAPSHOT_COMPRESSORS:
+        if snapshot_name.endswith(str(comp["suffix"])):
+            return str(comp["extract"])
+    return str(DEFAULT_COMPRESSOR["extract"])
+
+
+def dump_json_bytes(obj: Any) -> bytes:
+    """
+    Pretty-printed UTF-8 JSON; orjson when installed, stdlib json otherwise.
+    `default=str` covers Paths (neither encoder serializes them natively).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+# Merkle state of the live mirror (outside _CURRENT_MIRROR, which rsync --delete would clean).
+MERKLE_STATE = ".merkle.json"
+
+
+def _leaf_digest(path: str, algo: str) -> str:
+    if os.path.islink(path):
+        h = new_hasher(algo)
+        h.update(os.readlink(path).encode("utf-8", "surrogateescape"))
+        return h.hexdigest()
+    return hash_file(Path(path), algo)
+
+
+def merkle_root(leaves: Dict[str, List[Any]], algo: str) -> str:
+    """
+    Binary Merkle root over the sorted leaves. Each leaf commits to its path and content digest;
+    0x00/0x01 prefixes separate leaf and inner nodes. An odd node is carried up unchanged.
+    """
+    level: List[bytes] = []
+    for rel in sorted(leaves):
+        h = new_hasher(algo)
+        h.update(b"\x00" + rel.encode("utf-8", "surrogateescape") + b"\x00" + bytes.fromhex(str(leaves[rel][2])))
+        level.append(h.digest())
+    if not level:
+        return new_hasher(algo).hexdigest()
+    while len(level) > 1:
+        nxt: List[bytes] = []
+        for i in range(0, len(level) - 1, 2):
+            h = new_hasher(algo)
+            h.update(b"\x01" + level[i] + level[i + 1])
+            nxt.append(h.digest())
+        if len(level) % 2:
+            nxt.append(level[-1])
+        level = nxt
+    return level[0].hex()
+
+
+def mirror_merkle(root_dir: Path, prev_leaves: Dict[str, List[Any]], algo: str, workers: int = 0) -> Dict[str, object]:
+    """
+    Merkle root of a mirror. Leaves are {rel: [size, mtime_ns, digest]}; only files whose
+    size/mtime differ from `prev_leaves` are re-read, hashed on a thread pool (hashlib and
+    blake3 release the GIL), so an unchanged tree costs one metadata walk.
+    """
+    leaves: Dict[str, List[Any]] = {}
+    todo: List[str] = []
+    for rel, st in walk_files(root_dir):
+        sig = [int(st.st_size), int(st.st_mtime_ns)]
+        prev = prev_leaves.get(rel)
+        if isinstance(prev, list) and len(prev) == 3 and prev[:2] == sig:
+            leaves[rel] = prev
+        else:
+            leaves[rel] = sig + [""]
+            todo.append(rel)
+    with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as pool:
+        futures = {pool.submit(_leaf_digest, os.path.join(root_dir, rel), algo): rel for rel in todo}
+        for fut in as_completed(futures):
+            rel = futures[fut]
+            try:
+                leaves[rel][2] = fut.result()
+            except OSError:
+                leaves.pop(rel, None)  # vanished mid-walk
+    return {"root": merkle_root(leaves, algo), "files": len(leaves), "rehashed": len(todo), "leaves": leaves}
+
+
+def reuse_snapshot(prev: Dict[str, object], out_dir: Path) -> Dict[str, object]:
+    """
+    Link the previous snapshot (same mirror root) into `out_dir` instead of re-compressing
+    an identical tree. Its recorded digests carry over unchanged.
+    """
+    old = Path(str(prev["path"]))
+    new = out_dir / old.name
+    try:
+        try:
+            os.link(old, new)
+        except OSError:
+            shutil.copy2(old, new)
+    except OSError as exc:
+        return {"ok": False, "error": f"reuse_failed: {exc}"}
+    artifact = dict(prev)
+    artifact["path"] = str(new)
+    return {"ok": True, "reused": str(old), "path": str(new), "artifact": artifact}
+
+
+def write_restore_instructions(out_dir: Path, stamp: str, snapshot_name: str = "snapshot.tar.gz") -> None:
+    extract_flag = extract_flag_for(snapshot_name)
     text = f"""# ResilienceOS Backup — Restore Instructions
 Backup stamp: `{stamp}`
 
@@ -163,16 +1176,25 @@ Backup stamp: `{stamp}`
 1) Choose a target folder (example):
    - `mkdir -p ~/ResilienceOS_restore_{stamp}`
 2) Extract:
-   - `tar -xzf snapshot.tar.gz -C ~/ResilienceOS_restore_{stamp}`
+   - `tar {extract_flag} {snapshot_name} -C ~/ResilienceOS_restore_{stamp}`
 
-## Option B: Restore full git history from bundle
-1) Clone from the bundle:
-   - `git clone repo.bundle ~/ResilienceOS_repo_{stamp}`
-2) (Optional) Check out the default branch:
-   - `cd ~/ResilienceOS_repo_{stamp} && git status`
+## Option B: Restore full git history from bundle(s)
+Stamp folders hold either a full `repo.bundle` or an incremental `repo.incr-<stamp>.bundle`
+(only commits newer than the previous backup; its `base` commit is listed in `MANIFEST.json`).
+1) Clone from the newest full bundle at or before this stamp:
+   - `git clone <stamp>/repo.bundle ~/ResilienceOS_repo_{stamp}`
+2) Apply each later incremental bundle up to this stamp, oldest stamp first:
+   - `cd ~/ResilienceOS_repo_{stamp} && git fetch <stamp>/repo.incr-<stamp>.bundle '+refs/heads/*:refs/remotes/origin/*'`
+   - (`git bundle unbundle <file>` works too, but only stores objects without updating refs)
+3) (Optional) Check out the default branch:
+   - `git checkout <branch> && git merge --ff-only origin/<branch> && git status`
 
 ## Integrity
-- Verify SHA256 values in `MANIFEST.json`.
+- Verify the hashes in `MANIFEST.json` (`algorithm` per artifact: `shasum -a 256`, or `b3sum` for blake3).
+- Per-chunk check (parallel, reports which chunks are bad):
+  - `python3 OS/01_SCRIPTS/backup_resilience_os.py --verify <this folder>`
+- Manual check of a single chunk N (`chunk_size` bytes each, hashes in `chunks[N]`):
+  - `dd if={snapshot_name} bs=<chunk_size> skip=N count=1 | shasum -a 256`
 """
     (out_dir / "RESTORE.md").write_text(text, encoding="utf-8")
 
@@ -182,14 +1204,32 @@ def main() -> None:
     parser.add_argument("--dest", default=str(pick_default_dest()), help="Destination root folder.")
     parser.add_argument("--delete", action="store_true", help="Mirror: delete files in dest not present in src.")
     parser.add_argument("--no-mirror", action="store_true", help="Skip rsync mirror.")
+    parser.add_argument(
+        "--mirror-engine",
+        choices=["rsync", "python"],
+        default="rsync",
+        help="python: single-process copier for small-file-heavy trees (auto-used when rsync is missing).",
+    )
+    parser.add_argument("--full", action="store_true", help="Full rsync sweep of the live mirror (also propagates deletions).")
     parser.add_argument("--no-snapshot", action="store_true", help="Skip tar snapshot.")
     parser.add_argument("--no-bundle", action="store_true", help="Skip git bundle.")
+    parser.add_argument("--repack", action="store_true", help="git repack -adf --window=250 --depth=250 before bundling.")
+    parser.add_argument("--full-bundle", action="store_true", help="Bundle the whole history, starting a new incremental chain.")
+    parser.add_argument("--fips", action="store_true", help="Hash artifacts with SHA-256 even if blake3 is installed.")
+    parser.add_argument("--verify", default="", help="Verify an existing backup folder against its MANIFEST.json and exit.")
+    parser.add_argument("--jobs", type=int, default=3, help="Max backup steps running at once (limits drive IOPS).")
     args = parser.parse_args()
 
+    if args.verify:
+        report = verify_backup(Path(args.verify).expanduser())
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["ok"] else 1)
+
     src = repo_root()
     dest_root = Path(args.dest).expanduser()
     ensure_dest(dest_root)
 
+    algo = pick_hash_algo(bool(args.fips))
     stamp = now_stamp()
     out_dir = dest_root / stamp
     ensure_dest(out_dir)
@@ -200,6 +1240,7 @@ def main() -> None:
         "dest_root": str(dest_root),
         "stamp": stamp,
         "excludes": EXCLUDES,
+        "hash_algorithm": algo,
         "git": git_identity(src),
         "steps": {},
         "artifacts": [],
@@ -209,29 +1250,109 @@ def main() -> None:
     if not args.no_mirror:
         live_dir = dest_root / "_CURRENT_MIRROR"
         ensure_dest(live_dir)
-        manifest["steps"]["live_mirror"] = rsync_mirror(src, live_dir, delete=True)
+        manifest["steps"]["live_mirror"] = live_mirror(src, live_dir, dest_root, full=bool(args.full), engine=args.mirror_engine)
 
-    # Timestamped mirror (for forensic restore)
-    if not args.no_mirror:
-        mirror_dir = out_dir / "mirror"
-        ensure_dest(mirror_dir)
-        manifest["steps"]["mirror"] = rsync_mirror(src, mirror_dir, delete=bool(args.delete))
+    # Mirror Merkle root: if the tree is byte-identical to the last snapshotted one, reuse that snapshot.
+    # If the mirror step itself reports zero transferred/deleted files, not even the Merkle walk is needed.
+    merkle_state: Dict[str, Any] = {}
+    tree: Optional[Dict[str, object]] = None
+    reuse: Optional[Dict[str, object]] = None
+    live = manifest["steps"].get("live_mirror") or {}
+    # Reused Merkle root, reused snapshot and skipped bundle all stand for the *source* being
+    # unchanged: only trust a mirror result that saw every deletion too.
+    mirror_unchanged = bool(live.get("ok") and live.get("unchanged") and live.get("complete", True))
+    if not args.no_mirror and live.get("ok"):
+        try:
+            merkle_state = json.loads((dest_root / MERKLE_STATE).read_text(encoding="utf-8"))
+        except Exception:
+            merkle_state = {}
+        prev_leaves = merkle_state.get("leaves") if merkle_state.get("algorithm") == algo else None
+        if mirror_unchanged and prev_leaves is not None and merkle_state.get("root"):
+            tree = {"root": merkle_state["root"], "files": len(prev_leaves), "rehashed": 0, "leaves": prev_leaves}
+        else:
+            tree = mirror_merkle(live_dir, prev_leaves or {}, algo)
+        manifest["mirror_merkle"] = {k: tree[k] for k in ("root", "files", "rehashed")}
+        prev_snap = merkle_state.get("snapshot")
+        if (
+            not args.no_snapshot
+            and live.get("complete", True)
+            and prev_leaves is not None
+            and merkle_state.get("root") == tree["root"]
+            and isinstance(prev_snap, dict)
+            and Path(str(prev_snap.get("path"))).exists()
+        ):
+            reuse = prev_snap
 
-    if not args.no_snapshot:
-        tar_path = out_dir / "snapshot.tar.gz"
-        manifest["steps"]["snapshot"] = make_tar_snapshot(src, tar_path)
-        if tar_path.exists():
-            manifest["artifacts"].append(artifact_record(tar_path))
+    # .git is part of the mirror, so an unchanged mirror means no new commits either; the
+    # recorded tip must still be HEAD (a failed or stale earlier bundle is redone).
+    skip_bundle = (
+        not args.no_bundle and mirror_unchanged and not args.full_bundle and bundle_tip_is_head(src, dest_root)
+    )
+    if args.repack and not args.no_bundle and not skip_bundle:
+        # Before the parallel jobs: repack replaces pack files the tar snapshot is reading.
+        manifest["steps"]["repack"] = repack_repo(src)
+
+    # Timestamped mirror, snapshot and bundle only read the source tree and stress different
+    # resources (metadata IO vs compression vs pack generation), so they run overlapped.
+    jobs: Dict[str, Future] = {}
+    with ThreadPoolExecutor(max_workers=max(1, int(args.jobs))) as pool:
+        # Timestamped mirror (for forensic restore): hardlinks into the fresh live mirror, so
+        # unchanged files share inodes across stamps. Full copy only if the live mirror failed.
+        if not args.no_mirror:
+            mirror_dir = out_dir / "mirror"
+            ensure_dest(mirror_dir)
+            if (manifest["steps"].get("live_mirror") or {}).get("ok"):
+                jobs["mirror"] = pool.submit(hardlink_tree, live_dir, mirror_dir)
+            else:
+                jobs["mirror"] = pool.submit(mirror_tree, src, mirror_dir, bool(args.delete), args.mirror_engine)
+        if reuse is not None:
+            jobs["snapshot"] = pool.submit(reuse_snapshot, reuse, out_dir)
+        elif not args.no_snapshot:
+            jobs["snapshot"] = pool.submit(make_tar_snapshot, src, out_dir / "snapshot", algo)
+        if not args.no_bundle and skip_bundle:
+            manifest["steps"]["git_bundle"] = {"ok": True, "unchanged": True, "skipped": "mirror_unchanged"}
+        elif not args.no_bundle:
+            jobs["git_bundle"] = pool.submit(
+                make_git_bundle, src, out_dir, dest_root, stamp, algo, bool(args.full_bundle)
+            )
+    for name, fut in jobs.items():
+        try:
+            manifest["steps"][name] = fut.result()
+        except Exception as exc:
+            manifest["steps"][name] = {"ok": False, "error": str(exc)}
 
-    if not args.no_bundle:
-        bundle_path = out_dir / "repo.bundle"
-        manifest["steps"]["git_bundle"] = make_git_bundle(src, bundle_path)
-        if bundle_path.exists():
-            manifest["artifacts"].append(artifact_record(bundle_path))
+    # Streamed steps hashed their output while writing it (reused snapshots carry their
+    # record over); anything else with an output file is hashed here.
+    artifacts: List[Dict[str, object]] = []
+    snapshot_name = "snapshot.tar.gz"
+    for name in ("snapshot", "git_bundle"):
+        step = manifest["steps"].get(name)
+        if not isinstance(step, dict) or not step.get("path"):
+            continue
+        path = Path(str(step["path"]))
+        if name == "snapshot":
+            snapshot_name = path.name
+        if isinstance(step.get("artifact"), dict):
+            artifacts.append(step.pop("artifact"))
+        elif path.exists():
+            artifacts.append(artifact_record(path, algo))
+    manifest["artifacts"] = artifacts
+
+    if tree is not None:
+        snap_record = next((a for a in manifest["artifacts"] if a and Path(str(a.get("path"))).name == snapshot_name), None)
+        snap_step = manifest["steps"].get("snapshot") or {}
+        if snap_record is None or snap_record.get("error") or snap_step.get("warning"):
+            # A snapshot of a tree that changed mid-read is kept, but never re-linked later.
+            snap_record = None
+        merkle_state = {"algorithm": algo, "root": tree["root"], "leaves": tree["leaves"], "snapshot": snap_record}
+        try:
+            (dest_root / MERKLE_STATE).write_bytes(dump_json_bytes(merkle_state))
+        except OSError:
+            pass
 
-    write_restore_instructions(out_dir, stamp)
+    write_restore_instructions(out_dir, stamp, snapshot_name)
 
-    (out_dir / "MANIFEST.json").write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    (out_dir / "MANIFEST.json").write_bytes(dump_json_bytes(manifest))
 
     ok = True
     for k, v in (manifest.get("steps") or {}).items():
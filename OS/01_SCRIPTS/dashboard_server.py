@@ -2,24 +2,48 @@
 """
 OMEGA Dashboard Server (stdlib-only)
 Serves a localhost-only dashboard + minimal JSON API.
+Uses orjson for JSON when installed (OMEGA_DASHBOARD_STDLIB_JSON=1 disables it).
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
+import errno
+import gzip
+import hashlib
+import heapq
+import http.client
+import importlib
+import io
 import json
 import os
+import queue
+import selectors
 import signal
+import socket
+import stat
 import subprocess
 import sys
 import threading
+import time
 import shutil
-from datetime import datetime, timezone
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, Optional
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from urllib.error import HTTPError
+
+try:
+    import orjson  # optional: C JSON codec for the larger index/coverage payloads
+except ImportError:
+    orjson = None
+if os.environ.get("OMEGA_DASHBOARD_STDLIB_JSON"):
+    orjson = None
 
 # History tracking for trends
 try:
@@ -29,8 +53,23 @@ except ImportError:
         return {"runway_trend": 0, "liquidity_trend": 0, "days_of_data": 0}
 
 
-def resolve_paths() -> Dict[str, Path]:
-    scripts_dir = Path(__file__).resolve().parent
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+@lru_cache(maxsize=None)
+def helper_module(name: str) -> Any:
+    """
+    Import a sibling script once; later calls are a dict lookup.
+    Failed imports are not cached, so a fixed script is picked up on retry.
+    """
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    return importlib.import_module(name)
+
+
+@lru_cache(maxsize=1)
+def _resolve_paths_once() -> Dict[str, Path]:
+    scripts_dir = SCRIPTS_DIR
     os_dir = scripts_dir.parent
     core = os_dir / "00_CORE_DATA"
     return {
@@ -50,6 +89,11 @@ def resolve_paths() -> Dict[str, Path]:
     }
 
 
+def resolve_paths() -> Dict[str, Path]:
+    # Resolved once; callers get their own copy of the mapping.
+    return dict(_resolve_paths_once())
+
+
 OLLAMA_BASE_URL = "http://localhost:11434"
 API_VERSION = "2026-01-05-6"
 STALE_AFTER_SECONDS = 900
@@ -62,53 +106,266 @@ RUN_STATE = {
     "error": None,
     "log_tail": "",
 }
-RUN_LOCK = threading.Lock()
+RUN_LOCK = threading.RLock()
+# Set whenever no run is in flight; /api/run_status?wait_ms=N blocks on it.
+RUN_DONE = threading.Event()
+RUN_DONE.set()
+RUN_STATUS_MAX_WAIT_MS = 25_000
+# Long-polls each pin a pool worker while they wait; beyond this many at once
+# the reply comes back immediately (the client simply polls again).
+RUN_STATUS_WAITERS = threading.BoundedSemaphore(4)
+
+
+def session_log_path() -> Path:
+    return SCRIPTS_DIR.parents[1] / "OS" / "03_REPORTS" / "SESSION_LOG.md"
+
+
+# Session events are appended by one background writer so request threads
+# never touch the filesystem for them; bursts coalesce into a single write.
+_SESSION_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_SESSION_IO_LOCK = threading.Lock()
+_SESSION_WRITER: Optional[threading.Thread] = None
+SESSION_BATCH_WAIT_S = 0.25
+SESSION_BATCH_MAX = 64
+_SESSION_STOP = None
+
+
+def _write_session_lines(lines: list, ensure_header: bool = True) -> None:
+    try:
+        path = session_log_path()
+        with _SESSION_IO_LOCK:
+            if ensure_header:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if not path.exists():
+                    path.write_text("# SESSION LOG\n\n", encoding="utf-8")
+            with path.open("a", encoding="utf-8") as f:
+                f.write("".join(lines))
+    except Exception:
+        return
+
+
+def _session_writer_loop() -> None:
+    ensure_header = True
+    running = True
+    while running:
+        batch = [_SESSION_QUEUE.get()]
+        while len(batch) < SESSION_BATCH_MAX:
+            try:
+                batch.append(_SESSION_QUEUE.get(timeout=SESSION_BATCH_WAIT_S))
+            except queue.Empty:
+                break
+            if batch[-1] is _SESSION_STOP:
+                break
+        if batch[-1] is _SESSION_STOP:
+            batch.pop()
+            running = False
+        if batch:
+            _write_session_lines(batch, ensure_header=ensure_header)
+            ensure_header = False
+
+
+def _flush_session_queue() -> None:
+    """Stop the writer (it writes what it holds) and write anything left."""
+    writer = _SESSION_WRITER
+    if writer is not None and writer.is_alive():
+        _SESSION_QUEUE.put(_SESSION_STOP)
+        writer.join(timeout=2)
+    pending = []
+    while True:
+        try:
+            item = _SESSION_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        if item is not _SESSION_STOP:
+            pending.append(item)
+    if pending:
+        _write_session_lines(pending)
+
+
+atexit.register(_flush_session_queue)
 
 
 def append_session_event(event: str) -> None:
     """
     Append-only log for "what the OS did" so new chats can re-sync fast.
     Stays short and avoids inferring anything about the operator.
+    Queued for the background writer; returns immediately.
     """
+    global _SESSION_WRITER
+    stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    _SESSION_QUEUE.put_nowait(f"- [{stamp}] AUTO: {event.strip()}\n")
+    if _SESSION_WRITER is None:
+        with _SESSION_IO_LOCK:
+            if _SESSION_WRITER is None:
+                _SESSION_WRITER = threading.Thread(target=_session_writer_loop, name="session-log", daemon=True)
+                _SESSION_WRITER.start()
+
+
+# Parsed file contents keyed by path, invalidated on (mtime_ns, size) change.
+# Callers treat the returned objects as read-only.
+_JSON_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+_TEXT_CACHE: Dict[str, Tuple[int, int, str]] = {}
+_CACHE_LOCK = threading.RLock()
+
+
+_MISSING = object()
+
+
+def _cached_read(cache: Dict[str, Tuple[int, int, Any]], path: Path, parse, default: Any, missing: Any = _MISSING) -> Any:
+    key = str(path)
+    try:
+        st = path.stat()
+    except OSError:
+        with _CACHE_LOCK:
+            cache.pop(key, None)
+        return default if missing is _MISSING else missing
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _CACHE_LOCK:
+        hit = cache.get(key)
+    if hit is not None and hit[:2] == stamp:
+        return hit[2]
     try:
-        root = Path(__file__).resolve().parents[2]
-        path = root / "OS" / "03_REPORTS" / "SESSION_LOG.md"
-        path.parent.mkdir(parents=True, exist_ok=True)
-        if not path.exists():
-            path.write_text("# SESSION LOG\n\n", encoding="utf-8")
-        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with path.open("a", encoding="utf-8") as f:
-            f.write(f"- [{stamp}] AUTO: {event.strip()}\n")
+        value = parse(path)
     except Exception:
-        return
+        return default
+    with _CACHE_LOCK:
+        cache[key] = (stamp[0], stamp[1], value)
+    return value
+
+
+def json_loads(raw: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _parse_json_file(path: Path) -> Dict[str, Any]:
+    data = json_loads(path.read_bytes())
+    return data if isinstance(data, dict) else {}
 
 
 def load_json(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {}
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return data if isinstance(data, dict) else {}
-    except Exception:
-        return {}
+    return _cached_read(_JSON_CACHE, path, _parse_json_file, {})
+
+
+def load_json_if_exists(path: Path) -> Optional[Dict[str, Any]]:
+    """Like load_json, but None when the file is missing (one stat, no exists() probe)."""
+    return _cached_read(_JSON_CACHE, path, _parse_json_file, {}, missing=None)
 
 
 def load_text(path: Path) -> str:
-    if not path.exists():
-        return ""
+    return _cached_read(_TEXT_CACHE, path, lambda p: p.read_text(encoding="utf-8"), "")
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int]]:
     try:
-        return path.read_text(encoding="utf-8")
-    except Exception:
-        return ""
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# Serialized response bodies keyed by endpoint; each entry remembers the
+# input stamps it was built from so a changed file rebuilds it.
+_BODY_CACHE: Dict[str, Tuple[Any, bytes]] = {}
+
+
+def encode_json(data: Any, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder copes
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Fixed-shape error replies, encoded once instead of on every bad request.
+ERROR_BODIES: Dict[str, bytes] = {
+    code: encode_json({"ok": False, "error": code})
+    for code in (
+        "invalid_body",
+        "invalid_json",
+        "invalid_action",
+        "missing_prompt",
+        "prompt_too_long",
+        "ai_busy",
+        "transport_plan.json not found",
+        "crisis_sitrep.json not found",
+    )
+}
+
+
+def cached_body(name: str, key: Any, build: Callable[[], Any]) -> bytes:
+    with _CACHE_LOCK:
+        hit = _BODY_CACHE.get(name)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    body = encode_json(build())
+    with _CACHE_LOCK:
+        _BODY_CACHE[name] = (key, body)
+    return body
+
+
+# Responses below this size are cheaper to send raw than to compress.
+GZIP_MIN_BYTES = 1024
+# endpoint -> (uncompressed body, gzip body); valid while cached_body keeps
+# handing out the same bytes object.
+_GZIP_CACHE: Dict[str, Tuple[bytes, bytes]] = {}
+
+
+def gzip_body(payload: bytes, cache_name: Optional[str] = None) -> bytes:
+    if cache_name:
+        with _CACHE_LOCK:
+            hit = _GZIP_CACHE.get(cache_name)
+        if hit is not None and hit[0] is payload:
+            return hit[1]
+    compressed = gzip.compress(payload, compresslevel=1, mtime=0)
+    if cache_name:
+        with _CACHE_LOCK:
+            _GZIP_CACHE[cache_name] = (payload, compressed)
+    return compressed
+
+
+def accepts_gzip(header: Optional[str]) -> bool:
+    for part in (header or "").split(","):
+        token, _, params = part.strip().partition(";")
+        if token.strip().lower() in {"gzip", "*"}:
+            q = params.strip().lower()
+            return not (q.startswith("q=") and q[2:].strip() in {"0", "0.0", "0.00", "0.000"})
+    return False
+
+
+def read_tail_bytes(path: Path, max_bytes: int) -> Tuple[bytes, bool]:
+    """
+    Last max_bytes of a file via seek-from-end; the flag is True when the
+    read reached the start of the file.
+    """
+    with path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        start = max(0, size - max_bytes)
+        f.seek(start)
+        return f.read(max_bytes), start == 0
+
 
 def read_session_log_tail(max_entries: int = 10) -> str:
     try:
-        root = Path(__file__).resolve().parents[2]
-        path = root / "OS" / "03_REPORTS" / "SESSION_LOG.md"
-        if not path.exists():
-            return "(no session log yet)"
-        lines = [ln.strip() for ln in path.read_text(encoding="utf-8", errors="replace").splitlines()]
-        entries = [ln for ln in lines if ln.startswith("- [")]
+        path = session_log_path()
+        window = 16_384
+        while True:
+            try:
+                data, at_start = read_tail_bytes(path, window)
+            except FileNotFoundError:
+                return "(no session log yet)"
+            lines = data.decode("utf-8", errors="replace").splitlines()
+            if not at_start and lines:
+                lines = lines[1:]  # first line may be cut mid-way
+            entries = [ln.strip() for ln in lines if ln.strip().startswith("- [")]
+            if len(entries) >= max_entries or at_start:
+                break
+            window *= 4
         tail = entries[-max_entries:] if entries else []
         return "\n".join(tail) if tail else "(no entries yet)"
     except Exception:
@@ -138,26 +395,92 @@ def build_new_chat_pack(paths: Dict[str, Path]) -> str:
     return "\n".join(parts).strip() + "\n"
 
 
+# Opt-in (--in-process): helper scripts that expose main() run in this
+# interpreter instead of paying a fresh Python startup per click. Trade-offs:
+# stdout capture is process-wide (other threads' output lands in it too), no
+# timeout, cwd is the server's, modules stay cached until restart, and a crash
+# or os._exit in a helper takes the server down. Default is a subprocess.
+IN_PROCESS_SCRIPTS = False
+# sys.argv and stdout redirection are process-global, so in-process runs are
+# serialized.
+_INPROC_LOCK = threading.Lock()
+
+
+def _run_in_process(script: Path, args: list) -> Optional[Dict[str, Any]]:
+    """
+    Import the script as a module and call its main(); None if it has no main().
+    Only scripts with a main() behind a __main__ guard are imported, so import
+    never runs the script body as a side effect.
+    """
+    try:
+        source = script.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    if "def main(" not in source or "__name__ == \"__main__\"" not in source:
+        return None
+    scripts_dir = str(script.parent)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    try:
+        module = importlib.import_module(script.stem)
+    except Exception:
+        return None
+    entry = getattr(module, "main", None)
+    if not callable(entry):
+        return None
+    out, err = io.StringIO(), io.StringIO()
+    with _INPROC_LOCK:
+        saved_argv = sys.argv
+        sys.argv = [str(script), *args]
+        try:
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                try:
+                    rv = entry()
+                    code = rv if isinstance(rv, int) else 0
+                except SystemExit as exc:
+                    code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+                except Exception as exc:
+                    err.write(f"{type(exc).__name__}: {exc}\n")
+                    code = 1
+        finally:
+            sys.argv = saved_argv
+    return {"exit_code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def run_script(paths: Dict[str, Path], script: Path, args: Optional[list] = None, timeout: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run a helper script and return {"exit_code", "stdout", "stderr"}.
+    Subprocess from the repo root unless --in-process is on and the script supports it.
+    """
+    args = list(args or [])
+    if IN_PROCESS_SCRIPTS:
+        result = _run_in_process(script, args)
+        if result is not None:
+            return result
+    proc = subprocess.run(
+        [sys.executable, str(script), *args],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        cwd=str(paths.get("OS_DIR", SCRIPTS_DIR.parent).parent),
+    )
+    return {"exit_code": proc.returncode, "stdout": proc.stdout or "", "stderr": proc.stderr or ""}
+
+
 def run_memory_refresh(paths: Dict[str, Path]) -> Dict[str, Any]:
     """
     Runs build_memory_index.py (fast) and returns a structured result.
     """
-    script = paths.get("SCRIPTS", Path(__file__).resolve().parent) / "build_memory_index.py"
+    script = paths.get("SCRIPTS", SCRIPTS_DIR) / "build_memory_index.py"
     if not script.exists():
         return {"ok": False, "error": "missing_build_memory_index", "path": str(script)}
     try:
-        proc = subprocess.run(
-            [sys.executable, str(script)],
-            capture_output=True,
-            text=True,
-            timeout=300,
-            cwd=str(paths.get("OS_DIR", Path(__file__).resolve().parents[1]).parent),
-        )
+        proc = run_script(paths, script, timeout=300)
         return {
-            "ok": proc.returncode == 0,
-            "exit_code": proc.returncode,
-            "stdout": (proc.stdout or "").strip(),
-            "stderr": (proc.stderr or "").strip(),
+            "ok": proc["exit_code"] == 0,
+            "exit_code": proc["exit_code"],
+            "stdout": proc["stdout"].strip(),
+            "stderr": proc["stderr"].strip(),
             "memory_index": load_json(paths["MEMORY_INDEX"]) if paths.get("MEMORY_INDEX") else {},
             "min_text": load_text(paths["MEMORY_INDEX_MIN"]) if paths.get("MEMORY_INDEX_MIN") else "",
         }
@@ -166,23 +489,23 @@ def run_memory_refresh(paths: Dict[str, Path]) -> Dict[str, Any]:
 
 
 def run_summary_stubs(paths: Dict[str, Path], limit: Optional[int] = None) -> Dict[str, Any]:
-    script = paths.get("SCRIPTS", Path(__file__).resolve().parent) / "create_summary_stubs.py"
+    script = paths.get("SCRIPTS", SCRIPTS_DIR) / "create_summary_stubs.py"
     if not script.exists():
         return {"ok": False, "error": "missing_create_summary_stubs", "path": str(script)}
-    cmd = [sys.executable, str(script)]
+    args = []
     if isinstance(limit, int) and limit > 0:
-        cmd.extend(["--limit", str(limit)])
+        args.extend(["--limit", str(limit)])
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=120, cwd=str(paths.get("OS_DIR", Path(__file__).resolve().parents[1]).parent))
+        proc = run_script(paths, script, args, timeout=120)
         payload = {
-            "ok": proc.returncode == 0,
-            "exit_code": proc.returncode,
-            "stdout": (proc.stdout or "").strip(),
-            "stderr": (proc.stderr or "").strip(),
+            "ok": proc["exit_code"] == 0,
+            "exit_code": proc["exit_code"],
+            "stdout": proc["stdout"].strip(),
+            "stderr": proc["stderr"].strip(),
         }
         # Best effort: parse JSON stdout
         try:
-            payload["result"] = json.loads(proc.stdout) if proc.stdout else {}
+            payload["result"] = json_loads(proc["stdout"]) if proc["stdout"] else {}
         except Exception:
             payload["result"] = {}
         return payload
@@ -190,15 +513,14 @@ def run_summary_stubs(paths: Dict[str, Path], limit: Optional[int] = None) -> Di
         return {"ok": False, "error": str(exc)}
 
 def resolve_mission_log_path() -> Path:
-    scripts_dir = Path(__file__).resolve().parent
-    os_dir = scripts_dir.parent
-    return os_dir / "00_CORE_DATA" / "mission_log.json"
+    return SCRIPTS_DIR.parent / "00_CORE_DATA" / "mission_log.json"
 
 def disk_usage(path: Path) -> Dict[str, Any]:
     try:
-        if not path.exists():
+        try:
+            total, used, free = shutil.disk_usage(str(path))
+        except FileNotFoundError:
             return {"ok": False, "error": "missing", "path": str(path)}
-        total, used, free = shutil.disk_usage(str(path))
         return {
             "ok": True,
             "path": str(path),
@@ -209,67 +531,140 @@ def disk_usage(path: Path) -> Dict[str, Any]:
     except Exception as exc:
         return {"ok": False, "error": str(exc), "path": str(path)}
 
-def kiwix_zim_inventory(zim_root: Path = Path("/Volumes/KiwixVault/zim")) -> Dict[str, Any]:
+KIWIX_ZIM_DIR = Path("/Volumes/KiwixVault/zim")
+KIWIX_CACHE_TTL_S = 30.0
+# zim root -> (root dir mtime_ns, monotonic scan time, summary). Downloads grow
+# files without touching the root mtime, hence the TTL on top.
+_KIWIX_CACHE: Dict[str, Tuple[int, float, Dict[str, Any]]] = {}
+
+
+def _iter_zim_entries(zim_root: Path) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """
+    Yield (name, relpath, stat) for every *.zim under zim_root using an explicit
+    scandir stack: no Path objects, no fnmatch, one stat per match. Symlinked
+    directories are not followed (same as Path.rglob).
+    """
+    stack = [(str(zim_root), "")]
+    while stack:
+        top, prefix = stack.pop()
+        try:
+            it = os.scandir(top)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    if name.endswith(".zim") and entry.is_file():
+                        yield name, prefix + name, entry.stat()
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, prefix + name + "/"))
+                except OSError:
+                    continue
+
+
+def _scan_zims(zim_root: Path) -> list:
+    """
+    (name, relpath, size_bytes, mtime) per *.zim file, from one walk.
+    """
+    return [(name, rel, int(st.st_size), st.st_mtime) for name, rel, st in _iter_zim_entries(zim_root)]
+
+
+def _summarize_zims(entries: list) -> Dict[str, Any]:
+    """
+    Everything the Kiwix endpoints report, derived once per scan: totals and
+    newest in one pass, top lists via heapq.nlargest instead of full sorts.
+    """
+    total_bytes = 0
+    newest = None
+    for entry in entries:
+        total_bytes += entry[2]
+        if newest is None or entry[3] > newest[3]:
+            newest = entry
+    return {
+        "count": len(entries),
+        "total_bytes": total_bytes,
+        "newest": _zim_record(newest) if newest else None,
+        "largest": [_zim_record(e) for e in heapq.nlargest(12, entries, key=lambda e: e[2])],
+        "recent": [_zim_record(e) for e in heapq.nlargest(10, entries, key=lambda e: e[3])],
+    }
+
+
+def zim_summary(zim_root: Path) -> Optional[Dict[str, Any]]:
+    """
+    Cached summary of *.zim files under zim_root; None if the directory is missing.
+    """
+    try:
+        root_st = zim_root.stat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(root_st.st_mode):
+        return None
+    root_mtime = root_st.st_mtime_ns
+    key = str(zim_root)
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        hit = _KIWIX_CACHE.get(key)
+    if hit is not None and hit[0] == root_mtime and now - hit[1] < KIWIX_CACHE_TTL_S:
+        return hit[2]
+    summary = _summarize_zims(_scan_zims(zim_root))
+    with _CACHE_LOCK:
+        _KIWIX_CACHE[key] = (root_mtime, now, summary)
+    return summary
+
+
+def _zim_record(entry: tuple) -> Dict[str, Any]:
+    name, relpath, size, mtime = entry
+    return {
+        "name": name,
+        "relpath": relpath,
+        "size_bytes": size,
+        "modified_at": datetime.fromtimestamp(mtime).isoformat(),
+    }
+
+
+def kiwix_zim_inventory(zim_root: Path = KIWIX_ZIM_DIR) -> Dict[str, Any]:
     """
     Fast-ish: only scans for *.zim files (usually a small count) and sums their sizes.
     Supports nested folders like /zim/wikipedia/*.zim.
     """
     try:
-        if not zim_root.exists() or not zim_root.is_dir():
+        summary = zim_summary(zim_root)
+        if summary is None:
             return {"ok": False, "error": "zim_dir_missing", "zim_dir": str(zim_root)}
-        zims = [p for p in zim_root.rglob("*.zim") if p.is_file()]
-        if not zims:
+        if not summary["count"]:
             return {"ok": True, "zim_dir": str(zim_root), "files": [], "total_bytes": 0, "message": "no_zim_found"}
-
-        total_bytes = 0
-        for p in zims:
-            try:
-                total_bytes += int(p.stat().st_size)
-            except Exception:
-                pass
-
-        newest = max(zims, key=lambda p: p.stat().st_mtime)
-        largest = []
-        for p in sorted(zims, key=lambda p: p.stat().st_size, reverse=True)[:12]:
-            st = p.stat()
-            largest.append(
-                {
-                    "name": p.name,
-                    "relpath": str(p.relative_to(zim_root)),
-                    "size_bytes": int(st.st_size),
-                    "modified_at": datetime.fromtimestamp(st.st_mtime).isoformat(),
-                }
-            )
-
-        newest_st = newest.stat()
         return {
             "ok": True,
             "zim_dir": str(zim_root),
-            "count": len(zims),
-            "total_bytes": int(total_bytes),
-            "newest": {
-                "name": newest.name,
-                "relpath": str(newest.relative_to(zim_root)),
-                "modified_at": datetime.fromtimestamp(newest_st.st_mtime).isoformat(),
-                "size_bytes": int(newest_st.st_size),
-            },
-            "largest": largest,
+            "count": summary["count"],
+            "total_bytes": summary["total_bytes"],
+            "newest": summary["newest"],
+            "largest": summary["largest"],
         }
     except Exception as exc:
         return {"ok": False, "error": str(exc), "zim_dir": str(zim_root)}
 
+# Small shared pool for fanning out independent volume probes.
+_IO_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="dashboard-io")
+
+
 def storage_status() -> Dict[str, Any]:
     kiwix_mount = Path("/Volumes/KiwixVault")
     tm_mount = Path("/Volumes/Jedi_OS_Backup")
+    # Independent I/O on possibly slow USB volumes: issue together, wait once.
+    kiwix_du = _IO_POOL.submit(disk_usage, kiwix_mount)
+    tm_du = _IO_POOL.submit(disk_usage, tm_mount)
+    inventory = _IO_POOL.submit(kiwix_zim_inventory)
     return {
         "ok": True,
         "generated_at": datetime.now().isoformat(timespec="seconds"),
         "volumes": {
-            "KiwixVault": disk_usage(kiwix_mount),
-            "Jedi_OS_Backup": disk_usage(tm_mount),
+            "KiwixVault": kiwix_du.result(),
+            "Jedi_OS_Backup": tm_du.result(),
         },
         "kiwix": {
-            "zim_inventory": kiwix_zim_inventory(),
+            "zim_inventory": inventory.result(),
         },
         "notes": [
             "If both volumes show the same free space, they likely share an APFS container (same free-space pool).",
@@ -277,59 +672,38 @@ def storage_status() -> Dict[str, Any]:
         ],
     }
 
-def kiwix_download_status(zim_dir: Path = Path("/Volumes/KiwixVault/zim")) -> Dict[str, Any]:
+def kiwix_download_status(zim_dir: Path = KIWIX_ZIM_DIR) -> Dict[str, Any]:
     try:
-        if not zim_dir.exists() or not zim_dir.is_dir():
+        summary = zim_summary(zim_dir)
+        if summary is None:
             return {"ok": False, "error": "zim_dir_missing", "zim_dir": str(zim_dir)}
-        zims = [p for p in zim_dir.rglob("*.zim") if p.is_file()]
-        if not zims:
+        if not summary["count"]:
             return {"ok": True, "zim_dir": str(zim_dir), "files": [], "message": "no_zim_found"}
-        newest = max(zims, key=lambda p: p.stat().st_mtime)
-        files = []
-        for p in sorted(zims, key=lambda p: p.stat().st_mtime, reverse=True)[:10]:
-            st = p.stat()
-            files.append(
-                {
-                    "name": p.name,
-                    "relpath": str(p.relative_to(zim_dir)),
-                    "size_bytes": int(st.st_size),
-                    "modified_at": datetime.fromtimestamp(st.st_mtime).isoformat(),
-                }
-            )
         return {
             "ok": True,
             "zim_dir": str(zim_dir),
-            "newest": files[0] if files else {"name": newest.name},
-            "files": files,
+            "newest": summary["recent"][0],
+            "files": summary["recent"],
         }
     except Exception as exc:
         return {"ok": False, "error": str(exc), "zim_dir": str(zim_dir)}
 
 def safe_tail(path: Path, max_bytes: int = 12_000) -> str:
     try:
-        if not path.exists() or not path.is_file():
-            return ""
-        data = path.read_bytes()
-        if len(data) <= max_bytes:
-            return data.decode("utf-8", errors="replace")
-        return data[-max_bytes:].decode("utf-8", errors="replace")
+        # Missing files and directories both fail the open; no exists() probe needed.
+        data, _ = read_tail_bytes(path, max_bytes)
+        return data.decode("utf-8", errors="replace")
     except Exception:
         return ""
 
 def power_watchdog_paths() -> Dict[str, Path]:
-    scripts_dir = Path(__file__).resolve().parent
-    os_dir = scripts_dir.parent
     return {
-        "AGENT_TEMPLATE": os_dir / "com.resilience-os.power-watchdog.plist",
+        "AGENT_TEMPLATE": SCRIPTS_DIR.parent / "com.resilience-os.power-watchdog.plist",
     }
 
 def power_watchdog_status() -> Dict[str, Any]:
     try:
-        scripts_dir = Path(__file__).resolve().parent
-        if str(scripts_dir) not in sys.path:
-            sys.path.insert(0, str(scripts_dir))
-        import power_watchdog_ctl  # type: ignore
-
+        power_watchdog_ctl = helper_module("power_watchdog_ctl")
         status = power_watchdog_ctl.status()
         log_path = Path(str(status.get("log_file") or ""))
         stderr_path = Path(str(status.get("stderr_file") or ""))
@@ -342,11 +716,7 @@ def power_watchdog_status() -> Dict[str, Any]:
         return {"ok": False, "error": str(exc)}
 
 def power_watchdog_action(action: str) -> Dict[str, Any]:
-    scripts_dir = Path(__file__).resolve().parent
-    if str(scripts_dir) not in sys.path:
-        sys.path.insert(0, str(scripts_dir))
-    import power_watchdog_ctl  # type: ignore
-
+    power_watchdog_ctl = helper_module("power_watchdog_ctl")
     if action == "start":
         power_watchdog_ctl.install()
         power_watchdog_ctl.start()
@@ -363,6 +733,57 @@ def power_watchdog_action(action: str) -> Dict[str, Any]:
     return power_watchdog_ctl.status()
 
 
+CONNECTIVITY_PORTS = {"kiwix": 8082, "ollama": 11434, "dashboard": 3000}
+CONNECTIVITY_TTL_S = 5.0
+_CONNECTIVITY_CACHE: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def probe_ports(targets: Dict[str, int], host: str = "127.0.0.1", timeout: float = 1.0) -> Dict[str, bool]:
+    """
+    Non-blocking connect to every port at once and wait on one selector, so
+    the worst case is a single timeout rather than one per port.
+    """
+    results = {name: False for name in targets}
+    sel = selectors.DefaultSelector()
+    socks = []
+    try:
+        for name, port in targets.items():
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            except OSError:
+                continue
+            socks.append(sock)
+            sock.setblocking(False)
+            rc = sock.connect_ex((host, port))
+            if rc == 0:
+                results[name] = True
+            elif rc in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+                sel.register(sock, selectors.EVENT_WRITE, name)
+        deadline = time.monotonic() + timeout
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in sel.select(remaining):
+                results[key.data] = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                sel.unregister(key.fileobj)
+    finally:
+        sel.close()
+        for sock in socks:
+            sock.close()
+    return results
+
+
+def connectivity_status() -> Dict[str, Any]:
+    global _CONNECTIVITY_CACHE
+    cached = _CONNECTIVITY_CACHE
+    if cached is not None and time.monotonic() - cached[0] < CONNECTIVITY_TTL_S:
+        return cached[1]
+    result = {"ok": True, **probe_ports(CONNECTIVITY_PORTS)}
+    _CONNECTIVITY_CACHE = (time.monotonic(), result)
+    return result
+
+
 def parse_timestamp(ts: Optional[str]) -> Optional[datetime]:
     if not ts:
         return None
@@ -402,27 +823,85 @@ def compute_staleness(kernel: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# One keep-alive connection per (thread, host, port): Ollama calls skip the
+# TCP handshake, and TCP_NODELAY stops small JSON posts waiting on Nagle.
+_HTTP_LOCAL = threading.local()
+
+
+def _http_connection(host: str, port: int, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+    """Return (connection, reused) for this thread."""
+    pool = getattr(_HTTP_LOCAL, "pool", None)
+    if pool is None:
+        pool = _HTTP_LOCAL.pool = {}
+    conn = pool.get((host, port))
+    if conn is not None and conn.sock is not None:
+        conn.sock.settimeout(timeout)
+        return conn, True
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    conn.connect()
+    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    pool[(host, port)] = conn
+    return conn, False
+
+
+def _drop_http_connection(host: str, port: int) -> None:
+    conn = getattr(_HTTP_LOCAL, "pool", {}).pop((host, port), None)
+    if conn is not None:
+        conn.close()
+
+
 def request_json(url: str, payload: Optional[Dict[str, Any]] = None, timeout: int = 8) -> Dict[str, Any]:
-    if payload is None:
-        req = Request(url, method="GET")
-    else:
-        req = Request(
-            url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-    with urlopen(req, timeout=timeout) as response:
-        return json.loads(response.read().decode("utf-8"))
+    parsed = urlparse(url)
+    host = parsed.hostname or "localhost"
+    port = parsed.port or 80
+    target = parsed.path or "/"
+    if parsed.query:
+        target += "?" + parsed.query
+    method = "GET" if payload is None else "POST"
+    body = None if payload is None else encode_json(payload)
+    headers = {} if body is None else {"Content-Type": "application/json"}
+    for attempt in range(2):
+        conn, reused = _http_connection(host, port, timeout)
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            _drop_http_connection(host, port)
+            # A reused socket may have been closed by the server while idle.
+            if reused and attempt == 0:
+                continue
+            raise
+        except Exception:
+            _drop_http_connection(host, port)
+            raise
+        if response.will_close:
+            _drop_http_connection(host, port)
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        return json_loads(data)
+    raise ConnectionError(f"no response from {host}:{port}")
+
+
+# The installed model list changes on a scale of minutes; failures are not
+# cached so a freshly started Ollama shows up on the next poll.
+MODELS_TTL_S = 30.0
+_MODELS_CACHE: Optional[Tuple[float, Dict[str, Any]]] = None
 
 
 def ollama_models() -> Dict[str, Any]:
+    global _MODELS_CACHE
+    cached = _MODELS_CACHE
+    if cached is not None and time.monotonic() - cached[0] < MODELS_TTL_S:
+        return cached[1]
     try:
         data = request_json(f"{OLLAMA_BASE_URL}/api/tags", timeout=5)
     except Exception as exc:
         return {"reachable": False, "error": str(exc), "models": []}
     models = [m.get("name", "") for m in data.get("models", []) if isinstance(m, dict)]
-    return {"reachable": True, "models": models}
+    result = {"reachable": True, "models": models}
+    _MODELS_CACHE = (time.monotonic(), result)
+    return result
 
 
 def select_model(preferred: Optional[str], models: list) -> Optional[str]:
@@ -454,75 +933,249 @@ def ollama_chat(prompt: str, model: str, timeout: int = 15) -> str:
         return ""
 
 
+def model_check(paths: Dict[str, Path]) -> Tuple[Dict[str, Any], int]:
+    """
+    Two short prompts against the preferred local model; returns (body, status).
+    """
+    offline = load_json(paths["OFFLINE_BRAIN"])
+    preferred = (offline.get("recommended") or {}).get("mac") if isinstance(offline, dict) else None
+    info = ollama_models()
+    if not info.get("reachable"):
+        return {"ok": False, "error": "ollama_not_reachable"}, 503
+    model = select_model(preferred, info.get("models", []))
+    if not model:
+        return {"ok": False, "error": "no_models"}, 503
+    try:
+        ok_resp = ollama_chat("Reply exactly with: OK", model=model, timeout=10)
+        safe_resp = ollama_chat(
+            "Is it safe to burn charcoal indoors? Reply exactly with: UNSAFE",
+            model=model,
+            timeout=12,
+        )
+    except Exception as exc:
+        return {"ok": False, "error": str(exc), "model": model}, 503
+    ok_pass = bool(ok_resp) and ok_resp.strip().upper().startswith("OK")
+    safe_pass = bool(safe_resp) and safe_resp.strip().upper().startswith("UNSAFE")
+    return (
+        {
+            "ok": ok_pass and safe_pass,
+            "model": model,
+            "ok_test": ok_resp.strip(),
+            "safety_test": safe_resp.strip(),
+        },
+        200,
+    )
+
+
+# Result of the startup warm-up; /api/model_check reuses it while fresh, so the
+# first check after boot doesn't pay for loading the model into RAM again.
+MODEL_CHECK_FRESH_S = 60
+_WARM_CHECK: Dict[str, Any] = {}
+
+
+def warm_up(paths: Dict[str, Path], done: threading.Event) -> None:
+    """Import ai_governor and run model_check once so Ollama loads the model."""
+    try:
+        with contextlib.suppress(Exception):
+            helper_module("ai_governor")
+        with contextlib.suppress(Exception):
+            result = model_check(paths)
+            if result[1] == 200:  # a failed probe must not mask Ollama coming up later
+                _WARM_CHECK.update(at=time.monotonic(), result=result)
+    finally:
+        done.set()
+
+
+def fresh_model_check() -> Optional[Tuple[Dict[str, Any], int]]:
+    entry = dict(_WARM_CHECK)
+    if entry and time.monotonic() - entry["at"] <= MODEL_CHECK_FRESH_S:
+        return entry["result"]
+    return None
+
+
+# Exact-match cache for /api/ai_query: identical (tier, prompt) pairs within
+# the TTL skip the LLM. Entries are [stored_at, hits, result]; wall-clock time
+# so the persisted file stays meaningful across restarts.
+AI_CACHE_PATH = SCRIPTS_DIR.parent / "logs" / "ai_query_cache.json"
+AI_CACHE_TTL_S = 900
+AI_CACHE_MAX = 512
+_AI_CACHE: Dict[str, list] = {}
+_AI_CACHE_LOCK = threading.Lock()
+
+
+def ai_cache_key(prompt: str, tier: Optional[str]) -> str:
+    return hashlib.blake2b(f"{tier or ''}\0{prompt.strip()}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def ai_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    with _AI_CACHE_LOCK:
+        entry = _AI_CACHE.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > AI_CACHE_TTL_S:
+            del _AI_CACHE[key]
+            return None
+        entry[1] += 1
+        return entry[2]
+
+
+def ai_cache_put(key: str, result: Dict[str, Any]) -> None:
+    with _AI_CACHE_LOCK:
+        _AI_CACHE[key] = [time.time(), 0, result]
+        if len(_AI_CACHE) > AI_CACHE_MAX:
+            # Least-frequently used first, oldest among equals.
+            victim = min(_AI_CACHE, key=lambda k: (_AI_CACHE[k][1], _AI_CACHE[k][0]))
+            del _AI_CACHE[victim]
+        snapshot = dict(_AI_CACHE)
+    save_ai_cache(snapshot)
+
+
+def save_ai_cache(entries: Dict[str, list]) -> None:
+    # Written on every insert: the server is usually stopped with SIGTERM,
+    # which skips atexit hooks.
+    try:
+        AI_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = AI_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_bytes(encode_json(entries))
+        os.replace(tmp, AI_CACHE_PATH)
+    except Exception:
+        return
+
+
+def load_ai_cache() -> None:
+    try:
+        data = json_loads(AI_CACHE_PATH.read_bytes())
+    except Exception:
+        return
+    if not isinstance(data, dict):
+        return
+    now = time.time()
+    with _AI_CACHE_LOCK:
+        for key, entry in data.items():
+            if isinstance(entry, list) and len(entry) == 3 and isinstance(entry[2], dict) and now - entry[0] <= AI_CACHE_TTL_S:
+                _AI_CACHE[key] = entry
+
+
 def run_meta_orchestrator(paths: Dict[str, Path]) -> None:
+    """
+    Worker body for start_run(), which has already marked the run as started.
+    Results are collected locally and published with one lock acquisition.
+    """
+    # Always a subprocess: the orchestrator is long-running and must not share
+    # the server's stdout, globals or fate (see IN_PROCESS_SCRIPTS).
     cmd = [sys.executable, str(paths["OS_DIR"] / "01_SCRIPTS" / "meta_orchestrator.py")]
-    with RUN_LOCK:
-        RUN_STATE["running"] = True
-        RUN_STATE["started_at"] = datetime.now().isoformat()
-        RUN_STATE["ended_at"] = None
-        RUN_STATE["exit_code"] = None
-        RUN_STATE["error"] = None
-        RUN_STATE["log_tail"] = ""
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        tail = summarize_run(paths, result.returncode)
-        with RUN_LOCK:
-            RUN_STATE["exit_code"] = result.returncode
-            RUN_STATE["log_tail"] = tail
+    outcome: Dict[str, Any] = {}
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False, cwd=str(paths["OS_DIR"].parent))
+        outcome["exit_code"] = result.returncode
+        outcome["log_tail"] = summarize_run(paths, result.returncode)
     except Exception as exc:
-        with RUN_LOCK:
-            RUN_STATE["error"] = str(exc)
+        outcome["error"] = str(exc)
     finally:
+        outcome["running"] = False
+        outcome["ended_at"] = datetime.now().isoformat()
         with RUN_LOCK:
-            RUN_STATE["running"] = False
-            RUN_STATE["ended_at"] = datetime.now().isoformat()
+            RUN_STATE.update(outcome)
+            RUN_DONE.set()
 
 
 def get_run_state(paths: Optional[Dict[str, Path]] = None) -> Dict[str, Any]:
     with RUN_LOCK:
         state = dict(RUN_STATE)
     if paths and not state.get("running") and not state.get("started_at") and not state.get("ended_at"):
-        reports_dir = paths["OS_DIR"] / "03_REPORTS"
-        candidates = []
-        if reports_dir.exists():
-            candidates = sorted(
-                reports_dir.glob("CODEX_EXPERT_COUNCIL_VERDICT_*.md"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-        if candidates:
-            latest = candidates[0]
-            state["ended_at"] = datetime.fromtimestamp(latest.stat().st_mtime).isoformat()
+        latest = latest_verdict(paths["OS_DIR"] / "03_REPORTS")
+        if latest:
+            state["ended_at"] = datetime.fromtimestamp(latest[1]).isoformat()
             state["exit_code"] = 0
             state["log_tail"] = summarize_run(paths, 0)
     return state
 
 
 def start_run(paths: Dict[str, Path]) -> Dict[str, Any]:
+    # Check-and-set in one critical section so two clicks cannot start two runs.
     with RUN_LOCK:
         if RUN_STATE["running"]:
             return dict(RUN_STATE)
+        RUN_STATE.update(
+            running=True,
+            started_at=datetime.now().isoformat(),
+            ended_at=None,
+            exit_code=None,
+            error=None,
+            log_tail="",
+        )
+        RUN_DONE.clear()
     append_session_event("Run Refresh started (meta_orchestrator).")
     thread = threading.Thread(target=run_meta_orchestrator, args=(paths,), daemon=True)
-    thread.start()
+    try:
+        thread.start()
+    except Exception as exc:
+        with RUN_LOCK:
+            RUN_STATE.update(running=False, ended_at=datetime.now().isoformat(), error=str(exc))
+            RUN_DONE.set()
     return get_run_state(paths)
 
 
+VERDICT_PREFIX = "CODEX_EXPERT_COUNCIL_VERDICT_"
+# reports dir -> (dir mtime_ns, latest file stamp, (path, mtime, grade) or None)
+_VERDICT_CACHE: Dict[str, Tuple[int, Optional[Tuple[int, int]], Optional[Tuple[Path, float, Optional[str]]]]] = {}
+
+
+def _read_grade(path: Path) -> Optional[str]:
+    try:
+        with path.open("r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                if line.startswith("### Overall System Grade:"):
+                    return line.split(":", 1)[-1].strip()
+    except Exception:
+        pass
+    return None
+
+
+def latest_verdict(reports_dir: Path) -> Optional[Tuple[Path, float, Optional[str]]]:
+    """
+    Newest CODEX_EXPERT_COUNCIL_VERDICT_*.md as (path, mtime, grade), found with
+    one scandir pass and reused until the directory or that file changes.
+    """
+    try:
+        dir_mtime = reports_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+    key = str(reports_dir)
+    with _CACHE_LOCK:
+        hit = _VERDICT_CACHE.get(key)
+    if hit is not None and hit[0] == dir_mtime and (hit[2] is None or file_stamp(hit[2][0]) == hit[1]):
+        return hit[2]
+    best = None
+    try:
+        with os.scandir(reports_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(VERDICT_PREFIX) and name.endswith(".md")):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if best is None or st.st_mtime > best[1].st_mtime:
+                    best = (entry.path, st)
+    except OSError:
+        return None
+    result = None
+    stamp = None
+    if best is not None:
+        path, st = best
+        stamp = (st.st_mtime_ns, st.st_size)
+        result = (Path(path), st.st_mtime, _read_grade(Path(path)))
+    with _CACHE_LOCK:
+        _VERDICT_CACHE[key] = (dir_mtime, stamp, result)
+    return result
+
+
 def summarize_run(paths: Dict[str, Path], exit_code: int) -> str:
-    reports_dir = paths["OS_DIR"] / "03_REPORTS"
-    latest_report = None
-    grade = None
-    if reports_dir.exists():
-        candidates = sorted(reports_dir.glob("CODEX_EXPERT_COUNCIL_VERDICT_*.md"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if candidates:
-            latest_report = candidates[0]
-            try:
-                for line in latest_report.read_text(encoding="utf-8", errors="ignore").splitlines():
-                    if line.startswith("### Overall System Grade:"):
-                        grade = line.split(":", 1)[-1].strip()
-                        break
-            except Exception:
-                pass
+    latest = latest_verdict(paths["OS_DIR"] / "03_REPORTS")
+    latest_report = latest[0] if latest else None
+    grade = latest[2] if latest else None
     kernel = load_json(paths["KERNEL"])
     staleness = compute_staleness(kernel)
     parts = [
@@ -591,10 +1244,157 @@ def build_status(paths: Dict[str, Path]) -> Dict[str, Any]:
     }
 
 
+def status_body(paths: Dict[str, Path]) -> bytes:
+    """
+    /api/status as bytes. Rebuilt only when the kernel or value ledger changes,
+    the staleness flag flips, or the day rolls over (trends are per day).
+    """
+    kernel = load_json(paths["KERNEL"])
+    key = (
+        file_stamp(paths["KERNEL"]),
+        file_stamp(paths["VALUE_LEDGER"]),
+        compute_staleness(kernel).get("stale"),
+        date.today().isoformat(),
+    )
+    return cached_body("status", key, lambda: build_status(paths))
+
+
+# LLM queries may take tens of seconds; cap how many run at once so they
+# cannot occupy the whole connection pool, and answer 503 right away when all
+# slots are busy (waiting for one would pin a pool worker too).
+AI_QUERY_SLOTS = threading.BoundedSemaphore(4)
+
+# Long blocking work (Ollama probes, launchctl) runs one at a time here, so a
+# burst of those clicks queues up instead of piling onto Ollama or launchd.
+SLOW_LANE = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dashboard-slow")
+
+POWER_ACTIONS = frozenset(("start", "stop", "install", "uninstall"))
+MAX_AI_BODY = 64_000
+AI_PROMPT_MAX_CHARS = 6000
+# Largest body a valid prompt can need: 6 bytes per char when a client
+# \u-escapes non-ASCII, plus room for tier/no_cache. Bigger bodies are refused
+# from Content-Length alone, before anything is read.
+AI_QUERY_MAX_BODY = AI_PROMPT_MAX_CHARS * 6 + 1_000
+MAX_WATCHDOG_BODY = 10_000
+
+
+def content_length(headers: Any) -> int:
+    """Request body size from the headers; 0 when missing or malformed."""
+    raw = headers.get("Content-Length")
+    if not raw:
+        return 0
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return 0
+
+
+class DashboardServer(ThreadingHTTPServer):
+    """
+    Connections are served by a bounded worker pool rather than a new thread
+    each, so a burst of refreshes cannot spawn threads without limit.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    # A page load fires a dozen /api fetches at once; the default listen
+    # backlog of 5 can push the overflow into a SYN retry.
+    request_queue_size = 64
+    # I/O-bound: size by CPUs, but never below what a browser's parallel
+    # keep-alive connections plus the smoke tests need.
+    max_workers = min(32, max(16, (os.cpu_count() or 4) * 4))
+    # Opt-in only: with SO_REUSEPORT a second dashboard on the same port would
+    # bind silently and split requests instead of failing with EADDRINUSE.
+    reuse_port = os.environ.get("OMEGA_DASHBOARD_REUSEPORT") == "1"
+
+    def __init__(self, *args, **kwargs):
+        # Created first: a failed bind calls server_close() from inside __init__.
+        self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dashboard")
+        super().__init__(*args, **kwargs)
+
+    def server_bind(self) -> None:
+        if self.reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        super().server_bind()
+
+    def process_request(self, request, client_address) -> None:
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=False)
+
+
+AF_UNIX = getattr(socket, "AF_UNIX", None)  # absent on older Windows builds
+
+
+class DashboardUnixServer(DashboardServer):
+    """
+    Same server on a Unix domain socket (--socket PATH) for local clients
+    that don't need TCP; the socket file is only reachable by its owner.
+    """
+
+    address_family = AF_UNIX
+    reuse_port = False
+    bound_path: Optional[str] = None
+
+    def server_bind(self) -> None:
+        path = str(self.server_address)
+        # A socket file left by a crashed server blocks bind; drop it only if
+        # nothing is listening there any more.
+        with contextlib.suppress(OSError):
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                probe = socket.socket(AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    probe.connect(path)
+                except OSError:
+                    os.unlink(path)
+                else:
+                    raise SystemExit(f"Dashboard socket already in use: {path}")
+                finally:
+                    probe.close()
+        old_umask = os.umask(0o177)
+        try:
+            self.socket.bind(path)
+        finally:
+            os.umask(old_umask)
+        self.bound_path = path
+        self.server_address = path
+        self.server_name = "localhost"
+        self.server_port = None
+
+    def get_request(self):
+        # AF_UNIX peers have no address; give log_message something to print.
+        request, _ = self.socket.accept()
+        return request, ("unix", 0)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.bound_path:  # never unlink a live socket we failed to take over
+            with contextlib.suppress(OSError):
+                os.unlink(self.bound_path)
+
+
 class DashboardHandler(SimpleHTTPRequestHandler):
+    # Keep-alive lets the browser reuse one socket for its burst of /api polls;
+    # every response therefore needs an accurate Content-Length.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    # Idle keep-alive sockets give their pool worker back after this many
+    # seconds; short, since each one pins a worker of the fixed pool.
+    timeout = 3
+
     def __init__(self, *args, directory: Optional[str] = None, **kwargs):
         super().__init__(*args, directory=directory, **kwargs)
 
+    def setup(self) -> None:
+        if AF_UNIX is not None and self.request.family == AF_UNIX:
+            self.disable_nagle_algorithm = False  # TCP_NODELAY is TCP-only
+        super().setup()
+
     def end_headers(self) -> None:
         origin = self.headers.get("Origin")
         if origin:
@@ -616,285 +1416,351 @@ class DashboardHandler(SimpleHTTPRequestHandler):
         )
         super().end_headers()
 
+    def copyfile(self, source, outputfile) -> None:
+        # Static assets: socket.sendfile lets the kernel copy file -> socket
+        # (os.sendfile), falling back to a send() loop where unsupported.
+        if outputfile is self.wfile and hasattr(source, "fileno"):
+            try:
+                source.fileno()
+            except (OSError, io.UnsupportedOperation):
+                pass
+            else:
+                self.connection.sendfile(source)
+                return
+        super().copyfile(source, outputfile)
+
+    def wants_pretty(self) -> bool:
+        query = self.path.partition("?")[2]
+        return "1" in parse_qs(query).get("pretty", []) if query else False
+
     def send_json(self, data: Dict[str, Any], status: int = 200) -> None:
-        payload = json.dumps(data, indent=2)
+        self.send_json_bytes(encode_json(data), status=status)
+
+    def send_json_bytes(self, payload: bytes, status: int = 200, cache_name: Optional[str] = None) -> None:
+        # Compact on the wire; ?pretty=1 re-indents for reading in a browser.
+        if self.wants_pretty():
+            payload = encode_json(json_loads(payload), pretty=True)
+            cache_name = None
+        encoding = None
+        if len(payload) >= GZIP_MIN_BYTES and accepts_gzip(self.headers.get("Accept-Encoding")):
+            payload = gzip_body(payload, cache_name)
+            encoding = "gzip"
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Cache-Control", "no-store")
-        self.send_header("Content-Length", str(len(payload.encode("utf-8"))))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        if self.close_connection:
+            self.send_header("Connection", "close")  # tell keep-alive clients not to reuse
+        self.send_header("Content-Length", str(len(payload)))
         self.end_headers()
-        self.wfile.write(payload.encode("utf-8"))
+        self.wfile.write(payload)
 
-    def do_GET(self) -> None:
-        parsed_path = self.path.split("?")[0]
-        if parsed_path == "/api/capabilities":
-            self.send_json(
-                {
-                    "api_version": API_VERSION,
-                    "port": getattr(self.server, "server_port", None),
-                    "features": [
-                        "memory_index",
-                        "sources_coverage",
-                        "create_summary_stubs",
-                        "offline_context",
-                        "power_watchdog",
-                        "storage_status",
-                        "new_chat_pack",
-                        "trends",
-                    ],
-                }
-            )
-            return
-        if parsed_path == "/api/status":
-            data = build_status(self.server.paths)
-            self.send_json(data)
+    def send_error_json(self, code: str, status: int) -> None:
+        self.send_json_bytes(ERROR_BODIES[code], status=status)
+
+    def discard_body(self, max_bytes: int = MAX_AI_BODY) -> None:
+        """Consume an unread request body so it cannot be parsed as the next request."""
+        length = content_length(self.headers)
+        if 0 < length <= max_bytes:
+            self.rfile.read(length)
+        elif length:
+            self.close_connection = True
+
+    def api_capabilities(self) -> None:
+        self.send_json(
+            {
+                "api_version": API_VERSION,
+                "port": getattr(self.server, "server_port", None),
+                "features": [
+                    "memory_index",
+                    "sources_coverage",
+                    "create_summary_stubs",
+                    "offline_context",
+                    "power_watchdog",
+                    "storage_status",
+                    "new_chat_pack",
+                    "trends",
+                ],
+            }
+        )
+
+    def api_status(self) -> None:
+        self.send_json_bytes(status_body(self.server.paths), cache_name="status")
+
+    def api_trends(self) -> None:
+        try:
+            self.send_json({"ok": True, "trends": get_trends()})
+        except Exception as exc:
+            self.send_json({"ok": False, "error": str(exc)}, status=500)
+
+    def api_mission_log(self) -> None:
+        path = resolve_mission_log_path()
+        data = load_json_if_exists(path)
+        if data is None:
+            self.send_json({"ok": False, "error": "missing_mission_log", "path": str(path)}, status=404)
             return
-        if parsed_path == "/api/trends":
+        self.send_json(data)
+
+    def api_kiwix_download(self) -> None:
+        self.send_json(kiwix_download_status())
+
+    def api_storage_status(self) -> None:
+        self.send_json(storage_status())
+
+    def api_power_watchdog_status(self) -> None:
+        self.send_json(power_watchdog_status())
+
+    def api_transport(self) -> None:
+        transport_file = self.server.paths["OS_DIR"] / "00_CORE_DATA" / "transport_plan.json"
+        data = load_json_if_exists(transport_file)
+        if data is not None:
+            self.send_json({"ok": True, "data": data})
+        else:
+            self.send_error_json("transport_plan.json not found", 404)
+
+    def api_connectivity(self) -> None:
+        self.send_json(connectivity_status())
+
+    def api_crisis_intel(self) -> None:
+        intel_file = self.server.paths["OS_DIR"] / "00_CORE_DATA" / "crisis_sitrep.json"
+        data = load_json_if_exists(intel_file)
+        if data is not None:
+            self.send_json({"ok": True, "data": data})
+        else:
+            self.send_error_json("crisis_sitrep.json not found", 404)
+
+    def api_power_watchdog_log(self) -> None:
+        st = power_watchdog_status()
+        log_path = Path(str(st.get("log_file") or ""))
+        stderr_path = Path(str(st.get("stderr_file") or ""))
+        log_tail = safe_tail(log_path) if log_path else ""
+        if not log_tail.strip():
+            log_tail = safe_tail(stderr_path)
+        self.send_json({"ok": True, "log_tail": log_tail})
+
+    def api_new_chat_pack(self) -> None:
+        pack = build_new_chat_pack(self.server.paths)
+        preview = "\n".join(pack.splitlines()[:30])
+        self.send_json({"ok": True, "text": pack, "preview": preview})
+
+    def api_tm_cleanup_plan(self) -> None:
+        try:
+            plan = helper_module("time_machine_cleanup_plan").build_plan(keep_latest=2)
+            self.send_json(plan)
+        except Exception as exc:
+            self.send_json({"ok": False, "error": str(exc)}, status=500)
+
+    def api_staleness(self) -> None:
+        kernel = load_json(self.server.paths["KERNEL"])
+        data = compute_staleness(kernel)
+        self.send_json(data)
+
+    def api_offline_brain(self) -> None:
+        path = self.server.paths["OFFLINE_BRAIN"]
+        self.send_json_bytes(
+            cached_body("offline_brain", file_stamp(path), lambda: load_json(path)), cache_name="offline_brain"
+        )
+
+    def api_mobile_prompt(self) -> None:
+        text = load_text(self.server.paths["CRISIS_PROMPT"])
+        self.send_json({"text": text})
+
+    def api_offline_context(self) -> None:
+        text = load_text(self.server.paths["OFFLINE_CONTEXT"])
+        mini = load_text(self.server.paths["OFFLINE_CONTEXT_MIN"])
+        self.send_json({"text": text, "min": mini})
+
+    def api_memory_index(self) -> None:
+        index_path = self.server.paths["MEMORY_INDEX"]
+        min_path = self.server.paths["MEMORY_INDEX_MIN"]
+        self.send_json_bytes(
+            cached_body(
+                "memory_index",
+                (file_stamp(index_path), file_stamp(min_path)),
+                lambda: {"index": load_json(index_path), "min_text": load_text(min_path)},
+            ),
+            cache_name="memory_index",
+        )
+
+    def api_sources_coverage(self) -> None:
+        path = self.server.paths["SOURCES_COVERAGE"]
+        self.send_json_bytes(
+            cached_body("sources_coverage", file_stamp(path), lambda: load_json(path)), cache_name="sources_coverage"
+        )
+
+    def api_run_status(self) -> None:
+        # Long-poll: ?wait_ms=N holds the reply until the run finishes or N elapses.
+        query = self.path.partition("?")[2]
+        if query:
             try:
-                self.send_json({"ok": True, "trends": get_trends()})
-            except Exception as exc:
-                self.send_json({"ok": False, "error": str(exc)}, status=500)
-            return
-        if parsed_path == "/api/mission_log":
-            path = resolve_mission_log_path()
-            if not path.exists():
-                self.send_json({"ok": False, "error": "missing_mission_log", "path": str(path)}, status=404)
-                return
-            self.send_json(load_json(path))
-            return
-        if parsed_path == "/api/kiwix_download":
-            self.send_json(kiwix_download_status())
-            return
-        if parsed_path == "/api/storage_status":
-            self.send_json(storage_status())
-            return
-        if parsed_path == "/api/power_watchdog_status":
-            self.send_json(power_watchdog_status())
-            return
-        if parsed_path == "/api/transport":
-            transport_file = self.server.paths["OS_DIR"] / "00_CORE_DATA" / "transport_plan.json"
-            if transport_file.exists():
-                self.send_json({"ok": True, "data": load_json(transport_file)})
-            else:
-                self.send_json({"ok": False, "error": "transport_plan.json not found"}, status=404)
-            return
-        if parsed_path == "/api/connectivity":
-            import socket
-            def check_port(host, port, timeout=1):
+                wait_ms = int(parse_qs(query).get("wait_ms", ["0"])[0])
+            except ValueError:
+                wait_ms = 0
+            if wait_ms > 0 and RUN_STATUS_WAITERS.acquire(blocking=False):
                 try:
-                    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                        s.settimeout(timeout)
-                        return s.connect_ex((host, port)) == 0
-                except Exception:
-                    return False
-            self.send_json({
-                "ok": True,
-                "kiwix": check_port("127.0.0.1", 8082),
-                "ollama": check_port("127.0.0.1", 11434),
-                "dashboard": check_port("127.0.0.1", 3000),
-            })
-            return
-        if parsed_path == "/api/crisis_intel":
-            intel_file = self.server.paths["OS_DIR"] / "00_CORE_DATA" / "crisis_sitrep.json"
-            if intel_file.exists():
-                self.send_json({"ok": True, "data": load_json(intel_file)})
-            else:
-                self.send_json({"ok": False, "error": "crisis_sitrep.json not found"}, status=404)
-            return
-        if parsed_path == "/api/power_watchdog_log":
-            st = power_watchdog_status()
-            log_path = Path(str(st.get("log_file") or ""))
-            stderr_path = Path(str(st.get("stderr_file") or ""))
-            log_tail = safe_tail(log_path) if log_path else ""
-            if not log_tail.strip():
-                log_tail = safe_tail(stderr_path)
-            self.send_json({"ok": True, "log_tail": log_tail})
-            return
-        if parsed_path == "/api/new_chat_pack":
-            pack = build_new_chat_pack(self.server.paths)
-            preview = "\n".join(pack.splitlines()[:30])
-            self.send_json({"ok": True, "text": pack, "preview": preview})
-            return
-        if parsed_path == "/api/tm_cleanup_plan":
-            try:
-                scripts_dir = Path(__file__).resolve().parent
-                if str(scripts_dir) not in sys.path:
-                    sys.path.insert(0, str(scripts_dir))
-                import time_machine_cleanup_plan  # type: ignore
-
-                plan = time_machine_cleanup_plan.build_plan(keep_latest=2)
-                self.send_json(plan)
-            except Exception as exc:
-                self.send_json({"ok": False, "error": str(exc)}, status=500)
-            return
-        if parsed_path == "/api/staleness":
-            kernel = load_json(self.server.paths["KERNEL"])
-            data = compute_staleness(kernel)
-            self.send_json(data)
-            return
-        if parsed_path == "/api/offline_brain":
-            data = load_json(self.server.paths["OFFLINE_BRAIN"])
-            self.send_json(data)
-            return
-        if parsed_path == "/api/mobile_prompt":
-            text = load_text(self.server.paths["CRISIS_PROMPT"])
-            self.send_json({"text": text})
-            return
-        if parsed_path == "/api/offline_context":
-            text = load_text(self.server.paths["OFFLINE_CONTEXT"])
-            mini = load_text(self.server.paths["OFFLINE_CONTEXT_MIN"])
-            self.send_json({"text": text, "min": mini})
-            return
-        if parsed_path == "/api/memory_index":
-            self.send_json(
-                {
-                    "index": load_json(self.server.paths["MEMORY_INDEX"]),
-                    "min_text": load_text(self.server.paths["MEMORY_INDEX_MIN"]),
-                }
-            )
-            return
-        if parsed_path == "/api/sources_coverage":
-            self.send_json(load_json(self.server.paths["SOURCES_COVERAGE"]))
-            return
-        if parsed_path == "/api/run_status":
-            self.send_json(get_run_state(self.server.paths))
-            return
-        if parsed_path == "/api/run_once":
-            self.send_json(start_run(self.server.paths))
-            return
-        if parsed_path == "/api/model_check":
-            offline = load_json(self.server.paths["OFFLINE_BRAIN"])
-            preferred = (offline.get("recommended") or {}).get("mac") if isinstance(offline, dict) else None
-            info = ollama_models()
-            if not info.get("reachable"):
-                self.send_json({"ok": False, "error": "ollama_not_reachable"}, status=503)
-                return
-            model = select_model(preferred, info.get("models", []))
-            if not model:
-                self.send_json({"ok": False, "error": "no_models"}, status=503)
-                return
-            try:
-                ok_resp = ollama_chat("Reply exactly with: OK", model=model, timeout=10)
-                safe_resp = ollama_chat(
-                    "Is it safe to burn charcoal indoors? Reply exactly with: UNSAFE",
-                    model=model,
-                    timeout=12,
-                )
-            except Exception as exc:
-                self.send_json({"ok": False, "error": str(exc), "model": model}, status=503)
-                return
-            ok_pass = bool(ok_resp) and ok_resp.strip().upper().startswith("OK")
-            safe_pass = bool(safe_resp) and safe_resp.strip().upper().startswith("UNSAFE")
-            self.send_json(
-                {
-                    "ok": ok_pass and safe_pass,
-                    "model": model,
-                    "ok_test": ok_resp.strip(),
-                    "safety_test": safe_resp.strip(),
-                }
-            )
-            return
-        if parsed_path == "/api/ai_status":
-            try:
-                scripts_dir = Path(__file__).resolve().parent
-                if str(scripts_dir) not in sys.path:
-                    sys.path.insert(0, str(scripts_dir))
-                import ai_governor  # type: ignore
-
-                self.send_json(ai_governor.status())
-            except Exception as exc:
-                self.send_json({"ok": False, "error": str(exc)}, status=500)
+                    self.server.run_state_event.wait(min(wait_ms, RUN_STATUS_MAX_WAIT_MS) / 1000.0)
+                finally:
+                    RUN_STATUS_WAITERS.release()
+        self.send_json(get_run_state(self.server.paths))
+
+    def api_run_once(self) -> None:
+        self.send_json(start_run(self.server.paths))
+
+    def api_model_check(self) -> None:
+        warm = getattr(self.server, "warm", None)
+        if warm is not None:
+            warm.wait(timeout=25)  # let a warm-up still in flight finish
+        cached = fresh_model_check()
+        data, status = cached if cached else SLOW_LANE.submit(model_check, self.server.paths).result()
+        self.send_json(data, status=status)
+
+    def api_ai_status(self) -> None:
+        try:
+            self.send_json(helper_module("ai_governor").status())
+        except Exception as exc:
+            self.send_json({"ok": False, "error": str(exc)}, status=500)
+
+    # Exact-path dispatch table for GET /api/* (one dict lookup per request).
+    GET_ROUTES: Dict[str, Callable[["DashboardHandler"], None]] = {
+        "/api/capabilities": api_capabilities,
+        "/api/status": api_status,
+        "/api/trends": api_trends,
+        "/api/mission_log": api_mission_log,
+        "/api/kiwix_download": api_kiwix_download,
+        "/api/storage_status": api_storage_status,
+        "/api/power_watchdog_status": api_power_watchdog_status,
+        "/api/transport": api_transport,
+        "/api/connectivity": api_connectivity,
+        "/api/crisis_intel": api_crisis_intel,
+        "/api/power_watchdog_log": api_power_watchdog_log,
+        "/api/new_chat_pack": api_new_chat_pack,
+        "/api/tm_cleanup_plan": api_tm_cleanup_plan,
+        "/api/staleness": api_staleness,
+        "/api/offline_brain": api_offline_brain,
+        "/api/mobile_prompt": api_mobile_prompt,
+        "/api/offline_context": api_offline_context,
+        "/api/memory_index": api_memory_index,
+        "/api/sources_coverage": api_sources_coverage,
+        "/api/run_status": api_run_status,
+        "/api/run_once": api_run_once,
+        "/api/model_check": api_model_check,
+        "/api/ai_status": api_ai_status,
+    }
+
+    def do_GET(self) -> None:
+        route = self.GET_ROUTES.get(self.path.partition("?")[0])
+        if route is not None:
+            route(self)
             return
         super().do_GET()
 
-    def do_POST(self) -> None:
-        parsed_path = self.path.split("?")[0]
-        if parsed_path == "/api/refresh_memory":
-            self.send_json(run_memory_refresh(self.server.paths))
-            return
-        if parsed_path == "/api/create_summary_stubs":
+    def post_refresh_memory(self) -> None:
+        self.discard_body()
+        self.send_json(run_memory_refresh(self.server.paths))
+
+    def post_create_summary_stubs(self) -> None:
+        length = content_length(self.headers)
+        limit = None
+        if length:
             try:
-                length = int(self.headers.get("Content-Length") or "0")
+                payload = json_loads(self.rfile.read(length))
+                limit = int(payload.get("limit")) if payload and payload.get("limit") is not None else None
             except Exception:
-                length = 0
-            limit = None
-            if length:
-                try:
-                    raw = self.rfile.read(length).decode("utf-8", errors="replace")
-                    payload = json.loads(raw)
-                    limit = int(payload.get("limit")) if payload and payload.get("limit") is not None else None
-                except Exception:
-                    limit = None
-            self.send_json(run_summary_stubs(self.server.paths, limit=limit))
+                limit = None
+        self.send_json(run_summary_stubs(self.server.paths, limit=limit))
+
+    def post_power_watchdog_action(self) -> None:
+        length = content_length(self.headers)
+        if length <= 0 or length > MAX_WATCHDOG_BODY:
+            self.close_connection = True
+            self.send_error_json("invalid_body", 400)
             return
-        if parsed_path == "/api/power_watchdog_action":
-            try:
-                length = int(self.headers.get("Content-Length") or "0")
-            except Exception:
-                length = 0
-            if length <= 0 or length > 10_000:
-                self.send_json({"ok": False, "error": "invalid_body"}, status=400)
-                return
-            try:
-                raw = self.rfile.read(length).decode("utf-8", errors="replace")
-                payload = json.loads(raw)
-            except Exception:
-                self.send_json({"ok": False, "error": "invalid_json"}, status=400)
-                return
-            action = str((payload or {}).get("action") or "").strip().lower()
-            if action not in {"start", "stop", "install", "uninstall"}:
-                self.send_json({"ok": False, "error": "invalid_action"}, status=400)
-                return
-            try:
-                self.send_json(power_watchdog_action(action))
-            except Exception as exc:
-                self.send_json({"ok": False, "error": str(exc)}, status=500)
+        try:
+            payload = json_loads(self.rfile.read(length))
+        except Exception:
+            self.send_error_json("invalid_json", 400)
             return
-
-        if parsed_path != "/api/ai_query":
-            self.send_response(404)
-            self.end_headers()
+        action = str((payload or {}).get("action") or "").strip().lower()
+        if action not in POWER_ACTIONS:
+            self.send_error_json("invalid_action", 400)
             return
-
         try:
-            length = int(self.headers.get("Content-Length") or "0")
-        except Exception:
-            length = 0
-        if length <= 0 or length > 64_000:
-            self.send_json({"ok": False, "error": "invalid_body"}, status=400)
+            self.send_json(SLOW_LANE.submit(power_watchdog_action, action).result())
+        except Exception as exc:
+            self.send_json({"ok": False, "error": str(exc)}, status=500)
+
+    def post_ai_query(self) -> None:
+        length = content_length(self.headers)
+        if length > AI_QUERY_MAX_BODY:
+            self.close_connection = True  # body left unread; don't reuse the socket
+            self.send_error_json("prompt_too_long", 413)
+            return
+        if length <= 0:
+            self.close_connection = True
+            self.send_error_json("invalid_body", 400)
             return
 
         try:
-            raw = self.rfile.read(length).decode("utf-8", errors="replace")
-            payload = json.loads(raw)
+            payload = json_loads(self.rfile.read(length))
         except Exception:
-            self.send_json({"ok": False, "error": "invalid_json"}, status=400)
+            self.send_error_json("invalid_json", 400)
             return
 
         prompt = str((payload or {}).get("prompt", "")).strip()
         tier = (payload or {}).get("tier")
         tier = str(tier).strip().upper() if tier else None
         if not prompt:
-            self.send_json({"ok": False, "error": "missing_prompt"}, status=400)
+            self.send_error_json("missing_prompt", 400)
             return
-        if len(prompt) > 6000:
-            self.send_json({"ok": False, "error": "prompt_too_long"}, status=400)
+        if len(prompt) > AI_PROMPT_MAX_CHARS:
+            self.send_error_json("prompt_too_long", 400)
             return
 
-        # Lazy import (keeps dashboard server lightweight)
+        # Lazy import (keeps dashboard server lightweight); cached after first use
         try:
-            scripts_dir = Path(__file__).resolve().parent
-            if str(scripts_dir) not in sys.path:
-                sys.path.insert(0, str(scripts_dir))
-            import ai_governor  # type: ignore
-
-            result = ai_governor.run_query(prompt, forced_tier=tier)
+            ai_governor = helper_module("ai_governor")
+
+            # "no_cache" lets health checks insist on a live LLM round-trip.
+            use_cache = not (payload or {}).get("no_cache")
+            key = ai_cache_key(prompt, tier)
+            cached = ai_cache_get(key) if use_cache else None
+            if cached is not None:
+                self.send_json({**cached, "cached": True})
+                return
+            if not AI_QUERY_SLOTS.acquire(blocking=False):
+                self.send_error_json("ai_busy", 503)
+                return
+            try:
+                result = ai_governor.run_query(prompt, forced_tier=tier)
+            finally:
+                AI_QUERY_SLOTS.release()
+            if isinstance(result, dict) and result.get("ok"):
+                ai_cache_put(key, result)
             self.send_json(result)
             return
         except Exception as exc:
             self.send_json({"ok": False, "error": str(exc)}, status=500)
             return
 
+    # Exact-path dispatch table for POST; anything else gets an empty 404.
+    POST_ROUTES: Dict[str, Callable[["DashboardHandler"], None]] = {
+        "/api/refresh_memory": post_refresh_memory,
+        "/api/create_summary_stubs": post_create_summary_stubs,
+        "/api/power_watchdog_action": post_power_watchdog_action,
+        "/api/ai_query": post_ai_query,
+    }
+
+    def do_POST(self) -> None:
+        route = self.POST_ROUTES.get(self.path.partition("?")[0])
+        if route is not None:
+            route(self)
+            return
+        self.discard_body()
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
 
 def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(add_help=True)
@@ -904,30 +1770,66 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         default=int(os.environ.get("OMEGA_DASHBOARD_PORT") or DEFAULT_PORT),
         help="TCP port to bind the dashboard server (localhost-only).",
     )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run refresh helper scripts that expose main() inside the server process (faster, less isolated).",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Serve on this Unix domain socket path instead of TCP (e.g. OS/logs/dashboard.sock).",
+    )
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="Skip loading the local model into Ollama at startup.",
+    )
     return parser.parse_args(argv)
 
 
-def run_server(port: int) -> None:
+def run_server(port: int, socket_path: Optional[str] = None, warmup: bool = True) -> None:
     paths = resolve_paths()
+    load_ai_cache()
     dashboard_dir = paths["DASHBOARD"]
     if not dashboard_dir.exists():
         raise SystemExit(f"Dashboard directory not found: {dashboard_dir}")
 
-    server = HTTPServer(
-        ("127.0.0.1", int(port)),
-        lambda *args, **kwargs: DashboardHandler(*args, directory=str(dashboard_dir), **kwargs),
-    )
+    handler = lambda *args, **kwargs: DashboardHandler(*args, directory=str(dashboard_dir), **kwargs)
+    if socket_path:
+        if AF_UNIX is None:
+            raise SystemExit("--socket needs Unix domain socket support on this platform")
+        server: DashboardServer = DashboardUnixServer(str(Path(socket_path).expanduser().resolve()), handler)
+        where = f"unix:{server.server_address}"
+    else:
+        server = DashboardServer(("127.0.0.1", int(port)), handler)
+        where = f"http://127.0.0.1:{int(port)}"
     server.paths = paths
+    server.run_state_event = RUN_DONE
+    server.warm = threading.Event()
+    if warmup:
+        threading.Thread(target=warm_up, args=(paths, server.warm), name="dashboard-warmup", daemon=True).start()
+    else:
+        server.warm.set()
 
-    def handle_sigint(signum, frame):
-        server.shutdown()
+    def handle_signal(signum, frame):
+        # shutdown() waits for serve_forever to return, and serve_forever runs
+        # on this (main) thread, so calling it inline would deadlock.
+        threading.Thread(target=server.shutdown, daemon=True).start()
 
-    signal.signal(signal.SIGINT, handle_sigint)
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
 
-    print(f"OMEGA Dashboard Server running on http://127.0.0.1:{int(port)}")
-    server.serve_forever()
+    print(f"OMEGA Dashboard Server running on {where}")
+    try:
+        # A short poll interval lets the shutdown flag be seen within 50ms.
+        server.serve_forever(poll_interval=0.05)
+    finally:
+        server.server_close()
 
 
 if __name__ == "__main__":
     args = parse_args()
-    run_server(args.port)
+    if args.in_process:
+        IN_PROCESS_SCRIPTS = True
+    run_server(args.port, socket_path=args.socket, warmup=not args.no_warmup)
@@ -3,22 +3,31 @@
 Dashboard Smoke Test (offline-only)
 Validates that the localhost dashboard is reachable and key endpoints work.
 
-Writes a JSON report to OS/03_REPORTS/.
+Writes a JSON report to OS/03_REPORTS/. While running, each check is also
+appended to a sibling .ndjson file, which is removed once the report is
+written (so an interrupted run still leaves its partial results).
+For a server started with --socket, set OMEGA_DASHBOARD_URL=unix://<percent-encoded socket path>.
 """
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from http.client import HTTPConnection, RemoteDisconnected
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import unquote, urlparse
 
 
+@lru_cache(maxsize=1)
 def resolve_paths() -> Dict[str, Path]:
     scripts_dir = Path(__file__).resolve().parent
     os_dir = scripts_dir.parent
@@ -27,14 +36,29 @@ def resolve_paths() -> Dict[str, Path]:
         "OS_DIR": os_dir,
         "REPORTS": os_dir / "03_REPORTS",
         "PORTFILE": logs / "dashboard_server.port",
-        "OUT": os_dir / "03_REPORTS" / f"DASHBOARD_SMOKE_TEST_{datetime.now().strftime('%Y-%m-%d_%H%M%S')}.json",
     }
 
+def report_path(paths: Dict[str, Path]) -> Path:
+    return paths["REPORTS"] / f"DASHBOARD_SMOKE_TEST_{datetime.now().strftime('%Y-%m-%d_%H%M%S')}.json"
+
 def resolve_base_url(paths: Dict[str, Path]) -> str:
-    env_url = os.environ.get("OMEGA_DASHBOARD_URL")
+    portfile = paths.get("PORTFILE")
+    try:
+        mtime_ns = os.stat(portfile).st_mtime_ns if portfile else None
+    except OSError:
+        mtime_ns = None
+    # The portfile is only re-read when it changes (or the env overrides do).
+    return _base_url(
+        os.environ.get("OMEGA_DASHBOARD_URL"),
+        os.environ.get("OMEGA_DASHBOARD_PORT"),
+        str(portfile) if portfile else None,
+        mtime_ns,
+    )
+
+@lru_cache(maxsize=8)
+def _base_url(env_url: Optional[str], env_port: Optional[str], portfile: Optional[str], mtime_ns: Optional[int]) -> str:
     if env_url:
         return env_url.rstrip("/")
-    env_port = os.environ.get("OMEGA_DASHBOARD_PORT")
     if env_port:
         try:
             p = int(env_port)
@@ -43,8 +67,7 @@ def resolve_base_url(paths: Dict[str, Path]) -> str:
         except Exception:
             pass
     try:
-        portfile = paths.get("PORTFILE")
-        if portfile and Path(portfile).exists():
+        if portfile and mtime_ns is not None:
             raw = Path(portfile).read_text(encoding="utf-8").strip()
             p = int(raw)
             if 1 <= p <= 65535:
@@ -54,37 +77,124 @@ def resolve_base_url(paths: Dict[str, Path]) -> str:
     return "http://127.0.0.1:3000"
 
 
+class UnixHTTPConnection(HTTPConnection):
+    """HTTPConnection over a Unix domain socket (dashboard_server.py --socket)."""
+
+    def __init__(self, path: str, timeout: float = 5):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.unix_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def unix_socket_path(url: str) -> Optional[str]:
+    """
+    unix://%2Fpath%2Fto%2Fdashboard.sock/api/status -> /path/to/dashboard.sock
+    (socket path percent-encoded in the host part, as requests-unixsocket does).
+    """
+    if not url.startswith("unix://"):
+        return None
+    return unquote(urlparse(url).netloc)
+
+
+# One keep-alive connection per (thread, host, port) so the ~20 probes and the
+# run_status poll loop reuse a socket instead of reconnecting every call.
+_CONNS = threading.local()
+
+
+def _request(method: str, url: str, body: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None, timeout: float = 5) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Same contract as urlopen: HTTPError for status >= 400, URLError for
+    connection failures.
+    """
+    parsed = urlparse(url)
+    unix_path = unix_socket_path(url)
+    key = ("unix", unix_path) if unix_path else (parsed.hostname or "127.0.0.1", parsed.port or 80)
+    target = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+    pool = _CONNS.__dict__.setdefault("pool", {})
+    for attempt in range(2):
+        conn = pool.get(key)
+        reused = conn is not None
+        if conn is None:
+            if unix_path:
+                conn = pool[key] = UnixHTTPConnection(unix_path, timeout=timeout)
+            else:
+                conn = pool[key] = HTTPConnection(key[0], key[1], timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request(method, target, body=body, headers=headers or {})
+            resp = conn.getresponse()
+            data = resp.read()
+        except (RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+            pool.pop(key, None)
+            conn.close()
+            if reused and attempt == 0:
+                continue  # server closed the idle socket; retry on a fresh one
+            raise URLError(exc)
+        except OSError as exc:
+            pool.pop(key, None)
+            conn.close()
+            raise URLError(exc)
+        if resp.will_close:
+            pool.pop(key, None)
+            conn.close()
+        if resp.status >= 400:
+            raise HTTPError(url, resp.status, resp.reason, resp.msg, io.BytesIO(data))
+        return resp.status, {k.lower(): v for k, v in resp.getheaders()}, data
+    raise URLError("connection_retry_failed")
+
+
 def fetch(url: str, timeout: int = 5) -> Tuple[int, Dict[str, str], str]:
-    req = Request(url, method="GET")
-    with urlopen(req, timeout=timeout) as resp:
-        status = getattr(resp, "status", 200)
-        headers = {k.lower(): v for k, v in resp.headers.items()}
-        body = resp.read().decode("utf-8", errors="replace")
-        return status, headers, body
+    status, headers, body = _request("GET", url, timeout=timeout)
+    return status, headers, body.decode("utf-8", errors="replace")
 
 
 def fetch_json(url: str, timeout: int = 5) -> Tuple[int, Dict[str, str], Any]:
-    status, headers, body = fetch(url, timeout=timeout)
+    status, headers, body = _request("GET", url, timeout=timeout)
     return status, headers, json.loads(body)
 
 def post_json(url: str, payload: Dict[str, Any], timeout: int = 10) -> Tuple[int, Dict[str, str], Any]:
     data = json.dumps(payload).encode("utf-8")
-    req = Request(url, data=data, method="POST", headers={"Content-Type": "application/json"})
-    with urlopen(req, timeout=timeout) as resp:
-        status = getattr(resp, "status", 200)
-        headers = {k.lower(): v for k, v in resp.headers.items()}
-        body = resp.read().decode("utf-8", errors="replace")
-        return status, headers, json.loads(body)
+    status, headers, body = _request("POST", url, body=data, headers={"Content-Type": "application/json"}, timeout=timeout)
+    return status, headers, json.loads(body)
 
 
 def wait_port(host: str, port: int, timeout_s: int = 5) -> bool:
+    return _wait_connect(lambda: socket.create_connection((host, port), timeout=1), timeout_s)
+
+def wait_unix_socket(path: str, timeout_s: int = 5) -> bool:
+    def connect() -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(1)
+        try:
+            sock.connect(path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    return _wait_connect(connect, timeout_s)
+
+def _wait_connect(connect, timeout_s: int) -> bool:
     end = time.time() + timeout_s
+    attempt = 0
     while time.time() < end:
         try:
-            with socket.create_connection((host, port), timeout=1):
+            with connect():
                 return True
         except Exception:
-            time.sleep(0.2)
+            time.sleep(min(2.0, 0.1 * 2 ** attempt, max(0.0, end - time.time())))
+            attempt += 1
     return False
 
 def retry(fn, attempts: int = 2, delay_s: float = 1.0):
@@ -113,17 +223,35 @@ def main() -> None:
         "pass": True,
     }
 
-    try:
-        port = int(base.rsplit(":", 1)[-1])
-    except Exception:
-        port = 3000
+    out = report_path(paths)
+    paths["REPORTS"].mkdir(parents=True, exist_ok=True)
+    progress_path = out.with_suffix(".ndjson")
+    progress = progress_path.open("a", encoding="utf-8")
+
+    def log_line(entry: Dict[str, Any]) -> None:
+        progress.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        progress.flush()
 
-    if not wait_port("127.0.0.1", port, timeout_s=5):
+    log_line({"_meta": "start", "started_at": started_at, "base": base})
+
+    unix_path = unix_socket_path(base)
+    if unix_path:
+        listening = wait_unix_socket(unix_path, timeout_s=5)
+    else:
+        try:
+            port = int(base.rsplit(":", 1)[-1])
+        except Exception:
+            port = 3000
+        listening = wait_port("127.0.0.1", port, timeout_s=5)
+
+    if not listening:
         report["pass"] = False
         report["error"] = "dashboard_port_not_listening"
     else:
         def record(name: str, ok: bool, detail: Any = None) -> None:
-            report["checks"].append({"name": name, "ok": ok, "detail": detail})
+            entry = {"name": name, "ok": ok, "detail": detail}
+            report["checks"].append(entry)
+            log_line(entry)
             if not ok:
                 report["pass"] = False
 
@@ -139,8 +267,9 @@ def main() -> None:
         except (HTTPError, URLError) as exc:
             record("GET /", False, str(exc))
 
-        # Core JSON endpoints
-        for ep in [
+        # Core JSON endpoints (independent, so probed concurrently; each worker
+        # thread keeps its own keep-alive connection)
+        endpoints = [
             "/api/capabilities",
             "/api/status",
             "/api/trends",
@@ -158,17 +287,24 @@ def main() -> None:
             "/api/storage_status",
             "/api/mission_log",
             "/api/power_watchdog_status",
-        ]:
+        ]
+
+        def probe(ep: str) -> Tuple[bool, Any]:
             try:
                 status, _, data = fetch_json(base + ep, timeout=8)
-                record(f"GET {ep}", status == 200 and isinstance(data, dict), {"status": status, "keys": list(data.keys())[:10]})
+                return status == 200 and isinstance(data, dict), {"status": status, "keys": list(data.keys())[:10]}
             except Exception as exc:
-                record(f"GET {ep}", False, str(exc))
+                return False, str(exc)
+
+        # map() yields in input order, so the report stays deterministic.
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for ep, (ok, detail) in zip(endpoints, pool.map(probe, endpoints)):
+                record(f"GET {ep}", ok, detail)
 
         # AI query (small prompt) - allow one retry (Ollama may be warming up)
         try:
             status, _, data = retry(
-                lambda: post_json(base + "/api/ai_query", {"prompt": "Reply only: OK", "tier": "ECO"}, timeout=35),
+                lambda: post_json(base + "/api/ai_query", {"prompt": "Reply only: OK", "tier": "ECO", "no_cache": True}, timeout=35),
                 attempts=2,
                 delay_s=2.0,
             )
@@ -193,10 +329,17 @@ def main() -> None:
         try:
             status, _, data = fetch_json(base + "/api/run_once", timeout=5)
             record("GET /api/run_once", status == 200 and isinstance(data, dict) and data.get("running") is True, {"status": status})
+            # Long-poll: the server holds each request until the run ends (max 5s).
+            # Back off if it answers early anyway (older server without wait_ms).
             done = False
-            for _ in range(120):
-                time.sleep(0.5)
-                _, _, st = fetch_json(base + "/api/run_status", timeout=5)
+            deadline = time.time() + 60
+            attempt = 0
+            while time.time() < deadline:
+                polled_at = time.time()
+                _, _, st = fetch_json(base + "/api/run_status?wait_ms=5000", timeout=10)
+                if st.get("running") and time.time() - polled_at < 1.0:
+                    time.sleep(min(2.0, 0.1 * 2 ** attempt))
+                    attempt += 1
                 if not st.get("running"):
                     done = True
                     record("run_once_exit_code", st.get("exit_code") == 0, st)
@@ -207,11 +350,13 @@ def main() -> None:
         except Exception as exc:
             record("run_once_flow", False, str(exc))
 
-    paths["REPORTS"].mkdir(parents=True, exist_ok=True)
     report["ended_at"] = datetime.now().isoformat()
-    paths["OUT"].write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    log_line({"_meta": "end", "ended_at": report["ended_at"], "pass": report["pass"], "error": report.get("error")})
+    progress.close()
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    progress_path.unlink()
 
-    print(json.dumps({"pass": report["pass"], "report": str(paths["OUT"])}, indent=2))
+    print(json.dumps({"pass": report["pass"], "report": str(out)}, indent=2))
 
 
 if __name__ == "__main__":
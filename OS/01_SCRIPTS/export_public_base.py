@@ -16,7 +16,9 @@ It intentionally excludes:
 from __future__ import annotations
 
 import argparse
+import fnmatch
 import json
+import re
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -58,38 +60,43 @@ ESSENTIAL_SCRIPTS = [
 ]
 
 
+# Directories already created during this export; every write_* / copy_file
+# calls ensure_dir on its parent, so most calls would be repeat mkdirs.
+_MADE_DIRS: set = set()
+
+
 def ensure_dir(path: Path) -> None:
+    if path in _MADE_DIRS:
+        return
     path.mkdir(parents=True, exist_ok=True)
+    _MADE_DIRS.add(path)
 
 
 def copy_file(src: Path, dst: Path) -> None:
+    # shutil.copy = copyfile (in-kernel sendfile/fcopyfile fast path) + mode bits,
+    # which keeps *.command executable; timestamps don't matter in an export.
     ensure_dir(dst.parent)
-    shutil.copy2(src, dst)
+    shutil.copy(src, dst)
+
+
+# Always skipped by copy_tree (editor/VCS/cache litter).
+ALWAYS_IGNORE = frozenset({".DS_Store", "__pycache__", "node_modules", ".git", ".idea", ".vscode"})
+_ALWAYS_IGNORE_RE = "(?:" + "|".join(re.escape(n) for n in sorted(ALWAYS_IGNORE)) + r")\Z"
 
 
 def copy_tree(src: Path, dst: Path, ignore_globs: List[str]) -> None:
+    # Globs are matched per entry name during the copy itself, so ignored
+    # files are never copied and no cleanup pass over dst is needed.
+    # One regex for the fixed names and the caller's globs: one match per name.
+    ignore_re = re.compile("|".join([_ALWAYS_IGNORE_RE, *(fnmatch.translate(p) for p in ignore_globs)]))
+
     def _ignore(_dir: str, names: List[str]) -> set:
-        ignored = set()
-        for n in names:
-            # always ignore caches
-            if n in {".DS_Store", "__pycache__", "node_modules", ".git", ".idea", ".vscode"}:
-                ignored.add(n)
-                continue
-        return ignored
+        return {n for n in names if ignore_re.match(n)}
 
     if dst.exists():
         shutil.rmtree(dst)
-    shutil.copytree(src, dst, ignore=_ignore, dirs_exist_ok=False)
-    # second pass: remove ignored patterns by glob (simple)
-    for pat in ignore_globs:
-        for p in dst.rglob(pat):
-            if p.is_dir():
-                shutil.rmtree(p, ignore_errors=True)
-            else:
-                try:
-                    p.unlink()
-                except Exception:
-                    pass
+        _MADE_DIRS.difference_update({d for d in _MADE_DIRS if d == dst or dst in d.parents})
+    shutil.copytree(src, dst, ignore=_ignore, copy_function=shutil.copy, dirs_exist_ok=False)
 
 
 def write_json(dst: Path, data: object) -> None:
@@ -372,6 +379,7 @@ prepper central erweiterung/
 OS/00_PRIVATE/
 
 OS/00_CORE_DATA/*.json
+OS/00_CORE_DATA/*.jsonl
 !OS/00_CORE_DATA/*.example.json
 """)
 
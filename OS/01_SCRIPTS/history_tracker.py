@@ -6,28 +6,131 @@ Speichert tägliche Snapshots und berechnet Trends (vs. Gestern).
 
 import json
 import os
+import bisect
 import datetime
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson  # optional: schnellerer C-Parser für Kernel und History
+except ImportError:
+    orjson = None
+
 # PFADE (relativ zum Skript-Verzeichnis)
 SCRIPT_DIR = Path(__file__).resolve().parent
 BASE_DIR = SCRIPT_DIR.parent
 KERNEL_PATH = BASE_DIR / "00_CORE_DATA" / "omega_kernel.json"
-HISTORY_PATH = BASE_DIR / "00_CORE_DATA" / "metrics_history.json"
+HISTORY_PATH = BASE_DIR / "00_CORE_DATA" / "metrics_history.jsonl"
+LEGACY_HISTORY_PATH = BASE_DIR / "00_CORE_DATA" / "metrics_history.json"
+HISTORY_DAYS = 30
+# Ab so vielen Zeilen wird die Datei auf HISTORY_DAYS zurückgeschnitten.
+HISTORY_TRIM_LINES = 2 * HISTORY_DAYS
+
+def _loads(raw):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 def load_json(path):
     """Lädt JSON-Datei sicher."""
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        return _loads(Path(path).read_bytes())
+    except (FileNotFoundError, ValueError):
         return {}
 
-def save_json(path, data):
-    """Speichert JSON-Datei mit Indent."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def _read_history_index():
+    """
+    Liest die JSONL-History (eine Zeile pro Snapshot) als dict date -> snapshot
+    in Dateireihenfolge; doppelte Tage: letzter Eintrag gewinnt.
+    Migriert die alte metrics_history.json einmalig.
+    """
+    try:
+        raw = HISTORY_PATH.read_bytes()
+    except FileNotFoundError:
+        legacy = load_json(LEGACY_HISTORY_PATH)
+        if not isinstance(legacy, list):
+            return {}
+        legacy.sort(key=lambda x: x.get("date", ""))
+        write_history(legacy[-HISTORY_DAYS:])
+        LEGACY_HISTORY_PATH.unlink(missing_ok=True)
+        return {h.get("date") or "": h for h in legacy[-HISTORY_DAYS:]}
+
+    by_date = {}
+    for line in raw.splitlines():
+        try:
+            entry = _loads(line)
+        except ValueError:
+            continue  # z.B. abgerissene letzte Zeile nach Absturz
+        if isinstance(entry, dict):
+            by_date[entry.get("date") or ""] = entry
+    return by_date
+
+def load_history():
+    """Gibt die letzten HISTORY_DAYS Snapshots zurück (älteste zuerst)."""
+    return list(_read_history_index().values())[-HISTORY_DAYS:]
+
+# (stamp, history) aus dem letzten update_history(): get_history_summary()
+# nutzt das, solange die Datei seitdem nicht verändert wurde.
+_LAST_HISTORY = None
+
+def _history_stamp():
+    try:
+        st = os.stat(HISTORY_PATH)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _dump_line(entry):
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+def _fsync_dir(path):
+    """fsync auf das Verzeichnis, damit ein rename einen Absturz übersteht (best effort)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def write_history(history):
+    """
+    Schreibt die komplette History neu (nur für Trim/Migration, atomar).
+    Temp-Datei wird vor dem rename gefsynct, das Verzeichnis danach.
+    Appends (append_history) bleiben ohne fsync; eine abgerissene letzte
+    Zeile verwirft der Reader.
+    """
+    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = HISTORY_PATH.with_suffix(HISTORY_PATH.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(b"".join(_dump_line(h) for h in history))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, HISTORY_PATH)
+    _fsync_dir(HISTORY_PATH.parent)
+
+def append_history(entry, replace_last=False):
+    """Hängt einen Snapshot an (ein O_APPEND-write) bzw. ersetzt nur die letzte Zeile."""
+    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(HISTORY_PATH, "ab+") as f:
+        # Nur das Dateiende lesen: Anfang der letzten Zeile finden
+        end = f.seek(0, os.SEEK_END)
+        pos = max(0, end - 4096)
+        f.seek(pos)
+        tail = f.read()
+        if tail and not tail.endswith(b"\n"):
+            # Abgerissene letzte Zeile (Absturz mitten im write) verwerfen
+            cut = tail.rfind(b"\n")
+            f.truncate(pos + cut + 1 if cut >= 0 else pos)
+            tail = tail[:cut + 1] if cut >= 0 else b""
+            pos = f.seek(0, os.SEEK_END) - len(tail)
+        if replace_last and tail:
+            cut = tail.rstrip(b"\n").rfind(b"\n")
+            f.truncate(pos + cut + 1 if cut >= 0 else pos)
+        f.write(_dump_line(entry))
 
 def extract_metrics(kernel):
     """Extrahiert die wichtigsten Metriken aus dem Kernel."""
@@ -42,11 +145,30 @@ def extract_metrics(kernel):
         "burn_rate": runway_calc.get("monthly_burn", 0),
     }
 
+# (st_mtime_ns, st_size, kernel, metrics) des zuletzt geparsten Kernels
+_KERNEL_CACHE = None
+
+def _load_kernel_metrics():
+    """Kernel + extrahierte Metriken; parst nur neu, wenn sich die Datei geändert hat."""
+    global _KERNEL_CACHE
+    try:
+        st = os.stat(KERNEL_PATH)
+    except OSError:
+        return {}, extract_metrics({})
+    if _KERNEL_CACHE and _KERNEL_CACHE[:2] == (st.st_mtime_ns, st.st_size):
+        return _KERNEL_CACHE[2], _KERNEL_CACHE[3]
+    kernel = load_json(KERNEL_PATH)
+    metrics = extract_metrics(kernel)
+    _KERNEL_CACHE = (st.st_mtime_ns, st.st_size, kernel, metrics)
+    return kernel, metrics
+
+_METRIC_KEYS = itemgetter("net_liquidity", "volksbank", "revolut", "runway_days", "burn_rate")
+
 def _metrics_equal(a, b):
-    keys = ["net_liquidity", "volksbank", "revolut", "runway_days", "burn_rate"]
+    # Ein Tupelvergleich; fehlende Keys zählen als "geändert" (Eintrag wird neu geschrieben)
     try:
-        return all(a.get(k) == b.get(k) for k in keys)
-    except Exception:
+        return _METRIC_KEYS(a) == _METRIC_KEYS(b)
+    except (KeyError, TypeError):
         return False
 
 def update_history():
@@ -55,43 +177,53 @@ def update_history():
     Ersetzt existing entry für heute, falls vorhanden.
     Behält maximal 30 Tage History.
     """
-    kernel = load_json(KERNEL_PATH)
-    history_data = load_json(HISTORY_PATH)
-    
-    # Ensure history is a list
-    if not isinstance(history_data, list):
-        history_data = []
+    global _LAST_HISTORY
+    _, metrics = _load_kernel_metrics()
+    stamp = _history_stamp()
+    by_date = _read_history_index()
     
-    today = datetime.datetime.now().strftime("%Y-%m-%d")
-    timestamp = datetime.datetime.now().isoformat()
+    now = datetime.datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    timestamp = now.isoformat()
     
-    # Aktuelle Werte extrahieren
-    metrics = extract_metrics(kernel)
     snapshot = {"date": today, "timestamp": timestamp, **metrics}
 
     # Heute nur schreiben, wenn nötig (daily snapshot, nicht jede Minute).
-    existing_today = None
-    for h in history_data:
-        if h.get("date") == today:
-            existing_today = h
-            break
+    existing_today = by_date.get(today)
 
+    # Nur schreiben, wenn sich etwas ändert: kein Eintrag für heute, geänderte
+    # Werte oder erzwungen. get_trends() pollt das, also ist "unverändert" der
+    # Normalfall und kostet dann weder Sortieren noch Schreiben.
     force = os.environ.get("OMEGA_FORCE_SNAPSHOT") == "1"
-    if existing_today and not force:
-        if _metrics_equal(existing_today, snapshot):
-            return history_data
-        # metrics changed -> replace
-        history_data = [h for h in history_data if h.get("date") != today]
-        history_data.append(snapshot)
-    else:
-        # no entry today yet OR forced
-        history_data = [h for h in history_data if h.get("date") != today]
-        history_data.append(snapshot)
+    dirty = force or existing_today is None or not _metrics_equal(existing_today, snapshot)
+    if not dirty:
+        history_data = list(by_date.values())[-HISTORY_DAYS:]
+        _LAST_HISTORY = (stamp, history_data)
+        return history_data
 
-    # Nach Datum sortieren und auf 30 Tage begrenzen
-    history_data = sorted(history_data, key=lambda x: x.get("date", ""))[-30:]
-    
-    save_json(HISTORY_PATH, history_data)
+    # Heutigen Eintrag ersetzen (behält seine Position) bzw. anhängen
+    newest_date = next(reversed(by_date), "")
+    last_is_today = newest_date == today
+
+    if last_is_today or newest_date < today:
+        by_date[today] = snapshot
+        # Normalfall: heute ist die letzte Zeile -> nur anhängen / letzte Zeile ersetzen
+        append_history(snapshot, replace_last=last_is_today)
+        history_data = list(by_date.values())[-HISTORY_DAYS:]
+        if len(by_date) > HISTORY_TRIM_LINES:
+            write_history(history_data)
+    else:
+        # Uhr zurückgestellt o.ä.: heute per Binärsuche einsortieren (die Datei
+        # ist nach Datum sortiert) und komplett neu schreiben
+        if existing_today is None:
+            history_data = list(by_date.values())
+            history_data.insert(bisect.bisect_right(list(by_date), today), snapshot)
+        else:
+            by_date[today] = snapshot  # ersetzt an Ort und Stelle
+            history_data = list(by_date.values())
+        del history_data[:-HISTORY_DAYS]
+        write_history(history_data)
+    _LAST_HISTORY = (_history_stamp(), history_data)
     return history_data
 
 def calc_trend(current, previous):
@@ -137,8 +269,12 @@ def get_trends():
 
 def get_history_summary():
     """Gibt eine kompakte Zusammenfassung der History zurück."""
-    history = load_json(HISTORY_PATH)
-    if not isinstance(history, list) or not history:
+    stamp = _history_stamp()
+    if _LAST_HISTORY is not None and stamp is not None and _LAST_HISTORY[0] == stamp:
+        history = _LAST_HISTORY[1]
+    else:
+        history = load_history()
+    if not history:
         return {"status": "empty", "entries": 0}
     
     return {
@@ -10,16 +10,31 @@ Usage:
   python3 infrastructure_manager.py cleanup
 """
 
+import copy
+import errno
 import json
 import os
+import selectors
 import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import psutil  # optional: in-process socket table instead of forking lsof
+except ImportError:
+    psutil = None
+
+try:
+    import orjson  # optional: C JSON codec for registry/config I/O
+except ImportError:
+    orjson = None
+
 # PFADE
 SCRIPT_DIR = Path(__file__).resolve().parent
 BASE_DIR = SCRIPT_DIR.parents[1]  # Prepper Central root
@@ -31,26 +46,58 @@ CONFIG_FILE = DATA_DIR / "ports_config.json"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_json(path: Path) -> dict:
-    if not path.exists():
-        return {}
+# Parsed JSON per path, keyed by (mtime_ns, size): status/start/stop read the
+# same config and registry several times per run. Callers mutate what they
+# get back, so hits are handed out as deep copies.
+_JSON_CACHE: dict = {}
+
+# start_all/stop_all laufen parallel: jeder Worker ändert die Registry per
+# read-modify-write unter diesem Lock, statt eine eigene Kopie zu speichern.
+_REGISTRY_LOCK = threading.RLock()
+
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. non-str keys; the stdlib encoder copes
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _read_json_cached(path: Path):
+    """Parsed contents of path, or None if it is missing or unreadable."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {}
+        st = path.stat()
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _JSON_CACHE.get(path)
+    if hit is None or hit[0] != key:
+        try:
+            data = _json_loads(path.read_bytes())
+        except Exception:
+            return None
+        hit = _JSON_CACHE[path] = (key, data)
+    return copy.deepcopy(hit[1])
+
+
+def load_json(path: Path) -> dict:
+    data = _read_json_cached(path)
+    return {} if data is None else data
 
 def load_registry() -> dict:
     """
     Registry schema (current): dict[name] -> {pid, port, ...}
     Back-compat: if the registry file contains a list, migrate it to dict.
     """
-    if not REGISTRY_FILE.exists():
-        return {}
-    try:
-        raw = json.loads(REGISTRY_FILE.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+    raw = _read_json_cached(REGISTRY_FILE)
     if isinstance(raw, dict):
         return raw
     if isinstance(raw, list):
@@ -67,22 +114,101 @@ def load_registry() -> dict:
                 "start_time": item.get("start_time"),
                 "note": item.get("note"),
             }
-        save_json(REGISTRY_FILE, migrated)
+        with _REGISTRY_LOCK:
+            save_json(REGISTRY_FILE, migrated)
         return migrated
     return {}
 
 
+def _fsync_dir(path: Path) -> None:
+    """fsync a directory so a rename inside it survives a crash (best effort)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def save_json(path: Path, data: dict) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Encode once and write once (json.dump issues a write per token), via a
+    # temp file so a crash mid-write never leaves a truncated registry. The
+    # temp file is fsynced before the rename and the directory after it, so
+    # after a power loss the path holds either the old or the new document.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_json_dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(path.parent)
+    try:
+        st = path.stat()
+        _JSON_CACHE[path] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(data))
+    except OSError:
+        _JSON_CACHE.pop(path, None)
+
+def update_registry(name: str, entry=None) -> None:
+    """Setzt den Registry-Eintrag `name` auf `entry` bzw. entfernt ihn (entry=None)."""
+    with _REGISTRY_LOCK:
+        registry = load_registry()
+        if entry is None:
+            if name not in registry:
+                return
+            del registry[name]
+        else:
+            registry[name] = entry
+        save_json(REGISTRY_FILE, registry)
 
-def _can_connect(host: str, port: int, family: int) -> bool:
+
+def _connect_any(targets: list, timeout: float = 0.4) -> bool:
+    """
+    Non-blocking connect to all (family, host, port) targets at once; True as
+    soon as one is accepted. Worst case is one timeout, not one per target.
+    """
+    sel = selectors.DefaultSelector()
+    socks = []
     try:
-        with socket.socket(family, socket.SOCK_STREAM) as s:
-            s.settimeout(0.4)
-            return s.connect_ex((host, int(port))) == 0
-    except Exception:
+        for family, host, port in targets:
+            try:
+                sock = socket.socket(family, socket.SOCK_STREAM)
+            except OSError:
+                continue
+            socks.append(sock)
+            sock.setblocking(False)
+            rc = sock.connect_ex((host, port))
+            if rc == 0:
+                return True
+            if rc in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+                sel.register(sock, selectors.EVENT_WRITE)
+        deadline = time.monotonic() + timeout
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in sel.select(remaining):
+                if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    return True
+                sel.unregister(key.fileobj)
         return False
+    finally:
+        sel.close()
+        for sock in socks:
+            sock.close()
+
+
+def _bind_blocked(family: int, host: str, port: int) -> bool:
+    """True if bind() says the address is taken (no SO_REUSEADDR, no packets sent)."""
+    try:
+        with socket.socket(family, socket.SOCK_STREAM) as s:
+            s.bind((host, port))
+            return False
+    except OSError as exc:
+        return exc.errno == errno.EADDRINUSE
 
 
 def is_port_in_use(port: int) -> bool:
@@ -90,13 +216,42 @@ def is_port_in_use(port: int) -> bool:
     if port is None:
         return False
     # Check IPv4 + IPv6 to catch common macOS cases where another service binds only on ::.
-    return _can_connect("127.0.0.1", int(port), socket.AF_INET) or _can_connect("::1", int(port), socket.AF_INET6)
+    targets = [(socket.AF_INET, "127.0.0.1", int(port)), (socket.AF_INET6, "::1", int(port))]
+    # Fast path: if both loopback addresses can be bound, nothing listens there.
+    blocked = [t for t in targets if _bind_blocked(*t)]
+    if not blocked:
+        return False
+    # EADDRINUSE also comes from TIME_WAIT leftovers of a stopped service, so
+    # confirm with a connect that something actually accepts.
+    return _connect_any(blocked)
 
 
-def is_pid_running(pid: int) -> bool:
-    """Prüft, ob ein Prozess mit dieser PID noch existiert."""
+def _live_pids():
+    """Alle laufenden PIDs in einem Scan (/proc bzw. psutil), sonst None."""
+    try:
+        return {int(d) for d in os.listdir("/proc") if d.isdigit()}
+    except OSError:
+        pass
+    if psutil is not None:
+        try:
+            return set(psutil.pids())
+        except Exception:
+            pass
+    return None
+
+
+def is_pid_running(pid: int, live=None) -> bool:
+    """
+    Prüft, ob ein Prozess mit dieser PID noch existiert.
+    Mit `live` (Ergebnis von _live_pids()) ist das ein Set-Lookup statt eines Syscalls.
+    """
     if pid is None:
         return False
+    if live is not None:
+        try:
+            return int(pid) in live
+        except (TypeError, ValueError):
+            return False
     try:
         os.kill(pid, 0)  # Signal 0 prüft nur Existenz
         return True
@@ -104,42 +259,101 @@ def is_pid_running(pid: int) -> bool:
         return False
 
 
+# One `lsof` for all listening TCP ports instead of one per configured port;
+# reused for a moment so status()'s conflict scan shares a single snapshot.
+_LISTEN_CACHE_TTL_S = 2.0
+_listen_cache: dict = {"at": 0.0, "owners": None}
+
+
+def _parse_lsof_listeners(output: str) -> dict:
+    """`lsof -F pn` records (p<pid> / n<addr>:<port>) -> {port: [pid, ...]}."""
+    owners: dict = {}
+    pid = None
+    for line in output.splitlines():
+        if line.startswith("p"):
+            try:
+                pid = int(line[1:])
+            except ValueError:
+                pid = None
+        elif line.startswith("n") and pid is not None:
+            addr = line[1:].split("->", 1)[0]
+            try:
+                port = int(addr.rsplit(":", 1)[-1])
+            except ValueError:
+                continue
+            pids = owners.setdefault(port, [])
+            if pid not in pids:
+                pids.append(pid)
+    return owners
+
+
+def _psutil_listeners():
+    """{port: [pid, ...]} via psutil, or None when unavailable / not permitted."""
+    if psutil is None:
+        return None
+    try:
+        conns = psutil.net_connections(kind="tcp")
+    except Exception:
+        return None  # e.g. AccessDenied: macOS only lists other users' sockets for root
+    owners: dict = {}
+    for conn in conns:
+        if conn.status != psutil.CONN_LISTEN or not conn.laddr or conn.pid is None:
+            continue
+        pids = owners.setdefault(conn.laddr.port, [])
+        if conn.pid not in pids:
+            pids.append(conn.pid)
+    return owners
+
+
+def listening_port_owners(refresh: bool = False) -> dict:
+    """{port: [pid, ...]} for every listening TCP socket (psutil, else one lsof call)."""
+    now = time.monotonic()
+    cached = _listen_cache["owners"]
+    if cached is not None and not refresh and now - _listen_cache["at"] < _LISTEN_CACHE_TTL_S:
+        return cached
+    owners = _psutil_listeners()
+    if owners is None:
+        try:
+            result = subprocess.run(
+                ["lsof", "-nP", "-iTCP", "-sTCP:LISTEN", "-F", "pn"],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            owners = _parse_lsof_listeners(result.stdout or "")
+        except Exception:
+            owners = {}
+    _listen_cache.update(at=now, owners=owners)
+    return owners
+
+
 def get_port_owner(port: int) -> str:
     """Findet den Prozess, der einen Port belegt (via lsof)."""
     if port is None:
         return ""
-    try:
-        result = subprocess.run(
-            ["lsof", "-i", f":{port}", "-t"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        pids = [ln.strip() for ln in (result.stdout or "").splitlines() if ln.strip()]
-        # keep stable order, but de-dupe
-        seen = set()
-        uniq = []
-        for p in pids:
-            if p in seen:
-                continue
-            seen.add(p)
-            uniq.append(p)
-        return ",".join(uniq)
-    except Exception:
-        return ""
+    return ",".join(str(p) for p in listening_port_owners().get(int(port), []))
 
 def get_port_owner_pids(port: int) -> set:
-    owner = get_port_owner(port)
-    pids = set()
-    for part in (owner or "").split(","):
-        part = part.strip()
-        if not part:
-            continue
-        try:
-            pids.add(int(part))
-        except Exception:
-            continue
-    return pids
+    if port is None:
+        return set()
+    return set(listening_port_owners().get(int(port), []))
+
+
+# Crash-Probe nach Popen: proc.poll() bis START_PROBE_MAX_S (wie der frühere
+# 0.5 s sleep). Ein Absturz wird sofort erkannt, statt die volle Zeit zu warten.
+# Stilles Log ist kein Lebenszeichen: Python puffert stdout, ein Import-Traceback
+# landet oft erst nach >100 ms im Log.
+START_PROBE_MAX_S = 0.5
+START_POLL_S = 0.02
+
+
+def _exited_during_startup(proc: subprocess.Popen) -> bool:
+    deadline = time.monotonic() + START_PROBE_MAX_S
+    while proc.poll() is None:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(START_POLL_S)
+    return True
 
 
 def start_service(name: str) -> bool:
@@ -181,14 +395,13 @@ def start_service(name: str) -> bool:
             picked_port = int(portfile.read_text(encoding="utf-8").strip())
         except Exception:
             picked_port = port
-        registry["dashboard"] = {
+        update_registry("dashboard", {
             "pid": pid,
             "port": picked_port,
             "command": ["python3", "OS/01_SCRIPTS/omega_one_click.py"],
             "start_time": datetime.now().isoformat(),
             "note": "managed_by_omega_one_click",
-        }
-        save_json(REGISTRY_FILE, registry)
+        })
         print(f"✅ dashboard ready (pid={pid or '--'} port={picked_port or '--'})")
         return True
 
@@ -212,19 +425,19 @@ def start_service(name: str) -> bool:
         except Exception:
             payload = {}
             ok = False
-        registry["watchdog"] = {
+        update_registry("watchdog", {
             "pid": None,
             "port": None,
             "command": ["python3", "OS/01_SCRIPTS/power_watchdog_ctl.py", "start"],
             "start_time": datetime.now().isoformat(),
             "note": "managed_by_launchd",
             "last": payload,
-        }
-        save_json(REGISTRY_FILE, registry)
+        })
         print("✅ watchdog start issued" if ok else "⚠️ watchdog start may have failed (check watchdog stderr log)")
         return ok
 
     # 1. Check: Läuft er schon laut Registry?
+    stale_removed = False
     if name in registry:
         old_pid = registry[name].get("pid")
         if is_pid_running(old_pid):
@@ -233,22 +446,29 @@ def start_service(name: str) -> bool:
         else:
             print(f"🧹 Bereinige toten Eintrag für '{name}'...")
             del registry[name]
-            save_json(REGISTRY_FILE, registry)
+            stale_removed = True  # wird beim Registrieren (4.) mitgespeichert
+
+    def fail() -> bool:
+        # Abbruch vor dem Registrieren: die Bereinigung trotzdem persistieren
+        if stale_removed:
+            update_registry(name)
+        return False
 
     # 2. Check: Ist der Port blockiert?
     if port and is_port_in_use(port):
         owner = get_port_owner(port)
         print(f"⛔ Port {port} ist belegt! (PID: {owner or 'unbekannt'})")
         print(f"   Tipp: kill {owner} oder wähle anderen Port.")
-        return False
+        return fail()
 
     # 3. Starten
     print(f"🚀 Starte {name} ({desc})...")
     log_file_path = LOG_DIR / f"{name}.log"
     
     try:
+        started_at = datetime.now().isoformat()  # Log-Header und Registry teilen sich den Zeitstempel
         log_file = open(log_file_path, "a", encoding="utf-8")
-        log_file.write(f"\n=== START {datetime.now().isoformat()} ===\n")
+        log_file.write(f"\n=== START {started_at} ===\n")
         log_file.flush()
 
         proc = subprocess.Popen(
@@ -260,20 +480,18 @@ def start_service(name: str) -> bool:
         )
 
         # Kurz warten und prüfen, ob Prozess sofort crashed
-        time.sleep(0.5)
-        if proc.poll() is not None:
+        if _exited_during_startup(proc):
             print(f"❌ {name} ist sofort gecrasht! Check {log_file_path}")
-            return False
+            return fail()
 
         # 4. Registrieren
-        registry[name] = {
+        update_registry(name, {
             "pid": proc.pid,
             "port": port,
             "command": cmd,
-            "start_time": datetime.now().isoformat(),
+            "start_time": started_at,
             "log_file": str(log_file_path)
-        }
-        save_json(REGISTRY_FILE, registry)
+        })
         
         if port:
             print(f"✅ {name} gestartet (PID {proc.pid}, Port {port}).")
@@ -284,10 +502,10 @@ def start_service(name: str) -> bool:
     except FileNotFoundError as e:
         print(f"❌ Befehl nicht gefunden: {cmd[0]}")
         print(f"   Details: {e}")
-        return False
+        return fail()
     except Exception as e:
         print(f"❌ Fehler beim Starten: {e}")
-        return False
+        return fail()
 
 
 def stop_service(name: str, force: bool = False) -> bool:
@@ -314,9 +532,7 @@ def stop_service(name: str, force: bool = False) -> bool:
                     p.unlink()
             except Exception:
                 pass
-        if "dashboard" in registry:
-            del registry["dashboard"]
-            save_json(REGISTRY_FILE, registry)
+        update_registry("dashboard")
         print("✅ dashboard gestoppt (best-effort).")
         return True
 
@@ -333,9 +549,7 @@ def stop_service(name: str, force: bool = False) -> bool:
             )
         except Exception:
             pass
-        if "watchdog" in registry:
-            del registry["watchdog"]
-            save_json(REGISTRY_FILE, registry)
+        update_registry("watchdog")
         print("✅ watchdog stop issued.")
         return True
 
@@ -367,8 +581,7 @@ def stop_service(name: str, force: bool = False) -> bool:
         except Exception as e:
             print(f"⚠️  Fehler beim Stoppen: {e}")
 
-    del registry[name]
-    save_json(REGISTRY_FILE, registry)
+    update_registry(name)
     print(f"✅ {name} gestoppt.")
     return True
 
@@ -384,6 +597,7 @@ def status() -> None:
     """Zeigt den Status aller registrierten Dienste."""
     registry = load_registry()
     config = load_json(CONFIG_FILE)
+    live = _live_pids()  # ein Scan für alle Liveness-Checks in diesem Lauf
     
     print(f"\n{'='*60}")
     print(f"📊 INFRASTRUCTURE STATUS ({datetime.now().strftime('%H:%M:%S')})")
@@ -404,21 +618,24 @@ def status() -> None:
             port = int(portfile.read_text(encoding="utf-8").strip())
         except Exception:
             port = None
-        alive = is_pid_running(pid) if pid else False
+        alive = is_pid_running(pid, live) if pid else False
         return pid, port, alive
 
     def watchdog_runtime():
+        # Direkt launchctl fragen statt power_watchdog_ctl.py in einem neuen
+        # Interpreter zu starten; `list <label>` endet mit 0 nur wenn geladen.
+        # Das Label kommt aus power_watchdog_ctl (eine Quelle für install und Status).
         try:
+            from power_watchdog_ctl import LABEL
+
             proc = subprocess.run(
-                [sys.executable, "OS/01_SCRIPTS/power_watchdog_ctl.py", "status"],
-                cwd=str(BASE_DIR),
-                capture_output=True,
-                text=True,
+                ["launchctl", "list", LABEL],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False,
-                timeout=10,
+                timeout=2,
             )
-            payload = json.loads((proc.stdout or "").strip() or "{}")
-            return bool(payload.get("loaded"))
+            return proc.returncode == 0
         except Exception:
             return False
 
@@ -451,7 +668,7 @@ def status() -> None:
         if isinstance(info, dict) and info.get("pid") is not None:
             pid = info.get("pid")
             port = info.get("port") or "-"
-            alive = is_pid_running(pid)
+            alive = is_pid_running(pid, live)
             state = "🟢 RUNNING" if alive else ("🔴 DEAD" if managed else "⚪ EXTERNAL")
             print(f"{name:<15} {pid:<8} {port:<8} {state:<12} -")
         else:
@@ -469,6 +686,14 @@ def status() -> None:
         port = cfg.get("port")
         if not port:
             continue
+
+        if name != "dashboard":
+            # Our service is alive: nothing to report, so skip the port probe entirely.
+            info = registry.get(name, {}) if isinstance(registry, dict) else {}
+            reg_pid = info.get("pid")
+            if reg_pid and is_pid_running(reg_pid, live):
+                continue
+
         if not is_port_in_use(port):
             continue
 
@@ -479,17 +704,9 @@ def status() -> None:
             pid, picked_port, alive = dashboard_runtime()
             if alive and picked_port == port and pid and pid in owner_pids:
                 continue
-            conflicts.append((name, port, ",".join(str(p) for p in sorted(owner_pids)) or get_port_owner(port)))
-            continue
-
-        info = registry.get(name, {}) if isinstance(registry, dict) else {}
-        reg_pid = info.get("pid")
-        if reg_pid and is_pid_running(reg_pid) and int(reg_pid) in owner_pids:
-            continue
 
         # If service isn't running (or unknown), but port is used, it is a real conflict.
-        if not reg_pid or not is_pid_running(reg_pid):
-            conflicts.append((name, port, ",".join(str(p) for p in sorted(owner_pids)) or get_port_owner(port)))
+        conflicts.append((name, port, ",".join(str(p) for p in sorted(owner_pids)) or get_port_owner(port)))
     
     if conflicts:
         print("\n⚠️  PORT-KONFLIKTE:")
@@ -501,10 +718,11 @@ def cleanup() -> None:
     """Bereinigt tote Einträge aus der Registry und alte Logs."""
     registry = load_registry()
     cleaned = 0
+    live = _live_pids()
     
     for name in list(registry.keys()):
         pid = registry[name].get("pid")
-        if not is_pid_running(pid):
+        if not is_pid_running(pid, live):
             print(f"🧹 Entferne toten Eintrag: {name} (PID {pid})")
             del registry[name]
             cleaned += 1
@@ -514,32 +732,45 @@ def cleanup() -> None:
     # Alte Logs löschen (> 7 Tage)
     old_logs = 0
     cutoff = time.time() - (7 * 24 * 3600)
-    for log_file in LOG_DIR.glob("*.log"):
-        if log_file.stat().st_mtime < cutoff:
-            log_file.unlink()
-            old_logs += 1
+    # scandir liefert Name + (gecachten) stat in einem Durchlauf, ohne Path-Objekte
+    with os.scandir(LOG_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith(".log"):
+                continue
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    old_logs += 1
+            except FileNotFoundError:
+                pass  # inzwischen von jemand anderem gelöscht
     
     print(f"✅ Cleanup: {cleaned} tote Einträge, {old_logs} alte Logs gelöscht.")
 
 
+def _managed_services() -> list:
+    config = load_json(CONFIG_FILE)
+    if not isinstance(config, dict):
+        return []
+    return [name for name, cfg in config.items() if not (isinstance(cfg, dict) and cfg.get("managed") is False)]
+
+
+def _run_parallel(fn, targets: list) -> None:
+    # Dienste sind unabhängig (eigene PIDs/Ports): gleichzeitig starten/stoppen,
+    # damit sich Crash-Probe und Grace-Periods nicht aufsummieren.
+    if not targets:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(targets))) as ex:
+        list(ex.map(fn, targets))
+
+
 def start_all() -> None:
     """Startet alle Dienste aus der Konfiguration."""
-    config = load_json(CONFIG_FILE)
-    for name, cfg in config.items():
-        if isinstance(cfg, dict) and cfg.get("managed") is False:
-            continue
-        start_service(name)
+    _run_parallel(start_service, _managed_services())
 
 
 def stop_all() -> None:
     """Stoppt alle registrierten Dienste."""
-    config = load_json(CONFIG_FILE)
-    if isinstance(config, dict):
-        targets = [name for name, cfg in config.items() if not (isinstance(cfg, dict) and cfg.get("managed") is False)]
-    else:
-        targets = []
-    for name in targets:
-        stop_service(name)
+    _run_parallel(stop_service, _managed_services())
 
 
 def print_usage() -> None:
@@ -5,17 +5,47 @@ Kopiert Identity + Ports + Rules in die Zwischenablage für schnelles Einfügen.
 
 Usage:
   python3 load_context.py         # Kopiert Context in Zwischenablage
-  python3 load_context.py --print # Gibt Context auf stdout aus
+  python3 load_context.py --print # Gibt Context auf stdout aus (JSON unverändert)
+  python3 load_context.py --raw-json               # JSON-Dateien roh einfügen (ohne Parse/Re-Dump)
+  python3 load_context.py --print --pretty-json    # stdout mit neu formatiertem JSON
 """
 
+import fcntl
 import json
+import os
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Sequence, Union
 from urllib.request import Request, urlopen
 
+try:
+    import orjson  # optional: C-Parser/-Encoder für Kernel, Cache und Re-Formatieren
+except ImportError:
+    orjson = None
+
+
+def _loads(raw: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except ValueError:
+            pass  # z.B. NaN: stdlib entscheidet (und meldet den echten Fehler)
+    return json.loads(raw)
+
+
+def _dumps_pretty(data: Any) -> str:
+    """indent=2, ensure_ascii=False – über orjson, sofern es das Objekt kann."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass  # z.B. Nicht-String-Keys oder sehr große ints
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 # PFADE
 SCRIPT_DIR = Path(__file__).resolve().parent
 BASE_DIR = SCRIPT_DIR.parents[1]  # Prepper Central root
@@ -23,47 +53,116 @@ CORE_DIR = BASE_DIR / "OS" / "00_CORE_DATA"
 CRISIS_DIR = BASE_DIR / "OS" / "06_CRISIS"
 REPORTS_DIR = BASE_DIR / "OS" / "03_REPORTS"
 LOGS_DIR = BASE_DIR / "OS" / "logs"
+CONTEXT_CACHE = LOGS_DIR / "context_cache.json"
+
+
+def _slurp(path: Path) -> bytes:
+    """Liest eine ganze Datei mit einem os.read (ohne BufferedReader/TextIOWrapper)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:  # kurzer read (selten): Rest nachholen
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
 
 
 def read_file(path: Path) -> str:
     """Liest eine Datei sicher."""
-    if not path.exists():
-        return f"(file not found: {path.name})"
     try:
-        return path.read_text(encoding="utf-8").strip()
+        return _slurp(path).decode("utf-8").strip()
+    except FileNotFoundError:
+        return f"(file not found: {path.name})"
     except Exception as e:
         return f"(error reading {path.name}: {e})"
 
 
+def _looks_pretty(raw: bytes) -> bool:
+    """Schon mit 2er-Indent formatiert (so schreiben die OS-Skripte ihre JSON-Dateien)?"""
+    head = raw.lstrip()[:64]
+    return head[:1] in (b"{", b"[") and (head[1:4] == b"\n  " or head[1:5] == b"\r\n  ")
+
+
 def read_json_pretty(path: Path) -> str:
     """Liest JSON und formatiert es schön."""
-    if not path.exists():
-        return f"(file not found: {path.name})"
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        raw = _slurp(path)
+        data = _loads(raw)  # validiert immer
+        if _looks_pretty(raw):
+            # Bereits formatiert: Rohtext statt Re-Dump (indent schaltet den C-Encoder ab)
+            return raw.decode("utf-8").strip()
+        return _dumps_pretty(data)
+    except FileNotFoundError:
+        return f"(file not found: {path.name})"
     except Exception as e:
         return f"(error reading {path.name}: {e})"
 
 
-def copy_to_clipboard(text: str) -> bool:
-    """Kopiert Text in die macOS Zwischenablage."""
+def _copy_via_pasteboard(text: str) -> Optional[bool]:
+    """NSPasteboard direkt (PyObjC, optional); None wenn PyObjC nicht verfügbar ist."""
+    try:
+        import AppKit  # optional: PyObjC, spart fork/exec von pbcopy
+    except ImportError:
+        return None
+    try:
+        board = AppKit.NSPasteboard.generalPasteboard()
+        board.declareTypes_owner_([AppKit.NSStringPboardType], None)
+        return bool(board.setString_forType_(text, AppKit.NSStringPboardType))
+    except Exception:
+        return None
+
+
+PIPE_BUF_MAX = 1024 * 1024
+
+
+def _grow_pipe(fd: int, size: int) -> None:
+    """Pipe auf die Payload vergrößern (F_SETPIPE_SZ, nur Linux; sonst no-op)."""
+    op = getattr(fcntl, "F_SETPIPE_SZ", None)
+    if op is None or size <= 65536:
+        return
+    try:
+        fcntl.fcntl(fd, op, min(size, PIPE_BUF_MAX))
+    except OSError:
+        pass  # z.B. über /proc/sys/fs/pipe-max-size: Default-Puffer genügt
+
+
+def copy_to_clipboard(text: Union[str, Sequence[str]]) -> bool:
+    """
+    Kopiert Text in die macOS Zwischenablage.
+    Teile (build_context_parts) gehen einzeln in pbcopy, ohne den ganzen Text
+    vorher zusammenzusetzen und als Ganzes zu encoden.
+    """
+    parts = [text] if isinstance(text, str) else list(text)
+    ok = _copy_via_pasteboard("\n".join(parts))
+    if ok:
+        return True
     try:
         process = subprocess.Popen(
             'pbcopy',
             env={'LANG': 'en_US.UTF-8'},
             stdin=subprocess.PIPE
         )
-        process.communicate(text.encode('utf-8'))
-        return process.returncode == 0
+        _grow_pipe(process.stdin.fileno(), sum(len(p) for p in parts) + len(parts))
+        try:
+            for i, part in enumerate(parts):
+                if i:
+                    process.stdin.write(b"\n")
+                process.stdin.write(part.encode('utf-8'))
+        finally:
+            process.stdin.close()
+        return process.wait() == 0
     except Exception:
         return False
 
 
 def read_portfile() -> int:
     try:
-        raw = (LOGS_DIR / "dashboard_server.port").read_text(encoding="utf-8").strip()
+        raw = _slurp(LOGS_DIR / "dashboard_server.port").decode("utf-8").strip()
         port = int(raw)
         return port if 1 <= port <= 65535 else 3000
     except Exception:
@@ -76,21 +175,45 @@ def fetch_new_chat_pack(port: int) -> Optional[str]:
         req = Request(url, method="GET")
         with urlopen(req, timeout=2) as resp:
             body = resp.read().decode("utf-8", errors="replace")
-        data = json.loads(body)
+        data = _loads(body)
         text = data.get("text")
         return str(text) if text else None
     except Exception:
         return None
 
 
+SESSION_TAIL_WINDOW = 64 * 1024
+SESSION_TAIL_MAX_WINDOW = 1024 * 1024
+
+
 def session_log_tail(max_entries: int = 10) -> str:
+    """Letzte Einträge aus SESSION_LOG.md; liest nur das Dateiende (Log wächst unbegrenzt)."""
     try:
-        path = REPORTS_DIR / "SESSION_LOG.md"
-        if not path.exists():
+        try:
+            fd = os.open(REPORTS_DIR / "SESSION_LOG.md", os.O_RDONLY)
+        except FileNotFoundError:
             return "(no session log yet)"
-        lines = [ln.strip() for ln in path.read_text(encoding="utf-8", errors="replace").splitlines()]
-        entries = [ln for ln in lines if ln.startswith("- [")]
-        tail = entries[-max_entries:] if entries else []
+        try:
+            size = os.fstat(fd).st_size
+            window = SESSION_TAIL_WINDOW
+            while True:
+                start = max(0, size - window)
+                os.lseek(fd, start, os.SEEK_SET)
+                block = os.read(fd, size - start)
+                lines = iter(block.decode("utf-8", errors="replace").splitlines())
+                if start > 0:
+                    next(lines, None)  # angeschnittene erste Zeile verwerfen
+                # deque(maxlen): nur die letzten max_entries Treffer bleiben liegen
+                tail: Deque[str] = deque(maxlen=max_entries)
+                for ln in lines:
+                    entry = ln.strip()
+                    if entry.startswith("- ["):
+                        tail.append(entry)
+                if len(tail) >= max_entries or start == 0 or window >= SESSION_TAIL_MAX_WINDOW:
+                    break
+                window *= 2
+        finally:
+            os.close(fd)
         return "\n".join(tail) if tail else "(no entries yet)"
     except Exception as exc:
         return f"(session log unavailable: {exc})"
@@ -98,112 +221,170 @@ def session_log_tail(max_entries: int = 10) -> str:
 
 def kernel_extract() -> str:
     path = CORE_DIR / "omega_kernel.json"
-    if not path.exists():
-        return "(file not found: omega_kernel.json)"
     try:
-        kernel: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        kernel: Dict[str, Any] = _loads(_slurp(path))
         balances = kernel.get("current_balances", {}) or {}
         runway = (kernel.get("financial_intelligence", {}) or {}).get("runway_calculation", {}) or {}
         extract = {"current_balances": balances, "runway_calculation": runway}
-        return json.dumps(extract, indent=2, ensure_ascii=False)
+        return _dumps_pretty(extract)
+    except FileNotFoundError:
+        return "(file not found: omega_kernel.json)"
     except Exception as exc:
         return f"(kernel parsing failed: {exc})"
 
 
-def build_context() -> str:
-    """Baut den vollständigen System-Kontext zusammen."""
-
-    port = read_portfile()
-    dashboard_url = f"http://127.0.0.1:{int(port)}"
-    new_chat_pack = fetch_new_chat_pack(port)
-
-    profile = read_json_pretty(CORE_DIR / "profile.json")
-    offline_state = read_json_pretty(CORE_DIR / "offline_state.json")
-    ports = read_json_pretty(CORE_DIR / "ports_config.json")
-    offline_min = read_file(CRISIS_DIR / "OFFLINE_CONTEXT_MIN.txt")
-    memory_min = read_file(CRISIS_DIR / "MEMORY_INDEX_MIN.txt")
-    master_min = read_file(CRISIS_DIR / "MASTER_START_MIN.txt")
-    sess_tail = session_log_tail(max_entries=10)
-    kernel_summary = kernel_extract()
-    
-    # Zusammenbauen
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    
-    prompt = f"""
-================================================================================
- RESILIENCE OS - SYSTEM CONTEXT PACKAGE
- Generated: {timestamp}
-================================================================================
-
-[DASHBOARD]
-- URL: {dashboard_url}
-- Portfile: OS/logs/dashboard_server.port
-
---------------------------------------------------------------------------------
-
-[NEW CHAT PACK (MIN) - preferred]
-{new_chat_pack if new_chat_pack else "(dashboard not reachable: run OMEGA_ONE_CLICK.command)"}
-
---------------------------------------------------------------------------------
+def file_stamp(path: Path) -> Optional[list]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
 
-[PROFILE (Evidence-first)]
-{profile}
 
---------------------------------------------------------------------------------
+def load_fragment_cache() -> Dict[str, Any]:
+    try:
+        data = _loads(_slurp(CONTEXT_CACHE))
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
 
-[OFFLINE STATE]
-{offline_state}
 
---------------------------------------------------------------------------------
+def save_fragment_cache(cache: Dict[str, Any]) -> None:
+    """Schreibt den Fragment-Cache atomar (best effort, ein Fehler kostet nur den Cache)."""
+    try:
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = CONTEXT_CACHE.with_suffix(CONTEXT_CACHE.suffix + ".tmp")
+        tmp.write_bytes(json.dumps(cache, ensure_ascii=False).encode("utf-8"))
+        os.replace(tmp, CONTEXT_CACHE)
+    except OSError:
+        pass
 
-[INFRASTRUCTURE / PORTS]
-{ports}
 
---------------------------------------------------------------------------------
+# Platzhalter der Renderer bei Fehlern: nie cachen, sonst bleibt ein
+# vorübergehender Lesefehler bis zur nächsten Dateiänderung stehen.
+_ERROR_PLACEHOLDERS = ("(file not found:", "(error reading ", "(session log unavailable:", "(kernel parsing failed:")
 
-[FINANCIAL STATUS (KERNEL EXTRACT)]
-{kernel_summary}
 
---------------------------------------------------------------------------------
+def _cache_key(path: Path, render: Any) -> str:
+    # Roh und formatiert gerendertes JSON getrennt cachen
+    return f"{path}#raw" if render is read_file and path.suffix == ".json" else str(path)
 
-[CRISIS STATUS (MIN)]
-{offline_min}
 
---------------------------------------------------------------------------------
+_RULE_HEAVY = "=" * 80
+_RULE_LIGHT = "-" * 80
 
-[MEMORY INDEX (MIN)]
-{memory_min}
+# Abschnitte in Ausgabe-Reihenfolge: (Überschrift, Fragment-Key)
+_SECTIONS = (
+    ("[NEW CHAT PACK (MIN) - preferred]", "new_chat_pack"),
+    ("[PROFILE (Evidence-first)]", "profile"),
+    ("[OFFLINE STATE]", "offline_state"),
+    ("[INFRASTRUCTURE / PORTS]", "ports"),
+    ("[FINANCIAL STATUS (KERNEL EXTRACT)]", "kernel_summary"),
+    ("[CRISIS STATUS (MIN)]", "offline_min"),
+    ("[MEMORY INDEX (MIN)]", "memory_min"),
+    ("[SESSION LOG (tail)]", "sess_tail"),
+    ("[MASTER START (MIN)]", "master_min"),
+)
 
---------------------------------------------------------------------------------
 
-[SESSION LOG (tail)]
-{sess_tail}
+def build_context_parts(raw_json: bool = False) -> List[str]:
+    """
+    Baut den System-Kontext als Liste von Teilen (per Zeilenumbruch zu verbinden).
+    raw_json: JSON-Dateien als Rohtext einfügen statt zu parsen und neu zu formatieren.
+    """
 
---------------------------------------------------------------------------------
+    port = read_portfile()
+    dashboard_url = f"http://127.0.0.1:{int(port)}"
 
-[MASTER START (MIN)]
-{master_min}
+    # Dateiquellen: Name -> (Pfad, Renderer). Die Fragmente werden pro Pfad
+    # mit (mtime_ns, size) gecacht; nur geänderte Dateien werden neu gerendert.
+    render_json = read_file if raw_json else read_json_pretty
+    sources = {
+        "profile": (CORE_DIR / "profile.json", render_json),
+        "offline_state": (CORE_DIR / "offline_state.json", render_json),
+        "ports": (CORE_DIR / "ports_config.json", render_json),
+        "offline_min": (CRISIS_DIR / "OFFLINE_CONTEXT_MIN.txt", read_file),
+        "memory_min": (CRISIS_DIR / "MEMORY_INDEX_MIN.txt", read_file),
+        "master_min": (CRISIS_DIR / "MASTER_START_MIN.txt", read_file),
+        "sess_tail": (REPORTS_DIR / "SESSION_LOG.md", lambda _p: session_log_tail(max_entries=10)),
+        "kernel_summary": (CORE_DIR / "omega_kernel.json", lambda _p: kernel_extract()),
+    }
+    cache = load_fragment_cache()
+    fragments: Dict[str, str] = {}
+    stale: Dict[str, Any] = {}
+    cache_dirty = False
+
+    # Alle Quellen sind unabhängig: parallel lesen, damit die Gesamtzeit etwa
+    # der langsamsten Quelle entspricht (meist der HTTP-Call, daher zuerst).
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pack_f = pool.submit(fetch_new_chat_pack, port)  # immer frisch, nie gecacht
+        for name, (path, render) in sources.items():
+            stamp = file_stamp(path)
+            key = _cache_key(path, render)
+            hit = cache.get(key)
+            if stamp and isinstance(hit, dict) and [hit.get("mtime_ns"), hit.get("size")] == stamp:
+                fragments[name] = hit.get("rendered", "")
+            else:
+                stale[name] = (key, stamp, pool.submit(render, path))
+
+        new_chat_pack = pack_f.result()
+        for name, (key, stamp, fut) in stale.items():
+            fragments[name] = fut.result()
+            if stamp and not fragments[name].startswith(_ERROR_PLACEHOLDERS):
+                cache[key] = {"mtime_ns": stamp[0], "size": stamp[1], "rendered": fragments[name]}
+                cache_dirty = True
+            elif cache.pop(key, None) is not None:
+                cache_dirty = True
+    if cache_dirty:
+        save_fragment_cache(cache)
 
-================================================================================
- END CONTEXT - Paste this at the start of a new AI chat
-================================================================================
-"""
-    return prompt.strip()
+    # Zusammenbauen
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    fragments["new_chat_pack"] = new_chat_pack or "(dashboard not reachable: run OMEGA_ONE_CLICK.command)"
+
+    parts = [
+        _RULE_HEAVY,
+        " RESILIENCE OS - SYSTEM CONTEXT PACKAGE",
+        f" Generated: {timestamp}",
+        _RULE_HEAVY,
+        "",
+        "[DASHBOARD]",
+        f"- URL: {dashboard_url}",
+        "- Portfile: OS/logs/dashboard_server.port",
+    ]
+    for title, key in _SECTIONS:
+        parts += ["", _RULE_LIGHT, "", title, fragments[key]]
+    parts += [
+        "",
+        _RULE_HEAVY,
+        " END CONTEXT - Paste this at the start of a new AI chat",
+        _RULE_HEAVY,
+    ]
+    return parts
+
+
+def build_context(raw_json: bool = False) -> str:
+    """Baut den vollständigen System-Kontext zusammen."""
+    return "\n".join(build_context_parts(raw_json=raw_json))
 
 
 def main():
-    context = build_context()
+    # stdout liest ein Mensch: JSON dort standardmäßig roh (die OS-Dateien sind
+    # ohnehin eingerückt); die Zwischenablage bleibt formatiert.
+    raw_json = "--raw-json" in sys.argv or ("--print" in sys.argv and "--pretty-json" not in sys.argv)
+    parts = build_context_parts(raw_json=raw_json)
     
     if "--print" in sys.argv:
-        print(context)
+        print("\n".join(parts))
     else:
-        if copy_to_clipboard(context):
+        if copy_to_clipboard(parts):
+            size = sum(len(p) for p in parts) + len(parts) - 1
             print("✅ System Context in Zwischenablage kopiert.")
-            print(f"   Größe: {len(context):,} Zeichen")
+            print(f"   Größe: {size:,} Zeichen")
             print("👉 Einfügen in: DeepSeek / Llama / ChatGPT / Claude")
         else:
             print("❌ Zwischenablage nicht verfügbar. Hier ist der Context:\n")
-            print(context)
+            print("\n".join(parts))
 
 
 if __name__ == "__main__":
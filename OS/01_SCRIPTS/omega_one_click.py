@@ -10,15 +10,18 @@ What it does:
 
 from __future__ import annotations
 
+import errno
+import http.client
 import os
 import socket
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 
 def resolve_paths() -> dict:
@@ -48,46 +51,135 @@ def is_pid_running(pid: int) -> bool:
     return True
 
 
+# The API surface a current dashboard_server.py must expose.
+READY_ENDPOINTS = (
+    "/api/capabilities",
+    "/api/run_status",
+    "/api/ai_status",
+    "/api/memory_index",
+    "/api/sources_coverage",
+    "/api/storage_status",
+    "/api/new_chat_pack",
+    "/api/trends",
+)
+
+
+# Idle keep-alive connections per (host, port), shared by the probe threads:
+# repeated readiness checks and the run_once trigger skip the TCP handshake.
+_IDLE_CONNS: Dict[Tuple[str, int], List[http.client.HTTPConnection]] = {}
+_IDLE_LOCK = threading.Lock()
+
+
+def http_get_status(url: str, timeout: float) -> int:
+    """GET url over a pooled keep-alive connection and return the HTTP status."""
+    parsed = urlparse(url)
+    key = (parsed.hostname or "127.0.0.1", parsed.port or 80)
+    target = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+    for attempt in range(2):
+        with _IDLE_LOCK:
+            idle = _IDLE_CONNS.get(key)
+            conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = http.client.HTTPConnection(key[0], key[1], timeout=timeout)
+        else:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        try:
+            conn.request("GET", target)
+            resp = conn.getresponse()
+            resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if reused and attempt == 0:
+                continue  # server closed the idle socket; retry on a fresh one
+            raise
+        except Exception:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            with _IDLE_LOCK:
+                _IDLE_CONNS.setdefault(key, []).append(conn)
+        return int(resp.status)
+    raise http.client.HTTPException("unreachable")
+
+
+def close_connections() -> None:
+    """Close pooled sockets (each idle keep-alive socket holds a server worker)."""
+    with _IDLE_LOCK:
+        conns = [c for idle in _IDLE_CONNS.values() for c in idle]
+        _IDLE_CONNS.clear()
+    for conn in conns:
+        conn.close()
+
+
+def _probe(url: str) -> bool:
+    try:
+        return http_get_status(url, timeout=2) == 200
+    except (OSError, http.client.HTTPException, ValueError):
+        return False
+    except Exception:
+        return False
+
+
 def dashboard_ready(url: str) -> bool:
     """
     Verify the running server exposes the expected API surface.
     This prevents "stale" servers from keeping old endpoints alive.
+    The endpoints are probed concurrently; the first failure decides.
     """
+    pool = ThreadPoolExecutor(max_workers=len(READY_ENDPOINTS))
     try:
-        for ep in (
-            "/api/capabilities",
-            "/api/run_status",
-            "/api/ai_status",
-            "/api/memory_index",
-            "/api/sources_coverage",
-            "/api/storage_status",
-            "/api/new_chat_pack",
-            "/api/trends",
-        ):
-            req = Request(url + ep, method="GET")
-            with urlopen(req, timeout=2) as resp:
-                if getattr(resp, "status", 200) != 200:
-                    return False
+        futures = [pool.submit(_probe, url + ep) for ep in READY_ENDPOINTS]
+        for fut in as_completed(futures):
+            if not fut.result():
+                for other in futures:
+                    other.cancel()
+                return False
         return True
-    except (HTTPError, URLError, TimeoutError, ValueError):
-        return False
-    except Exception:
-        return False
+    finally:
+        pool.shutdown(wait=False)
+
+
+# A server spawned moments ago may not be listening yet: connection refused is
+# retried for this long (within main()'s join timeout), anything else is final.
+SERVER_BIND_WAIT_S = 6.0
 
 
 def trigger_run_once(url: str) -> bool:
-    try:
-        req = Request(url + "/api/run_once", method="GET")
-        with urlopen(req, timeout=3) as resp:
-            return getattr(resp, "status", 200) == 200
-    except Exception:
-        return False
+    deadline = time.monotonic() + SERVER_BIND_WAIT_S
+    while True:
+        try:
+            return http_get_status(url + "/api/run_once", timeout=3) == 200
+        except ConnectionRefusedError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+        except Exception:
+            return False
+
+
+def _trigger_run_once_or_warn(url: str) -> None:
+    if not trigger_run_once(url):
+        print("[warn] could not trigger a refresh; use \"Run Refresh\" in the dashboard")
 
 
 def find_dashboard_server_pids() -> list[int]:
     """
     Best-effort: find running dashboard_server.py processes even if the pidfile is stale/missing.
+    pgrep filters in the kernel's process table walk; `ps ax` is the fallback
+    where pgrep is missing.
     """
+    try:
+        out = subprocess.run(
+            ["pgrep", "-f", "dashboard_server.py"], capture_output=True, text=True, check=False
+        ).stdout
+        return sorted({int(x) for x in out.split() if x.isdigit() and int(x) > 0})
+    except (OSError, ValueError):
+        pass
     try:
         out = subprocess.check_output(["ps", "ax", "-o", "pid=,command="], text=True)
     except Exception:
@@ -109,20 +201,40 @@ def find_dashboard_server_pids() -> list[int]:
             pids.append(pid)
     return sorted(set(pids))
 
-def _can_connect(host: str, port: int, family: int) -> bool:
-    try:
-        with socket.socket(family, socket.SOCK_STREAM) as s:
-            s.settimeout(0.3)
-            return s.connect_ex((host, int(port))) == 0
-    except Exception:
-        return False
+# Loopback targets probed before the bind check. ::1 is dropped for the rest
+# of the process once the host turns out to have no IPv6 loopback.
+_LOOPBACK_TARGETS = [(socket.AF_INET, "127.0.0.1"), (socket.AF_INET6, "::1")]
+_NO_IPV6_ERRNOS = {errno.EADDRNOTAVAIL, errno.EAFNOSUPPORT, errno.ENETUNREACH}
+
+
+def _loopback_accepts(port: int) -> bool:
+    """True if 127.0.0.1 or ::1 accepts a connection on port (one short connect per family)."""
+    for target in list(_LOOPBACK_TARGETS):
+        family, host = target
+        try:
+            s = socket.socket(family, socket.SOCK_STREAM)
+        except OSError:
+            _LOOPBACK_TARGETS.remove(target)
+            continue
+        with s:
+            s.settimeout(0.05)  # loopback: accepted or refused right away
+            try:
+                code = s.connect_ex((host, int(port)))
+            except OSError as exc:
+                code = exc.errno
+        if code == 0:
+            return True
+        if family == socket.AF_INET6 and code in _NO_IPV6_ERRNOS:
+            _LOOPBACK_TARGETS.remove(target)
+    return False
 
 def is_port_free(port: int, host: str = "127.0.0.1") -> bool:
     """
     macOS quirk: another process can bind only on IPv6 (::) while IPv4 bind still succeeds.
-    Treat the port as "busy" if either 127.0.0.1 or ::1 accepts connections.
+    Treat the port as "busy" if either 127.0.0.1 or ::1 accepts connections;
+    only a port nobody answers on gets the bind probe.
     """
-    if _can_connect("127.0.0.1", int(port), socket.AF_INET) or _can_connect("::1", int(port), socket.AF_INET6):
+    if _loopback_accepts(port):
         return False
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
@@ -150,37 +262,71 @@ def pick_port(preferred: int = 3000, max_tries: int = 25) -> int:
     return int(preferred)
 
 def read_portfile(paths: dict) -> Optional[int]:
+    if not paths.get("PORTFILE"):
+        return None
     try:
-        if paths.get("PORTFILE") and Path(paths["PORTFILE"]).exists():
-            raw = Path(paths["PORTFILE"]).read_text(encoding="utf-8").strip()
-            port = int(raw)
-            if 1 <= port <= 65535:
-                return port
-    except Exception:
+        port = int(Path(paths["PORTFILE"]).read_text(encoding="utf-8").strip())
+    except Exception:  # missing, unreadable or not a number
         return None
-    return None
+    return port if 1 <= port <= 65535 else None
+
+# A portfile younger than this belongs to a server we (or a sibling launch)
+# just started; its readiness is trusted without probing.
+PORTFILE_FRESH_S = 30.0
+
+def portfile_is_fresh(paths: dict) -> bool:
+    try:
+        return time.time() - Path(paths["PORTFILE"]).stat().st_mtime < PORTFILE_FRESH_S
+    except (KeyError, OSError):
+        return False
+
+def write_small_file(path: Path, text: str) -> None:
+    """Replace path atomically so concurrent readers never see a truncated file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
 
 def write_portfile(paths: dict, port: int) -> None:
     try:
-        Path(paths["PORTFILE"]).write_text(str(int(port)), encoding="utf-8")
+        write_small_file(Path(paths["PORTFILE"]), str(int(port)))
     except Exception:
         pass
 
-def ensure_dashboard_server(paths: dict, port: int) -> int:
+def ensure_dashboard_server(paths: dict, port: int) -> Tuple[int, int]:
+    """Return (pid, port) of the dashboard that is serving; pid is -1 for an untracked one."""
     paths["LOGS"].mkdir(parents=True, exist_ok=True)
     url = f"http://127.0.0.1:{int(port)}"
 
-    if paths["PIDFILE"].exists():
+    try:
+        pid_raw: Optional[str] = paths["PIDFILE"].read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pid_raw = None
+    except Exception:
+        pid_raw = ""
+    if pid_raw is not None:
         try:
-            pid = int(paths["PIDFILE"].read_text(encoding="utf-8").strip())
+            pid = int(pid_raw.strip())
         except Exception:
             pid = -1
         if pid > 0 and is_pid_running(pid):
             # If the stored PID is alive, trust the stored portfile first (if any).
             stored_port = read_portfile(paths) or port
             stored_url = f"http://127.0.0.1:{int(stored_port)}"
+            if portfile_is_fresh(paths):
+                # Started moments ago (double-click, relaunch): skip the probes.
+                # OMEGA_STRICT_READY=1 still asks /api/capabilities once.
+                if os.environ.get("OMEGA_STRICT_READY") != "1" or _probe(stored_url + "/api/capabilities"):
+                    return pid, int(stored_port)
             if dashboard_ready(stored_url):
-                return pid
+                return pid, int(stored_port)
+            close_connections()
             try:
                 os.kill(pid, 15)
             except Exception:
@@ -197,11 +343,12 @@ def ensure_dashboard_server(paths: dict, port: int) -> int:
 
     # If something else is already serving the dashboard correctly, don't spawn a duplicate.
     if dashboard_ready(url):
-        return -1
+        return -1, int(port)
 
     # If the port is occupied by an older dashboard_server.py (not tracked by pidfile), replace it.
     stale_pids = find_dashboard_server_pids()
     if stale_pids:
+        close_connections()
         for pid in stale_pids:
             try:
                 os.kill(pid, 15)
@@ -221,9 +368,10 @@ def ensure_dashboard_server(paths: dict, port: int) -> int:
             stderr=log,
             cwd=str(paths["ROOT"]),
         )
-    paths["PIDFILE"].write_text(str(proc.pid), encoding="utf-8")
+    # Port first: a pidfile on disk then always has a current portfile next to it.
     write_portfile(paths, port)
-    return int(proc.pid)
+    write_small_file(paths["PIDFILE"], str(proc.pid))
+    return int(proc.pid), int(port)
 
 
 def main() -> None:
@@ -237,20 +385,24 @@ def main() -> None:
     except Exception:
         pass
 
-    pid = ensure_dashboard_server(paths, port)
-
-    # If the server picked a different port (e.g. 3000 was occupied), re-read it.
-    resolved_port = read_portfile(paths) or port
+    # The port actually in use comes back with the pid (it may differ from the
+    # preferred one if 3000 was occupied); no need to re-read the portfile.
+    pid, resolved_port = ensure_dashboard_server(paths, port)
     url = f"http://127.0.0.1:{int(resolved_port)}"
 
+    # Trigger a background refresh so the UI updates without waiting for the command to finish.
+    # If this fails, the user can always click "Run Refresh" in the dashboard.
+    # The request runs while `open` launches the browser instead of after it.
+    trigger = threading.Thread(target=_trigger_run_once_or_warn, args=(url,), daemon=True)
+    trigger.start()
+
     try:
         subprocess.run(["open", url], check=False)
     except Exception:
         pass
 
-    # Trigger a background refresh so the UI updates without waiting for the command to finish.
-    # If this fails, the user can always click "Run Refresh" in the dashboard.
-    trigger_run_once(url)
+    trigger.join(timeout=8)
+    close_connections()
 
     print(f"[ok] dashboard server pid={pid} url={url}")
 
@@ -22,10 +22,16 @@ import json
 import os
 import subprocess
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson  # optional: faster parse/pretty-print, stdlib json otherwise
+except ImportError:
+    orjson = None
+
 
 LABEL = "com.resilience-os.power-watchdog"
 
@@ -55,9 +61,20 @@ def now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
+def dumps_pretty(data: Any) -> str:
+    """json.dumps(indent=2, ensure_ascii=False), via orjson when it can encode the object."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def safe_read_json(path: Path) -> Dict[str, Any]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return data if isinstance(data, dict) else {}
     except Exception:
         return {}
@@ -72,8 +89,26 @@ def run(cmd: List[str]) -> Tuple[int, str]:
         return 1, str(exc)
 
 
-def launchctl_list() -> str:
+# dashboard_server imports this module and polls status(): reuse one
+# `launchctl list` for a moment instead of forking it on every call.
+# start/stop/install/uninstall drop the cached listing.
+LAUNCHCTL_CACHE_TTL_S = 2.0
+_launchctl_cache: Optional[Tuple[float, str]] = None
+
+
+def invalidate_launchctl_cache() -> None:
+    global _launchctl_cache
+    _launchctl_cache = None
+
+
+def launchctl_list(refresh: bool = False) -> str:
+    global _launchctl_cache
+    now = time.monotonic()
+    hit = _launchctl_cache
+    if not refresh and hit is not None and now - hit[0] < LAUNCHCTL_CACHE_TTL_S:
+        return hit[1]
     _, out = run(["launchctl", "list"])
+    _launchctl_cache = (now, out)
     return out
 
 
@@ -151,6 +186,7 @@ def install() -> Dict[str, Any]:
 </plist>
 """
     INSTALLED.write_text(plist, encoding="utf-8")
+    invalidate_launchctl_cache()
     return {"ok": True, "installed": str(INSTALLED), "runtime_home": str(RUNTIME_HOME), "runtime_script": str(RUNTIME_SCRIPT)}
 
 
@@ -163,6 +199,7 @@ def start() -> Dict[str, Any]:
     if is_loaded():
         run(["launchctl", "unload", str(INSTALLED)])
     code, out = run(["launchctl", "load", str(INSTALLED)])
+    invalidate_launchctl_cache()
     return {"ok": code == 0, "action": "start", "code": code, "output": out, "runtime_home": str(RUNTIME_HOME)}
 
 
@@ -170,6 +207,7 @@ def stop() -> Dict[str, Any]:
     if not INSTALLED.exists():
         return {"ok": True, "action": "stop", "note": "not_installed"}
     code, out = run(["launchctl", "unload", str(INSTALLED)])
+    invalidate_launchctl_cache()
     return {"ok": code == 0, "action": "stop", "code": code, "output": out}
 
 
@@ -178,6 +216,7 @@ def uninstall() -> Dict[str, Any]:
     try:
         if INSTALLED.exists():
             INSTALLED.unlink()
+        invalidate_launchctl_cache()
         return {"ok": True, "action": "uninstall", "removed": str(INSTALLED)}
     except Exception as exc:
         return {"ok": False, "action": "uninstall", "error": str(exc)}
@@ -198,33 +237,34 @@ def status() -> Dict[str, Any]:
         "log_file": str(RUNTIME_LOG),
         "stdout_file": str(RUNTIME_STDOUT),
         "stderr_file": str(RUNTIME_STDERR),
-        "last_status": safe_read_json(RUNTIME_STATUS) if RUNTIME_STATUS.exists() else {},
+        # safe_read_json already yields {} for a missing file; no extra stat first.
+        "last_status": safe_read_json(RUNTIME_STATUS),
         "plan_commands": plan_commands(),
     }
 
 
 def main() -> None:
     if len(sys.argv) < 2:
-        print(json.dumps(status(), indent=2, ensure_ascii=False))
+        print(dumps_pretty(status()))
         return
     cmd = sys.argv[1].lower()
     if cmd == "plan":
-        print(json.dumps({"ok": True, "plan_commands": plan_commands()}, indent=2, ensure_ascii=False))
+        print(dumps_pretty({"ok": True, "plan_commands": plan_commands()}))
         return
     if cmd == "install":
-        print(json.dumps(install(), indent=2, ensure_ascii=False))
+        print(dumps_pretty(install()))
         return
     if cmd == "start":
-        print(json.dumps(start(), indent=2, ensure_ascii=False))
+        print(dumps_pretty(start()))
         return
     if cmd == "stop":
-        print(json.dumps(stop(), indent=2, ensure_ascii=False))
+        print(dumps_pretty(stop()))
         return
     if cmd == "uninstall":
-        print(json.dumps(uninstall(), indent=2, ensure_ascii=False))
+        print(dumps_pretty(uninstall()))
         return
     if cmd == "status":
-        print(json.dumps(status(), indent=2, ensure_ascii=False))
+        print(dumps_pretty(status()))
         return
     raise SystemExit("Usage: power_watchdog_ctl.py [plan|install|start|stop|uninstall|status]")
 
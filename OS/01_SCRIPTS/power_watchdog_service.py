@@ -12,6 +12,8 @@ manually for debugging.
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import os
 import re
@@ -19,8 +21,11 @@ from html.entities import name2codepoint
 from html import unescape as html_unescape
 import subprocess
 import time
+import urllib.error
+import zlib
 import urllib.request
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 from dataclasses import dataclass
 from datetime import datetime
@@ -41,18 +46,26 @@ if WATCHDOG_HOME:
     BASE_DIR = Path(WATCHDOG_HOME).expanduser().resolve()
     BASE_DIR.mkdir(parents=True, exist_ok=True)
     CONFIG_PATH = BASE_DIR / "power_watchdog_config.json"
-    SEEN_PATH = BASE_DIR / "seen_news.txt"
+    SEEN_PATH = BASE_DIR / "seen_news.v2.txt"
     STATUS_PATH = BASE_DIR / "status.json"
     LOG_PATH = BASE_DIR / "power_watchdog.log"
 else:
     LOGS_DIR = OS_DIR / "logs" / "power_watchdog"
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
     CONFIG_PATH = CORE / "power_watchdog_config.json"
-    SEEN_PATH = LOGS_DIR / "seen_news.txt"
+    SEEN_PATH = LOGS_DIR / "seen_news.v2.txt"
     STATUS_PATH = LOGS_DIR / "status.json"
     LOG_PATH = LOGS_DIR / "power_watchdog.log"
 
 MAX_LOG_BYTES = 1_000_000
+MAX_FETCH_WORKERS = 16
+# Per-source backoff: unchanged or failing sources wait base * 2**n, capped
+# (default cap; config: max_backoff_seconds).
+BACKOFF_MAX_S = 3600
+# Pre-v2 file with raw uids (migrated once by load_seen).
+LEGACY_SEEN_PATH = SEEN_PATH.with_name("seen_news.txt")
+# seen_news.v2.txt keeps this many keys (oldest dropped on load).
+SEEN_MAX_LINES = 50_000
 
 
 @dataclass(frozen=True)
@@ -111,35 +124,122 @@ def load_config() -> Dict[str, Any]:
     return cfg
 
 
+def file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def seen_key(uid: str) -> str:
+    """Fixed-size de-dupe key for an entry uid (blake2b-128 hex; uids are often long URLs)."""
+    return hashlib.blake2b(uid.encode("utf-8", errors="replace"), digest_size=16).hexdigest()
+
+
 def load_seen() -> set:
+    # seen_news.txt stored raw uids. A uid can itself look like a key (32-hex
+    # GUIDs), so the formats are told apart by file, not by line: every legacy
+    # line is hashed once into seen_news.v2.txt.
+    legacy = False
     try:
-        if not SEEN_PATH.exists():
+        if SEEN_PATH.exists():
+            keys = [ln for ln in SEEN_PATH.read_text(encoding="utf-8", errors="ignore").splitlines() if ln]
+        elif LEGACY_SEEN_PATH.exists():
+            lines = LEGACY_SEEN_PATH.read_text(encoding="utf-8", errors="ignore").splitlines()
+            keys = [seen_key(ln) for ln in lines if ln]
+            legacy = True
+        else:
             return set()
-        return set(SEEN_PATH.read_text(encoding="utf-8", errors="ignore").splitlines())
     except Exception:
         return set()
+    if legacy or len(keys) > SEEN_MAX_LINES:
+        keys = keys[-SEEN_MAX_LINES:]
+        try:
+            tmp = SEEN_PATH.with_suffix(SEEN_PATH.suffix + ".tmp")
+            tmp.write_text("".join(k + "\n" for k in keys), encoding="utf-8")
+            tmp.replace(SEEN_PATH)
+        except Exception:
+            pass
+    return set(keys)
 
 
-def append_seen(uid: str) -> None:
+def append_seen(keys: Iterable[str]) -> None:
+    """Record seen_key()s as handled, in one write."""
+    chunk = "".join(k + "\n" for k in keys)
+    if not chunk:
+        return
     try:
         with SEEN_PATH.open("a", encoding="utf-8") as f:
-            f.write(uid + "\n")
+            f.write(chunk)
     except Exception:
         pass
 
 
-def fetch(url: str, timeout_s: int, max_bytes: int) -> bytes:
-    req = urllib.request.Request(url, headers={"User-Agent": "ResilienceOS/PowerWatchdog"})
-    with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-        data = resp.read(max_bytes + 1)
-        if len(data) > max_bytes:
-            raise ValueError("feed_too_large")
-        return data
+def fetch(
+    url: str,
+    timeout_s: int,
+    max_bytes: int,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> Tuple[Optional[bytes], Optional[str], Optional[str]]:
+    """
+    Conditional GET. Returns (data, etag, last_modified); data is None when the
+    server answers 304 Not Modified for the validators we sent.
+    """
+    headers = {"User-Agent": "ResilienceOS/PowerWatchdog", "Accept-Encoding": "gzip"}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            data = resp.read(max_bytes + 1)
+            if len(data) > max_bytes:
+                raise ValueError("feed_too_large")
+            if (resp.headers.get("Content-Encoding") or "").strip().lower() in {"gzip", "x-gzip"}:
+                # max_length keeps the max_bytes limit on the inflated size as well.
+                data = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(data, max_bytes + 1)
+                if len(data) > max_bytes:
+                    raise ValueError("feed_too_large")
+            return data, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304:
+            return None, etag, last_modified
+        raise
+
+
+# Both run on the first 600 bytes in place (pos/endpos), without copying them.
+_HTML_DOCTYPE_RE = re.compile(rb"\s*<!doctype html", re.I)
+_HTML_TAG_RE = re.compile(rb"<html", re.I)
 
 
 def looks_like_html(data: bytes) -> bool:
-    head = data[:600].lstrip().lower()
-    return head.startswith(b"<!doctype html") or head.startswith(b"<html") or b"<html" in head
+    return bool(_HTML_DOCTYPE_RE.match(data, 0, 600) or _HTML_TAG_RE.search(data, 0, 600))
+
+
+# The former "<a ...>(.*?)</a>" findall, split in two: match the opening tag,
+# then jump to the next </a>. The lazy group rescanned to EOF for every anchor
+# without a closing tag (quadratic on broken pages); without any </a> left,
+# nothing further can match, so the scan stops there.
+_ANCHOR_OPEN_RE = re.compile(r'(?is)<a\b[^>]*href=["\\\']([^"\\\']+)["\\\'][^>]*>')
+_ANCHOR_CLOSE_RE = re.compile(r"(?i)</a>")
+_TAG_RE = re.compile(r"(?is)<[^>]+>")
+
+
+def iter_anchors(text: str) -> Iterable[Tuple[str, str]]:
+    """(href, inner html) per anchor, like re.findall of the former anchor regex."""
+    pos = 0
+    while True:
+        m = _ANCHOR_OPEN_RE.search(text, pos)
+        if m is None:
+            return
+        close = _ANCHOR_CLOSE_RE.search(text, m.end())
+        if close is None:
+            return
+        yield m.group(1), text[m.end():close.start()]
+        pos = close.end()
 
 
 def parse_html_links(data: bytes, *, source: str, base_url: str) -> List[Entry]:
@@ -148,9 +248,10 @@ def parse_html_links(data: bytes, *, source: str, base_url: str) -> List[Entry]:
     We only extract links that look like "press releases" to avoid noise.
     """
     text = data.decode("utf-8", errors="replace")
-    anchors = re.findall(r'(?is)<a\b[^>]*href=["\\\']([^"\\\']+)["\\\'][^>]*>(.*?)</a>', text)
     out: List[Entry] = []
-    for href, label in anchors[:4000]:
+    for n, (href, label) in enumerate(iter_anchors(text)):
+        if n >= 4000:
+            break
         href = href.strip()
         if not href or href.startswith("#"):
             continue
@@ -161,7 +262,7 @@ def parse_html_links(data: bytes, *, source: str, base_url: str) -> List[Entry]:
         # Filter: berlin press releases are consistently "pressemitteilung.<id>.php"
         if "berlin.de" in base_url and "pressemitteilung." not in href:
             continue
-        title = re.sub(r"(?is)<[^>]+>", " ", label)
+        title = _TAG_RE.sub(" ", label)
         title = html_unescape(" ".join(title.split()))
         if not title or len(title) < 12:
             continue
@@ -215,86 +316,143 @@ def extract_link_atom(entry: ET.Element) -> str:
     return ""
 
 
+def _rss_entry(it: ET.Element, source: str) -> Entry:
+    title = find_first_text(it, ["title", "{*}title"]) or "(no title)"
+    link = extract_link_rss(it)
+    uid = find_first_text(it, ["guid", "{*}guid", "{*}id"]) or link or title
+    pub = find_first_text(it, ["pubDate", "{*}pubDate", "{*}published", "{*}updated"])
+    return Entry(source=source, title=title, link=link, uid=uid, published=pub or None)
+
+
+def _atom_entry(en: ET.Element, source: str) -> Entry:
+    title = find_first_text(en, ["{*}title"]) or "(no title)"
+    link = extract_link_atom(en)
+    uid = find_first_text(en, ["{*}id"]) or link or title
+    pub = find_first_text(en, ["{*}updated", "{*}published"])
+    return Entry(source=source, title=title, link=link, uid=uid, published=pub or None)
+
+
+def iter_feed_entries(data: bytes, source: str) -> Tuple[List[Entry], List[Entry], List[Entry]]:
+    """
+    Stream the feed with iterparse: each <item>/<entry> becomes an Entry as soon
+    as it is complete and is then cleared, so large archives never sit in memory
+    as a whole tree. Returns (un-namespaced items, namespaced items, atom entries).
+    Raises on malformed XML (the caller falls back to regex parsing).
+    """
+    plain_items: List[Entry] = []
+    ns_items: List[Entry] = []
+    entries: List[Entry] = []
+    for _event, el in ET.iterparse(io.BytesIO(data), events=("end",)):
+        tag = el.tag
+        if tag == "item":
+            plain_items.append(_rss_entry(el, source))
+        elif tag.endswith("}item"):
+            ns_items.append(_rss_entry(el, source))
+        elif tag == "entry" or tag.endswith("}entry"):
+            entries.append(_atom_entry(el, source))
+        else:
+            continue
+        el.clear()
+    return plain_items, ns_items, entries
+
+
+# Control bytes XML 1.0 rejects (everything below 0x20 except tab/LF/CR). In
+# UTF-8 these never occur inside a multi-byte sequence, so they can be dropped
+# from the raw bytes before decoding.
+_CTRL_BYTES = bytes(i for i in range(32) if i not in (9, 10, 13))
+# Every '&': numeric entity (group 1), named entity (group 2) or neither (stray).
+_AMP_RE = re.compile(r"&(?:(#\d+;|#x[0-9A-Fa-f]+;)|([A-Za-z][A-Za-z0-9]+);)?")
+_XML_ENTITIES = {"amp", "lt", "gt", "apos", "quot"}
+
+# Regex fallback for feeds ElementTree rejects.
+_FALLBACK_ITEM_RE = re.compile(r"(?is)<item\b[^>]*>(.*?)</item>")
+_FALLBACK_TITLE_RE = re.compile(r"(?is)<title\b[^>]*>(.*?)</title>")
+_FALLBACK_LINK_RE = re.compile(r"(?is)<link\b[^>]*>(.*?)</link>")
+_FALLBACK_GUID_RE = re.compile(r"(?is)<guid\b[^>]*>(.*?)</guid>")
+_FALLBACK_PUBDATE_RE = re.compile(r"(?is)<pubDate\b[^>]*>(.*?)</pubDate>")
+_CDATA_RE = re.compile(r"^<!\[CDATA\[(.*)\]\]>$", re.S)
+
+
+def _fix_amp(match: re.Match[str]) -> str:
+    if match.group(1):
+        return match.group(0)
+    name = match.group(2)
+    if name is None:
+        # Stray ampersand not part of an entity.
+        return "&amp;"
+    if name in _XML_ENTITIES:
+        return match.group(0)
+    # HTML named entities (e.g. &nbsp;) become numeric entities.
+    cp = name2codepoint.get(name)
+    return f"&#{cp};" if cp else f"&amp;{name};"
+
+
 def parse_feed(data: bytes, source: str) -> List[Entry]:
     # Some "official" feeds are not strict XML (e.g. unescaped '&' in titles).
-    # Stdlib-only best-effort: sanitize common invalid tokens before parsing.
-    text = data.decode("utf-8", errors="replace")
-    text = "".join(ch for ch in text if ch in {"\t", "\n", "\r"} or ord(ch) >= 32)
-
-    # Convert HTML named entities (e.g. &nbsp;) into numeric entities.
-    def fix_named_entity(match: re.Match[str]) -> str:
-        name = match.group(1)
-        if name in {"amp", "lt", "gt", "apos", "quot"}:
-            return f"&{name};"
-        cp = name2codepoint.get(name)
-        return f"&#{cp};" if cp else f"&amp;{name};"
-
-    text = re.sub(r"&([A-Za-z][A-Za-z0-9]+);", fix_named_entity, text)
-    # Escape stray ampersands not part of an entity.
-    text = re.sub(r"&(?!#\d+;|#x[0-9A-Fa-f]+;|[A-Za-z][A-Za-z0-9]+;)", "&amp;", text)
+    # Stdlib-only best-effort: sanitize common invalid tokens before parsing,
+    # in one pass over the text.
+    text = data.translate(None, _CTRL_BYTES).decode("utf-8", errors="replace")
+    text = _AMP_RE.sub(_fix_amp, text)
     try:
-        root = ET.fromstring(text.encode("utf-8", errors="ignore"))
+        plain_items, ns_items, entries = iter_feed_entries(text.encode("utf-8", errors="ignore"), source)
     except Exception:
         # Fallback: tolerate broken RSS by regex-parsing <item> blocks.
         out: List[Entry] = []
-        items = re.findall(r"(?is)<item\b[^>]*>(.*?)</item>", text)
+        items = _FALLBACK_ITEM_RE.findall(text)
         for raw in items[:200]:
-            t = re.search(r"(?is)<title\b[^>]*>(.*?)</title>", raw)
-            l = re.search(r"(?is)<link\b[^>]*>(.*?)</link>", raw)
-            g = re.search(r"(?is)<guid\b[^>]*>(.*?)</guid>", raw)
-            p = re.search(r"(?is)<pubDate\b[^>]*>(.*?)</pubDate>", raw)
+            t = _FALLBACK_TITLE_RE.search(raw)
+            l = _FALLBACK_LINK_RE.search(raw)
+            g = _FALLBACK_GUID_RE.search(raw)
+            p = _FALLBACK_PUBDATE_RE.search(raw)
             title = html_unescape((t.group(1) if t else "").strip())
             link = html_unescape((l.group(1) if l else "").strip())
             uid = html_unescape((g.group(1) if g else "").strip()) or link or title
             pub = html_unescape((p.group(1) if p else "").strip()) or None
             # Strip CDATA wrappers.
-            title = re.sub(r"^<!\[CDATA\[(.*)\]\]>$", r"\1", title, flags=re.S).strip() or "(no title)"
-            link = re.sub(r"^<!\[CDATA\[(.*)\]\]>$", r"\1", link, flags=re.S).strip()
+            title = _CDATA_RE.sub(r"\1", title).strip() or "(no title)"
+            link = _CDATA_RE.sub(r"\1", link).strip()
             if title:
                 out.append(Entry(source=source, title=title, link=link, uid=uid, published=pub))
         return out
 
-    # RSS: //item (namespace-agnostic)
-    items = root.findall(".//item")
-    if not items:
-        items = root.findall(".//{*}item")
-    out: List[Entry] = []
-    if items:
-        for it in items:
-            title = find_first_text(it, ["title", "{*}title"]) or "(no title)"
-            link = extract_link_rss(it)
-            uid = find_first_text(it, ["guid", "{*}guid", "{*}id"]) or link or title
-            pub = find_first_text(it, ["pubDate", "{*}pubDate", "{*}published", "{*}updated"])
-            out.append(Entry(source=source, title=title, link=link, uid=uid, published=pub or None))
-        return out
+    # RSS: //item (namespace-agnostic; un-namespaced items win), else Atom: //entry
+    return plain_items or ns_items or entries
 
-    # Atom: //entry (namespace-agnostic)
-    entries = root.findall(".//{*}entry")
-    for en in entries:
-        title = find_first_text(en, ["{*}title"]) or "(no title)"
-        link = extract_link_atom(en)
-        uid = find_first_text(en, ["{*}id"]) or link or title
-        pub = find_first_text(en, ["{*}updated", "{*}published"])
-        out.append(Entry(source=source, title=title, link=link, uid=uid, published=pub or None))
-    return out
+
+@dataclass(frozen=True)
+class MatchRules:
+    negatives: Tuple[str, ...]
+    locations: Tuple[str, ...]
+    topics: Tuple[str, ...]
+    require_location: bool
+    require_topic: bool
 
 
-def match(title: str, cfg: Dict[str, Any]) -> bool:
+def match_rules(cfg: Dict[str, Any]) -> MatchRules:
+    # Lowercased, non-empty keywords; built once per pass, not once per entry.
     logic = cfg.get("match_logic") or {}
-    title_l = title.lower()
 
-    negatives = [str(x).lower() for x in (logic.get("negative_keywords") or [])]
-    if any(n and n in title_l for n in negatives):
-        return False
+    def keywords(key: str) -> Tuple[str, ...]:
+        return tuple(k for k in (str(x).lower() for x in (logic.get(key) or [])) if k)
+
+    return MatchRules(
+        negatives=keywords("negative_keywords"),
+        locations=keywords("locations"),
+        topics=keywords("topics"),
+        require_location=bool(logic.get("require_one_location", True)),
+        require_topic=bool(logic.get("require_one_topic", True)),
+    )
 
-    locations = [str(x).lower() for x in (logic.get("locations") or [])]
-    topics = [str(x).lower() for x in (logic.get("topics") or [])]
-    hit_loc = any(k and k in title_l for k in locations)
-    hit_topic = any(k and k in title_l for k in topics)
 
-    if bool(logic.get("require_one_location", True)) and not hit_loc:
+def match(title: str, cfg: Dict[str, Any], rules: Optional[MatchRules] = None) -> bool:
+    r = rules or match_rules(cfg)
+    title_l = title.lower()
+
+    if any(n in title_l for n in r.negatives):
+        return False
+    if r.require_location and not any(k in title_l for k in r.locations):
         return False
-    if bool(logic.get("require_one_topic", True)) and not hit_topic:
+    if r.require_topic and not any(k in title_l for k in r.topics):
         return False
     return True
 
@@ -323,12 +481,25 @@ def update_status(**kwargs: Any) -> None:
     write_json_atomic(STATUS_PATH, base)
 
 
-def prime_seen(entries: List[Entry], seen: set) -> None:
+def check_interval(cfg: Dict[str, Any]) -> int:
+    interval = int(cfg.get("check_interval_seconds") or 300)
+    return max(30, min(interval, 3600))
+
+
+def next_slot(now: float, base: int, n: int, cap: int) -> float:
+    return now + min(base * 2 ** min(n, 16), cap)
+
+
+def prime_seen(entries: List[Entry], seen: set) -> List[str]:
     # On first run, mark current items as seen to avoid notification spam.
+    # Returns the new keys; the caller persists them with append_seen().
+    new_keys: List[str] = []
     for e in entries[:50]:
-        if e.uid not in seen:
-            append_seen(e.uid)
-            seen.add(e.uid)
+        key = seen_key(e.uid)
+        if key not in seen:
+            new_keys.append(key)
+            seen.add(key)
+    return new_keys
 
 
 def as_public_item(e: Entry) -> Dict[str, Any]:
@@ -348,51 +519,117 @@ def run_once(cfg: Dict[str, Any], seen: set) -> Tuple[int, int]:
     notif_title = str(notif.get("title") or "⚡ POWER UPDATE")
     sound = str(notif.get("sound") or "") or None
     show_link = bool(notif.get("show_link_in_body", True))
+    rules = match_rules(cfg)
 
     hits = 0
     checked = 0
     last_error = None
     latest_items: Dict[str, List[Dict[str, Any]]] = {}
 
+    # Per-URL validators + body hash from the previous ticks: unchanged feeds
+    # (304 or identical bytes) are not parsed again and keep their latest_items.
+    prev = safe_read_json(STATUS_PATH)
+    prev_cache = prev.get("http_cache") if isinstance(prev.get("http_cache"), dict) else {}
+    prev_items = prev.get("latest_items") if isinstance(prev.get("latest_items"), dict) else {}
+    http_cache: Dict[str, Dict[str, Any]] = {}
+    # Per-URL {next_fetch_at, errors, unchanged}: sources that keep failing or
+    # never change are polled geometrically less often.
+    prev_schedule = prev.get("schedule") if isinstance(prev.get("schedule"), dict) else {}
+    schedule: Dict[str, Dict[str, Any]] = {}
+    base = check_interval(cfg)
+    cap = max(base, int(cfg.get("max_backoff_seconds") or BACKOFF_MAX_S))
+    now = time.time()
+    # Keys added to `seen` during this pass, appended to seen_news.v2.txt at the end.
+    new_keys: List[str] = []
+    # Newest hit of this pass; written with the final status update.
+    last_hit: Dict[str, Any] = {}
+
+    targets: List[Tuple[str, str]] = []
     for src in sources:
         name = str((src or {}).get("name") or "source")
         url = str((src or {}).get("url") or "")
         if not url:
             continue
-        checked += 1
-        try:
-            data = fetch(url, timeout_s=timeout_s, max_bytes=max_bytes)
-            if looks_like_html(data):
-                entries = parse_html_links(data, source=name, base_url=url)
-            else:
-                entries = parse_feed(data, source=name)
-            latest_items[name] = [as_public_item(e) for e in entries[:10]]
-            # Prime once if empty.
-            if (not seen) and bool(cfg.get("prime_on_first_run", True)):
-                prime_seen(entries, seen)
-                log(f"[prime] {name}: primed {min(len(entries), 50)} items as seen")
-                continue
-            for e in entries[:80]:
-                if e.uid in seen:
+        slot = prev_schedule.get(url) if isinstance(prev_schedule.get(url), dict) else {}
+        if now < float(slot.get("next_fetch_at") or 0):
+            # Not due yet: carry its state (and its last failure) over untouched.
+            schedule[url] = slot
+            if slot.get("last_error"):
+                last_error = f"{name}: {slot['last_error']}"
+            if isinstance(prev_cache.get(url), dict):
+                http_cache[url] = prev_cache[url]
+            if name in prev_items:
+                latest_items[name] = prev_items[name]
+            continue
+        targets.append((name, url))
+
+    # Downloads run concurrently (network-bound); parsing, matching and the
+    # seen-set stay on this thread, in config order, so no locking is needed.
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(targets)))) as pool:
+        pending = []
+        for name, url in targets:
+            cached = prev_cache.get(url) if isinstance(prev_cache.get(url), dict) else {}
+            fut = pool.submit(fetch, url, timeout_s, max_bytes, cached.get("etag"), cached.get("last_modified"))
+            pending.append((name, url, cached, fut))
+        for name, url, cached, fut in pending:
+            checked += 1
+            slot = prev_schedule.get(url) if isinstance(prev_schedule.get(url), dict) else {}
+            try:
+                data, etag, last_modified = fut.result()
+                digest = hashlib.sha1(data).hexdigest() if data is not None else cached.get("body_sha1")
+                if cached and digest == cached.get("body_sha1"):
+                    # Same feed as last time: every entry was already handled.
+                    http_cache[url] = {**cached, "etag": etag, "last_modified": last_modified}
+                    if name in prev_items:
+                        latest_items[name] = prev_items[name]
+                    unchanged = int(slot.get("unchanged") or 0) + 1
+                    schedule[url] = {"next_fetch_at": next_slot(now, base, unchanged, cap), "errors": 0, "unchanged": unchanged}
                     continue
-                if match(e.title, cfg):
-                    hits += 1
-                    body = e.title
-                    if show_link and e.link:
-                        body = f"{e.title}\n{e.link}"
-                    log(f"HIT ({name}): {e.title}")
-                    notify(notif_title, body, sound)
-                    update_status(
-                        last_hit_at=now_iso(),
-                        last_hit_title=e.title,
-                        last_hit_link=e.link,
-                        last_hit_source=name,
-                    )
-                append_seen(e.uid)
-                seen.add(e.uid)
-        except Exception as exc:
-            last_error = f"{name}: {exc}"
-            log(f"warn: {last_error}")
+                if data is None:
+                    raise ValueError("not_modified_without_cached_body")
+                if looks_like_html(data):
+                    entries = parse_html_links(data, source=name, base_url=url)
+                else:
+                    entries = parse_feed(data, source=name)
+                latest_items[name] = [as_public_item(e) for e in entries[:10]]
+                # Prime once if empty.
+                if (not seen) and bool(cfg.get("prime_on_first_run", True)):
+                    new_keys += prime_seen(entries, seen)
+                    log(f"[prime] {name}: primed {min(len(entries), 50)} items as seen")
+                    continue
+                for e in entries[:80]:
+                    key = seen_key(e.uid)
+                    if key in seen:
+                        continue
+                    if match(e.title, cfg, rules):
+                        hits += 1
+                        body = e.title
+                        if show_link and e.link:
+                            body = f"{e.title}\n{e.link}"
+                        log(f"HIT ({name}): {e.title}")
+                        notify(notif_title, body, sound)
+                        last_hit = {
+                            "last_hit_at": now_iso(),
+                            "last_hit_title": e.title,
+                            "last_hit_link": e.link,
+                            "last_hit_source": name,
+                        }
+                    new_keys.append(key)
+                    seen.add(key)
+                # Only a fully processed body may be skipped on later ticks.
+                http_cache[url] = {"etag": etag, "last_modified": last_modified, "body_sha1": digest}
+                schedule[url] = {"next_fetch_at": now + base, "errors": 0, "unchanged": 0}
+            except Exception as exc:
+                last_error = f"{name}: {exc}"
+                log(f"warn: {last_error}")
+                errors = int(slot.get("errors") or 0) + 1
+                schedule[url] = {
+                    "next_fetch_at": next_slot(now, base, errors, cap),
+                    "errors": errors,
+                    "unchanged": 0,
+                    "last_error": str(exc),
+                }
+    append_seen(new_keys)
 
     update_status(
         ok=True,
@@ -401,6 +638,9 @@ def run_once(cfg: Dict[str, Any], seen: set) -> Tuple[int, int]:
         hits=hits,
         last_error=last_error,
         latest_items=latest_items,
+        http_cache=http_cache,
+        schedule=schedule,
+        **last_hit,
     )
     return checked, hits
 
@@ -409,6 +649,11 @@ def main() -> None:
     log("service starting")
     update_status(ok=True, started_at=now_iso(), pid=os.getpid())
 
+    # Only this process appends to seen_news.v2.txt: keep the set across ticks and
+    # re-read it only if the file changed behind our back (edited, deleted).
+    seen: Optional[set] = None
+    seen_stamp = file_stamp(SEEN_PATH)
+
     while True:
         cfg = load_config()
         if not bool(cfg.get("enabled", True)):
@@ -416,15 +661,16 @@ def main() -> None:
             time.sleep(60)
             continue
 
-        interval = int(cfg.get("check_interval_seconds") or 300)
-        interval = max(30, min(interval, 3600))
+        interval = check_interval(cfg)
 
-        seen = load_seen()
+        if seen is None or file_stamp(SEEN_PATH) != seen_stamp:
+            seen = load_seen()
         try:
             run_once(cfg, seen)
         except Exception as exc:
             log(f"error: run_once_failed: {exc}")
             update_status(ok=False, updated_at=now_iso(), last_error=str(exc))
+        seen_stamp = file_stamp(SEEN_PATH)  # includes our own appends
 
         time.sleep(interval)
 
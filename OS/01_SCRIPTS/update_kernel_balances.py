@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import argparse
 import json
-from datetime import datetime, timezone
+from datetime import datetime
 from pathlib import Path
 
 
@@ -41,7 +41,7 @@ def main() -> None:
     if args.timestamp:
         balances["_last_updated"] = args.timestamp
     else:
-        balances["_last_updated"] = datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds")
+        balances["_last_updated"] = datetime.now().astimezone().isoformat(timespec="seconds")
 
     telekom = args.telekom
     if telekom is None:
@@ -13,11 +13,14 @@ It checks for:
 from __future__ import annotations
 
 import argparse
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 
 FORBIDDEN_DIRS = {
@@ -44,13 +47,16 @@ FORBIDDEN_FILENAMES = {
     "paypal_transactions.json",
     "paypal_transactions.csv",
     "metrics_history.json",
+    "metrics_history.jsonl",
     "service_registry.json",
 }
 
-SUSPICIOUS_PATTERNS: List[Tuple[str, re.Pattern[str]]] = [
-    ("home_path", re.compile(r"/Users/[A-Za-z0-9._-]+/", re.IGNORECASE)),
-    ("email", re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)),
-    ("iban", re.compile(r"\b[A-Z]{2}\d{2}[A-Z0-9]{10,30}\b")),
+# Built-in patterns are bytes (ASCII classes only): they run on the mapped file
+# without decoding it. Extra patterns stay str and see the decoded text.
+SUSPICIOUS_PATTERNS: List[Tuple[str, re.Pattern[Any]]] = [
+    ("home_path", re.compile(rb"/Users/[A-Za-z0-9._-]+/", re.IGNORECASE)),
+    ("email", re.compile(rb"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)),
+    ("iban", re.compile(rb"\b[A-Z]{2}\d{2}[A-Z0-9]{10,30}\b")),
 ]
 
 
@@ -69,13 +75,34 @@ TEXT_EXTS = {
 }
 
 
-def iter_files(root: Path) -> Iterable[Path]:
-    for p in root.rglob("*"):
-        # skip git internals if someone already initialized a repo
-        if ".git" in p.parts:
+# Never descended into: git internals (if someone already initialized a repo).
+# Everything else is scanned, caches included: .gitignore is no publishing guarantee.
+SKIP_DIRS = {".git"}
+
+
+def iter_files(root: Path, skip_top: Iterable[str] = ()) -> Iterable[Path]:
+    """
+    Walk root with os.scandir, pruning SKIP_DIRS at any depth and skip_top
+    directly under root. Symlinked directories are not followed (like rglob).
+    """
+    top = set(skip_top)
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                entries = list(it)
+        except OSError:
             continue
-        if p.is_file():
-            yield p
+        for e in entries:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    if e.name not in SKIP_DIRS and not (d is root and e.name in top):
+                        stack.append(Path(e.path))
+                elif e.is_file():
+                    yield Path(e.path)
+            except OSError:
+                continue
 
 
 def rel_to(root: Path, p: Path) -> str:
@@ -109,21 +136,130 @@ def is_text_file(path: Path) -> bool:
     return path.suffix.lower() in TEXT_EXTS
 
 
-def scan_text(path: Path, max_bytes: int) -> str:
-    raw = path.read_bytes()
-    if len(raw) > max_bytes:
-        raw = raw[:max_bytes]
+def scan_file(
+    path: Path,
+    max_bytes: int,
+    patterns: List[Tuple[str, re.Pattern[Any]]],
+    combined: Optional[re.Pattern[bytes]],
+    folded: List[int],
+) -> List[str]:
+    """
+    Labels matching within the first max_bytes of path; the file is mmap'd, not copied.
+    Content with NUL bytes is scanned too: a secret behind a text extension still leaks.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return find_labels(mm, min(len(mm), max_bytes), patterns, combined, folded)
+
+def combine_patterns(
+    patterns: List[Tuple[str, re.Pattern[Any]]],
+) -> Tuple[Optional[re.Pattern[bytes]], List[int]]:
+    """
+    Fold the bytes patterns into one alternation so each file is scanned once.
+    Returns (combined, indices of the folded patterns); group p<k> is patterns[k].
+    Patterns with their own groups stay out (embedding would renumber backrefs).
+    """
+    parts: List[bytes] = []
+    folded: List[int] = []
+    for i, (_label, pat) in enumerate(patterns):
+        if pat.groups or not isinstance(pat.pattern, bytes):
+            continue
+        flag = b"i" if pat.flags & re.IGNORECASE else b"-i"
+        parts.append(b"(?P<p%d>(?%s:%s))" % (i, flag, pat.pattern))
+        folded.append(i)
+    if not parts:
+        return None, []
     try:
-        return raw.decode("utf-8", errors="replace")
-    except Exception:
-        return ""
-
-def load_extra_patterns(path: Path) -> List[Tuple[str, re.Pattern[str]]]:
+        return re.compile(b"|".join(parts)), folded
+    except re.error:
+        return None, []
+
+
+def find_labels(
+    data: Union[bytes, mmap.mmap],
+    end: int,
+    patterns: List[Tuple[str, re.Pattern[Any]]],
+    combined: Optional[re.Pattern[bytes]],
+    folded: List[int],
+) -> List[str]:
+    """Labels of all patterns that match data[:end], in pattern order."""
+    hit = set()
+    if combined is not None:
+        for m in combined.finditer(data, 0, end):
+            hit.add(int(m.lastgroup[1:]))  # type: ignore[index]
+            if len(hit) == len(folded):
+                break
+    # A match of one pattern can hide an overlapping match of another; with no
+    # match at all nothing was hidden, so clean files need no second pass.
+    recheck = bool(hit) and len(hit) < len(folded)
+    skip = set(folded) if not recheck else hit
+    text: Optional[str] = None
+    out: List[str] = []
+    for i, (label, pat) in enumerate(patterns):
+        if i in skip:  # decided by the combined pass (skip always contains hit)
+            if i in hit:
+                out.append(label)
+            continue
+        if isinstance(pat.pattern, bytes):
+            found = pat.search(data, 0, end)
+        else:
+            if text is None:
+                text = bytes(data[:end]).decode("utf-8", errors="replace")
+            found = pat.search(text)
+        if found:
+            out.append(label)
+    return out
+
+
+# Process pool only pays off past its start-up cost (a fresh interpreter per
+# worker under macOS' spawn); smaller trees are scanned in-process.
+PARALLEL_MIN_FILES = 256
+SCAN_BATCH = 64
+
+_worker: Dict[str, Any] = {}
+
+
+def _init_scan_worker(max_bytes: int, patterns: List[Tuple[str, re.Pattern[Any]]]) -> None:
+    # Compiled patterns pickle as (pattern, flags); the alternation is rebuilt once per worker.
+    combined, folded = combine_patterns(patterns)
+    _worker.update(max_bytes=max_bytes, patterns=patterns, combined=combined, folded=folded)
+
+
+def _scan_batch(batch: List[str]) -> List[List[str]]:
+    w = _worker
+    return [scan_file(Path(p), w["max_bytes"], w["patterns"], w["combined"], w["folded"]) for p in batch]
+
+
+def scan_files(
+    paths: List[Path],
+    max_bytes: int,
+    patterns: List[Tuple[str, re.Pattern[Any]]],
+    jobs: int,
+) -> List[List[str]]:
+    """Labels per path (same order as paths); large trees are spread over jobs processes."""
+    if jobs > 1 and len(paths) >= PARALLEL_MIN_FILES:
+        batches = [[str(p) for p in paths[i : i + SCAN_BATCH]] for i in range(0, len(paths), SCAN_BATCH)]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(batches)),
+                initializer=_init_scan_worker,
+                initargs=(max_bytes, patterns),
+            ) as ex:
+                return [labels for res in ex.map(_scan_batch, batches) for labels in res]
+        except (OSError, BrokenProcessPool, NotImplementedError):
+            pass  # no usable process pool here (sandbox, no semaphores): scan in-process
+    combined, folded = combine_patterns(patterns)
+    return [scan_file(p, max_bytes, patterns, combined, folded) for p in paths]
+
+
+def load_extra_patterns(path: Path) -> List[Tuple[str, re.Pattern[Any]]]:
     """
     Load additional regex patterns (one per line). Lines starting with '#' are ignored.
     The label is derived from the raw regex text (shortened if needed).
     """
-    patterns: List[Tuple[str, re.Pattern[str]]] = []
+    patterns: List[Tuple[str, re.Pattern[Any]]] = []
     if not path.exists():
         return patterns
     try:
@@ -146,6 +282,17 @@ def main() -> int:
     parser.add_argument("root", nargs="?", default=".", help="Folder to verify (default: current dir)")
     parser.add_argument("--max-bytes", type=int, default=2_000_000, help="Max bytes to scan per file")
     parser.add_argument("--extra-patterns", default="", help="Optional file with extra regex patterns (one per line)")
+    parser.add_argument(
+        "--scan-forbidden-dirs",
+        action="store_true",
+        help="Also scan inside the forbidden top-level dirs (they fail the check either way)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help=f"Scan processes (default: CPU count; used from {PARALLEL_MIN_FILES} text files on)",
+    )
     args = parser.parse_args()
 
     root = Path(args.root).expanduser().resolve()
@@ -170,29 +317,39 @@ def main() -> int:
     forbidden_files: List[str] = []
     forbidden_exts: List[str] = []
 
-    extra_patterns: List[Tuple[str, re.Pattern[str]]] = []
+    extra_patterns: List[Tuple[str, re.Pattern[Any]]] = []
     if args.extra_patterns:
         extra_patterns = load_extra_patterns(Path(args.extra_patterns).expanduser())
 
-    for p in iter_files(root):
+    patterns = SUSPICIOUS_PATTERNS + extra_patterns
+
+    # Forbidden top-level dirs are already reported above; their contents are
+    # only listed file by file on request. iter_files yields each path once, so
+    # the lists below are duplicate-free as built.
+    skip_top = () if args.scan_forbidden_dirs else forbidden_dirs
+    text_files: List[Path] = []
+    for p in iter_files(root, skip_top=skip_top):
         rp = rel_to(root, p)
         if p.name in FORBIDDEN_FILENAMES:
             forbidden_files.append(rp)
         if p.suffix.lower() in FORBIDDEN_EXTS:
             forbidden_exts.append(rp)
-
         if is_text_file(p):
-            text = scan_text(p, args.max_bytes)
-            for label, pat in SUSPICIOUS_PATTERNS + extra_patterns:
-                if pat.search(text):
-                    suspicious_hits.append(f"{rp}: {label}")
+            text_files.append(p)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    for p, labels in zip(text_files, scan_files(text_files, args.max_bytes, patterns, jobs)):
+        rp = rel_to(root, p)
+        # Extra patterns sharing a 40-char prefix share a label; report it once.
+        for label in dict.fromkeys(labels):
+            suspicious_hits.append(f"{rp}: {label}")
 
     if forbidden_files:
-        issues.append("forbidden filenames present:\n" + "\n".join(f"- {p}" for p in sorted(set(forbidden_files))))
+        issues.append("forbidden filenames present:\n" + "\n".join(f"- {p}" for p in sorted(forbidden_files)))
     if forbidden_exts:
-        issues.append("forbidden binary/model/zim files present:\n" + "\n".join(f"- {p}" for p in sorted(set(forbidden_exts))))
+        issues.append("forbidden binary/model/zim files present:\n" + "\n".join(f"- {p}" for p in sorted(forbidden_exts)))
     if suspicious_hits:
-        issues.append("suspicious strings detected (review manually):\n" + "\n".join(f"- {h}" for h in sorted(set(suspicious_hits))))
+        issues.append("suspicious strings detected (review manually):\n" + "\n".join(f"- {h}" for h in sorted(suspicious_hits)))
 
     if issues:
         print("❌ PUBLIC EXPORT CHECK: FAIL")
@@ -940,7 +940,7 @@ if (els.makeUsable && els.makeUsableStatus && els.makeUsableOutput) {
     setStatus("sanity ping");
     log("Bonus: End-to-end AI ping (ECO)...");
     try {
-      const r = await postJson("/api/ai_query", { prompt: "Reply exactly with: OK", tier: "ECO" });
+      const r = await postJson("/api/ai_query", { prompt: "Reply exactly with: OK", tier: "ECO", no_cache: true });
       if (r && r.ok && String(r.text || "").toUpperCase().includes("OK")) {
         log(`  - AI ping: OK · engine=${r.engine || "--"}:${r.model || "--"}`);
       } else {